@@ -0,0 +1,239 @@
+"""
+Hedged order submission: cut tail latency without sending a second order
+while the first could still be accepted.
+
+Binance only rejects a repeated newClientOrderId (-4116) while the first
+order is still open, so blindly re-sending a slow POST could place a MARKET
+or IOC order twice. Instead the first attempt is signed with a short
+recvWindow equal to the hedge delay (p95 of recent POST /v1/order network
+times). A second attempt, with the same clientOrderId over another pooled
+connection, is only sent when
+- the first was rejected for that window (-1021: never placed), or
+- no response at all has arrived once the server clock has certainly
+  passed timestamp + recvWindow, and a lookup by clientOrderId finds
+  nothing (-2013).
+Any other answer from the first attempt is final. That includes -1007
+("execution status unknown") and transport errors: the order may still
+be accepted, so they are returned or raised, never re-sent.
+
+This relies on the gateway enforcing recvWindow before an order reaches
+the matching engine. A first attempt that passed the gateway in time but
+was still invisible to the lookup after the deadline would be placed
+alongside the second. If the first attempt answers after a hedge with
+anything but a rejection, an `order_hedge_late` error is logged so such a
+case is never silent.
+
+The server clock bound uses the client's `ServerClock` (rtt/2 of error)
+when time sync is enabled; without it the bound is 1s, the skew Binance
+itself tolerates for requests ahead of its clock, so hedges fire later.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Any, Dict, Optional, Tuple
+
+from src.common.metrics import stopwatch
+
+MAX_RECV_WINDOW_MS = 60000
+_POLL_SEC = 0.01  # while the first attempt is still queued behind the rate governor
+_UNSIGNED_KEYS = frozenset({"timestamp", "recvWindow", "signature", "newClientOrderId"})
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+_background: set = set()
+
+
+def _executor() -> ThreadPoolExecutor:
+    # Each worker thread gets its own Session, hence its own pooled connection
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="hedge")
+    return _pool
+
+
+def hedge_client_order_id(params: Dict[str, Any], key: Optional[str] = None) -> str:
+    """
+    newClientOrderId shared by every attempt of one logical order: a hash of
+    the order params and `key` (random unless given; pass a stable key, e.g.
+    an input line number, to make re-runs map to the same id).
+    """
+    canonical = "&".join(f"{k}={params[k]}" for k in sorted(params) if k not in _UNSIGNED_KEYS)
+    digest = hashlib.blake2b(f"{canonical}|{key or uuid.uuid4().hex}".encode(), digest_size=16).hexdigest()
+    return f"h-{digest}"
+
+
+def hedge_delay(client, quantile: float = 0.95, min_samples: int = 20, default: float = 1.0, floor: float = 0.05, cap: float = 5.0) -> float:
+    """Seconds to give the first attempt: `quantile` of recent order network times, within [floor, cap]."""
+    registry = getattr(client, "metrics", None)
+    if registry is None:
+        return default
+    h = registry.histogram("request_stage_seconds", (("endpoint", "POST /v1/order"), ("stage", "network")))
+    if h.count < min_samples:
+        return default
+    return min(max(h.quantiles((quantile,))[quantile], floor), cap)
+
+
+def _prepare(client, params: Dict[str, Any], hedge_after: Optional[float], key: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any], float]:
+    params = dict(params)
+    params.setdefault("newClientOrderId", hedge_client_order_id(params, key))
+    delay = hedge_after if hedge_after is not None else hedge_delay(client)
+    first = dict(params, recvWindow=min(max(int(delay * 1000), 1), MAX_RECV_WINDOW_MS))
+    return params, first, delay
+
+
+def _deadline(client, sent: Dict[str, Any]) -> Optional[float]:
+    """Local epoch seconds after which the exchange can no longer accept `sent`; None until it is signed."""
+    ts = sent.get("timestamp")
+    if ts is None:
+        return None
+    clock = getattr(client, "clock", None)
+    if clock is not None and clock.rtt_ms is not None:
+        offset, margin = clock.offset_ms, clock.rtt_ms / 2 + 10
+    else:
+        offset, margin = 0.0, 1000.0
+    return (ts - offset + sent["recvWindow"] + margin) / 1000.0
+
+
+def _accepted(res: Any) -> bool:
+    return isinstance(res, dict) and "orderId" in res
+
+
+def _code(res: Any) -> Any:
+    return res.get("code") if isinstance(res, dict) else None
+
+
+def _log(client, params: Dict[str, Any], outcome: str, delay: float) -> None:
+    client.logger.info(
+        "order hedged",
+        extra={"event": "order_hedge", "data": {"symbol": params["symbol"], "clientOrderId": params["newClientOrderId"], "outcome": outcome, "hedge_after_ms": round(delay * 1e3, 1)}},
+    )
+
+
+def _late(client, params: Dict[str, Any], res: Any) -> None:
+    # The first attempt answered after the second was sent: anything but a rejection may be a second order
+    code = _code(res)
+    if code is not None and code != -1007:  # -1007: execution status unknown
+        return
+    client.logger.error(
+        "hedged first attempt answered late",
+        extra={"event": "order_hedge_late", "data": {"symbol": params["symbol"], "clientOrderId": params["newClientOrderId"], "response": res if isinstance(res, dict) else str(res)}},
+    )
+
+
+def place_order_hedged(client, params: Dict[str, Any], hedge_after: Optional[float] = None, key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    `client.place_order(params)` with a hedged second attempt (see module
+    docstring). `hedge_after` overrides the p95-based delay in seconds.
+    """
+    sw = stopwatch("hedged", getattr(client, "metrics", None))
+    params, first, delay = _prepare(client, params, hedge_after, key)
+    pool = _executor()
+    f1 = pool.submit(client.place_order, first)
+
+    # The first attempt alone, until it answers or its window has closed
+    while not f1.done():
+        deadline = _deadline(client, first)
+        remaining = _POLL_SEC if deadline is None else deadline - time.time()
+        if remaining <= 0:
+            break
+        wait([f1], timeout=remaining)
+
+    if f1.done():
+        # Raises transport errors: whether the order got in is unknown, so it is never re-sent
+        res = f1.result()
+        if _code(res) != -1021:
+            sw.lap("direct")
+            return res
+        outcome = "resend"  # rejected for the short window, so never placed
+    else:
+        status = client.query_order(params["symbol"], orig_client_order_id=params["newClientOrderId"])
+        if _accepted(status):
+            _log(client, params, "found", delay)
+            sw.lap("found")
+            return status
+        if _code(status) != -2013:
+            # Cannot tell whether the first attempt got in: wait for it rather than risk a duplicate
+            return f1.result()
+        outcome = "hedge"
+        f1.add_done_callback(lambda f: _late(client, params, f.exception() or f.result()))
+
+    _log(client, params, outcome, delay)
+    f2 = pool.submit(client.place_order, dict(params))
+    for f in as_completed([f1, f2]):
+        if f is f1 and (f1.exception() is not None or not _accepted(f1.result())):
+            continue
+        break
+    if f is f1:
+        sw.lap(outcome)
+        return f1.result()
+    res = f2.result()
+    if _code(res) == -4116:
+        status = client.query_order(params["symbol"], orig_client_order_id=params["newClientOrderId"])
+        res = status if _accepted(status) else res
+    sw.lap(outcome)
+    return res
+
+
+def _keep(task: "asyncio.Future") -> None:
+    # A losing attempt finishes in the background; hold a reference and retrieve its exception
+    _background.add(task)
+    task.add_done_callback(lambda t: (_background.discard(t), t.cancelled() or t.exception()))
+
+
+async def place_order_hedged_async(client, params: Dict[str, Any], hedge_after: Optional[float] = None, key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    `place_order_hedged` for an `AsyncBinanceFuturesClient`; attempts run as
+    concurrent tasks. aiohttp queues requests once `pool_size` connections
+    are busy, and a stalled attempt holds its connection until it answers,
+    so size the pool above the orders in flight or hedges wait in the queue.
+    """
+    sw = stopwatch("hedged", getattr(client, "metrics", None))
+    params, first, delay = _prepare(client, params, hedge_after, key)
+    t1 = asyncio.ensure_future(client.place_order(first))
+    _keep(t1)
+
+    while not t1.done():
+        deadline = _deadline(client, first)
+        remaining = _POLL_SEC if deadline is None else deadline - time.time()
+        if remaining <= 0:
+            break
+        await asyncio.wait({t1}, timeout=remaining)
+
+    if t1.done():
+        res = t1.result()
+        if _code(res) != -1021:
+            sw.lap("direct")
+            return res
+        outcome = "resend"
+    else:
+        status = await client.query_order(params["symbol"], orig_client_order_id=params["newClientOrderId"])
+        if _accepted(status):
+            _log(client, params, "found", delay)
+            sw.lap("found")
+            return status
+        if _code(status) != -2013:
+            return await t1
+        outcome = "hedge"
+        t1.add_done_callback(lambda t: t.cancelled() or _late(client, params, t.exception() or t.result()))
+
+    _log(client, params, outcome, delay)
+    t2 = asyncio.ensure_future(client.place_order(dict(params)))
+    _keep(t2)
+    pending = {t1, t2}
+    while t2 in pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        if t1 in done and t1.exception() is None and _accepted(t1.result()):
+            sw.lap(outcome)
+            return t1.result()
+    res = t2.result()
+    if _code(res) == -4116:
+        status = await client.query_order(params["symbol"], orig_client_order_id=params["newClientOrderId"])
+        res = status if _accepted(status) else res
+    sw.lap(outcome)
+    return res
@@ -1,16 +1,25 @@
+import threading
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
-from src.common.validation import (
-    get_symbol_info,
-    validate_side,
-    validate_qty,
-    validate_price,
-)
+from src.common.metrics import stopwatch
+from src.common.validation import validate_side
 
 
-def place_oco_order(
-    client,
+_id_lock = threading.Lock()
+_last_id_ms = 0
+
+
+def _unique_ms() -> int:
+    """Millisecond stamp that never repeats in this process, so pairs placed together get distinct ids."""
+    global _last_id_ms
+    with _id_lock:
+        _last_id_ms = max(int(time.time() * 1000), _last_id_ms + 1)
+        return _last_id_ms
+
+
+def oco_order_params(
+    rules,
     symbol: str,
     side: str,
     quantity: float,
@@ -18,45 +27,21 @@ def place_oco_order(
     stop_price: float,
     stop_limit_price: float | None = None,
     time_in_force: str = "GTC",
-) -> Dict[str, Any]:
-    """
-    Simulate an OCO (One-Cancels-the-Other) on USDT-M Futures by placing
-    a LIMIT order and a STOP (stop-limit) order together.
-
-    Binance Futures does not provide a native OCO endpoint like Spot.
-    This function submits both orders and returns both API responses.
-    Managing cancellation of the remaining order after one fills would
-    normally require websocket/order updates, which are out of scope for
-    this CLI-only bot.
-
-    Args:
-        client: BinanceFuturesClient instance
-        symbol: Trading symbol, e.g. "BTCUSDT"
-        side: "BUY" or "SELL"
-        quantity: base asset quantity
-        price: limit order price
-        stop_price: trigger price for the stop-limit order
-        stop_limit_price: price for the stop-limit order (defaults to stop_price)
-        time_in_force: e.g., "GTC"
-
-    Returns:
-        Dict with both order responses: {"limit_order": ..., "stop_order": ...}
-    """
-    exi = client.exchange_info()
-    si = get_symbol_info(exi, symbol)
-    if not si:
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Validate and build (limit_params, stop_params) sharing one base newClientOrderId."""
+    if not rules:
         raise ValueError(f"symbol {symbol} not found in exchangeInfo")
 
     validate_side(side)
-    qty = validate_qty(si, quantity)
-    limit_px = validate_price(si, price)
-    trigger_px = validate_price(si, stop_price)
+    qty = rules.validate_qty(quantity)
+    limit_px = rules.validate_price(price)
+    trigger_px = rules.validate_price(stop_price)
 
     if stop_limit_price is None:
         stop_limit_price = stop_price
-    stop_limit_px = validate_price(si, stop_limit_price)
+    stop_limit_px = rules.validate_price(stop_limit_price)
 
-    base_client_id = f"oco-{symbol}-{int(time.time()*1000)}"
+    base_client_id = f"oco-{symbol}-{_unique_ms()}"
 
     limit_params = {
         "symbol": symbol,
@@ -79,7 +64,71 @@ def place_oco_order(
         "newClientOrderId": f"{base_client_id}-stop",
     }
 
-    limit_resp = client.place_order(limit_params)
-    stop_resp = client.place_order(stop_params)
+    return limit_params, stop_params
+
+
+def place_oco_order(
+    client,
+    symbol: str,
+    side: str,
+    quantity: float,
+    price: float,
+    stop_price: float,
+    stop_limit_price: float | None = None,
+    time_in_force: str = "GTC",
+) -> Dict[str, Any]:
+    """
+    Simulate an OCO (One-Cancels-the-Other) on USDT-M Futures by placing
+    a LIMIT order and a STOP (stop-limit) order together.
+
+    Binance Futures does not provide a native OCO endpoint like Spot.
+    This function submits both orders in one batchOrders request and
+    returns both API responses. It does not cancel the remaining order
+    after one fills; use `OcoManager` (src/advanced/oco_manager.py) with a
+    user data stream for that.
+
+    Args:
+        client: BinanceFuturesClient instance
+        symbol: Trading symbol, e.g. "BTCUSDT"
+        side: "BUY" or "SELL"
+        quantity: base asset quantity
+        price: limit order price
+        stop_price: trigger price for the stop-limit order
+        stop_limit_price: price for the stop-limit order (defaults to stop_price)
+        time_in_force: e.g., "GTC"
+
+    Returns:
+        Dict with both order responses: {"limit_order": ..., "stop_order": ...}
+    """
+    sw = stopwatch("oco", getattr(client, "metrics", None))
+    rules = client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    limit_params, stop_params = oco_order_params(rules, symbol, side, quantity, price, stop_price, stop_limit_price, time_in_force)
+    sw.lap("validation")
+    # Both legs go out in a single batchOrders round-trip
+    limit_resp, stop_resp = client.place_orders([limit_params, stop_params])
+    sw.lap("submit")
+
+    return {"limit_order": limit_resp, "stop_order": stop_resp}
+
+
+async def place_oco_order_async(
+    client,
+    symbol: str,
+    side: str,
+    quantity: float,
+    price: float,
+    stop_price: float,
+    stop_limit_price: float | None = None,
+    time_in_force: str = "GTC",
+) -> Dict[str, Any]:
+    """Place an OCO pair through an `AsyncBinanceFuturesClient`."""
+    sw = stopwatch("oco", getattr(client, "metrics", None))
+    rules = await client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    limit_params, stop_params = oco_order_params(rules, symbol, side, quantity, price, stop_price, stop_limit_price, time_in_force)
+    sw.lap("validation")
+    limit_resp, stop_resp = await client.place_orders([limit_params, stop_params])
+    sw.lap("submit")
 
-    return {"limit_order": limit_resp, "stop_order": stop_resp}
\ No newline at end of file
+    return {"limit_order": limit_resp, "stop_order": stop_resp}
@@ -0,0 +1,125 @@
+import asyncio
+from typing import Any, Dict, Optional, Set, Tuple
+
+from src.advanced.oco import oco_order_params
+from src.common.rate_limit import RateLimitExceeded
+
+
+# Leg states after which the sibling must go: a trade, or the leg leaving the book
+_RESOLVING_STATUSES = frozenset({"PARTIALLY_FILLED", "FILLED", "CANCELED", "EXPIRED", "REJECTED"})
+# Cancel answers worth another try: internal error/timeout, request rate, clock outside recvWindow
+_TRANSIENT_CODES = frozenset({-1001, -1003, -1007, -1021})
+_UNKNOWN_ORDER = -2011  # the sibling is already gone
+
+
+class OcoManager:
+    """
+    Keeps OCO pairs placed by `place_oco_order` honest.
+
+    Each leg's newClientOrderId maps to (symbol, sibling id) in one dict, so
+    an ORDER_TRADE_UPDATE from the user data stream resolves its pair in O(1)
+    and the surviving leg is cancelled straight away. A pair stays tracked
+    until that cancel is confirmed (or the sibling is already gone);
+    transient failures are retried `cancel_retries` times with exponential
+    backoff. Register `handle_event` on a `UserDataStream` (see `attach`).
+    """
+
+    def __init__(self, client, cancel_retries: int = 5) -> None:
+        self.client = client
+        self.cancel_retries = cancel_retries
+        self._legs: Dict[str, Tuple[str, str]] = {}
+        self._cancelling: Set[str] = set()  # siblings with a cancel in flight
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._legs) // 2
+
+    def attach(self, stream) -> None:
+        stream.add_handler(self.handle_event)
+
+    def track(self, symbol: str, limit_client_id: str, stop_client_id: str) -> None:
+        self._legs[limit_client_id] = (symbol, stop_client_id)
+        self._legs[stop_client_id] = (symbol, limit_client_id)
+
+    def untrack(self, client_order_id: str) -> Optional[Tuple[str, str]]:
+        """Forget the pair containing `client_order_id`; returns (symbol, sibling id) if it was tracked."""
+        leg = self._legs.pop(client_order_id, None)
+        if leg is not None:
+            self._legs.pop(leg[1], None)
+        return leg
+
+    async def place(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        stop_price: float,
+        stop_limit_price: Optional[float] = None,
+        time_in_force: str = "GTC",
+    ) -> Dict[str, Any]:
+        """Place an OCO pair and start watching it; same result shape as `place_oco_order`."""
+        limit_params, stop_params = oco_order_params(
+            await self.client.symbol_rules(symbol), symbol, side, quantity, price, stop_price, stop_limit_price, time_in_force
+        )
+        limit_id = limit_params["newClientOrderId"]
+        stop_id = stop_params["newClientOrderId"]
+        # Track first: a fill can arrive on the stream before the REST response
+        self.track(symbol, limit_id, stop_id)
+        limit_resp, stop_resp = await self.client.place_orders([limit_params, stop_params])
+        limit_ok = "orderId" in limit_resp
+        stop_ok = "orderId" in stop_resp
+        if not (limit_ok and stop_ok):
+            # Half an OCO is not an OCO: withdraw the leg that did land
+            self.untrack(limit_id)
+            if limit_ok or stop_ok:
+                await self.client.cancel_order({"symbol": symbol, "origClientOrderId": limit_id if limit_ok else stop_id})
+        return {"limit_order": limit_resp, "stop_order": stop_resp}
+
+    async def handle_event(self, event: Dict[str, Any]) -> None:
+        if event.get("e") != "ORDER_TRADE_UPDATE":
+            return
+        order = event.get("o") or {}
+        if order.get("X") not in _RESOLVING_STATUSES:
+            return
+        client_order_id = order.get("c", "")
+        leg = self._legs.get(client_order_id)
+        # Skip a pair already being resolved: a fill after a partial fill, or our own cancel echoing back
+        if leg is None or leg[1] in self._cancelling or client_order_id in self._cancelling:
+            return
+        symbol, sibling = leg
+        self._cancelling.add(sibling)
+        # Cancel off the stream task so the next event is not held up by the round-trip
+        task = asyncio.create_task(self._cancel(symbol, client_order_id, sibling))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _cancel(self, symbol: str, resolved_id: str, client_order_id: str) -> None:
+        error: Any = None
+        try:
+            for attempt in range(self.cancel_retries + 1):
+                delay = self.client.backoff_factor * (2 ** attempt)
+                try:
+                    res = await self.client.cancel_order({"symbol": symbol, "origClientOrderId": client_order_id})
+                except RateLimitExceeded as e:
+                    error, delay = str(e), self.client.rate_limiter.max_wait
+                except Exception as e:
+                    # Network errors: a cancel is safe to repeat
+                    error = f"{type(e).__name__}: {e}"
+                else:
+                    code = res.get("code") if isinstance(res, dict) else None
+                    if (isinstance(res, dict) and "orderId" in res) or code == _UNKNOWN_ORDER:
+                        self.untrack(resolved_id)
+                        return
+                    error = res
+                    if code not in _TRANSIENT_CODES:
+                        break
+                if attempt < self.cancel_retries:
+                    await asyncio.sleep(delay)
+            # Still tracked: the next event for this pair tries again
+            self.client.logger.error(
+                "oco sibling cancel failed",
+                extra={"event": "oco_cancel_failed", "error": str(error), "data": {"symbol": symbol, "clientOrderId": client_order_id, "resolvedBy": resolved_id}},
+            )
+        finally:
+            self._cancelling.discard(client_order_id)
@@ -1,10 +1,11 @@
 from typing import Any, Dict
 
-from src.common.validation import get_symbol_info, validate_side, validate_qty, validate_price, validate_notional
+from src.common.metrics import stopwatch
+from src.common.validation import validate_side
 
 
-def place_stop_limit_order(
-    client,
+def stop_limit_order_params(
+    rules,
     symbol: str,
     side: str,
     quantity: float,
@@ -12,22 +13,17 @@ def place_stop_limit_order(
     stop_price: float,
     time_in_force: str = "GTC",
 ) -> Dict[str, Any]:
-    """Place a STOP (stop-limit) order on USDT-M Futures.
-
-    Binance Futures uses type=STOP with price + stopPrice for stop-limit.
-    """
-    exi = client.exchange_info()
-    si = get_symbol_info(exi, symbol)
-    if not si:
+    """Validate and build the STOP order params (shared by the sync and async paths)."""
+    if not rules:
         raise ValueError(f"symbol {symbol} not found in exchangeInfo")
 
     validate_side(side)
-    qty = validate_qty(si, quantity)
-    limit_price = validate_price(si, price)
-    trigger_price = validate_price(si, stop_price)
-    validate_notional(si, limit_price, qty)
+    qty = rules.validate_qty(quantity)
+    limit_price = rules.validate_price(price)
+    trigger_price = rules.validate_price(stop_price)
+    rules.validate_notional(limit_price, qty)
 
-    params = {
+    return {
         "symbol": symbol,
         "side": side,
         "type": "STOP",
@@ -36,4 +32,46 @@ def place_stop_limit_order(
         "price": str(limit_price),
         "stopPrice": str(trigger_price),
     }
-    return client.place_order(params)
\ No newline at end of file
+
+
+def place_stop_limit_order(
+    client,
+    symbol: str,
+    side: str,
+    quantity: float,
+    price: float,
+    stop_price: float,
+    time_in_force: str = "GTC",
+) -> Dict[str, Any]:
+    """Place a STOP (stop-limit) order on USDT-M Futures.
+
+    Binance Futures uses type=STOP with price + stopPrice for stop-limit.
+    """
+    sw = stopwatch("stop_limit", getattr(client, "metrics", None))
+    rules = client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = stop_limit_order_params(rules, symbol, side, quantity, price, stop_price, time_in_force)
+    sw.lap("validation")
+    res = client.place_order(params)
+    sw.lap("submit")
+    return res
+
+
+async def place_stop_limit_order_async(
+    client,
+    symbol: str,
+    side: str,
+    quantity: float,
+    price: float,
+    stop_price: float,
+    time_in_force: str = "GTC",
+) -> Dict[str, Any]:
+    """Place a STOP (stop-limit) order through an `AsyncBinanceFuturesClient`."""
+    sw = stopwatch("stop_limit", getattr(client, "metrics", None))
+    rules = await client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = stop_limit_order_params(rules, symbol, side, quantity, price, stop_price, time_in_force)
+    sw.lap("validation")
+    res = await client.place_order(params)
+    sw.lap("submit")
+    return res
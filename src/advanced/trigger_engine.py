@@ -0,0 +1,276 @@
+import csv
+import heapq
+import itertools
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.common.metrics import stopwatch
+from src.limit_orders import limit_order_params
+from src.market_orders import market_order_params
+
+ABOVE = "above"  # fires once the mark price is >= the trigger price
+BELOW = "below"  # fires once the mark price is <= the trigger price
+
+# Rebuild a side's heap once it holds more cancelled entries than this and than live ones
+_COMPACT_MIN = 64
+
+
+class Trigger:
+    """One pending conditional order: send `params` once `symbol`'s mark price crosses `price`."""
+
+    __slots__ = ("trigger_id", "symbol", "condition", "price", "params", "on_fire", "state", "fired_price", "response")
+
+    def __init__(self, trigger_id: int, symbol: str, condition: str, price: Decimal, params: Dict[str, Any], on_fire: Optional[Callable[["Trigger"], None]] = None) -> None:
+        self.trigger_id = trigger_id
+        self.symbol = symbol
+        self.condition = condition
+        self.price = price
+        self.params = params
+        self.on_fire = on_fire
+        self.state = "pending"  # -> fired -> sent / failed, or cancelled
+        self.fired_price: Optional[Decimal] = None
+        self.response: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trigger_id": self.trigger_id,
+            "symbol": self.symbol,
+            "condition": self.condition,
+            "price": str(self.price),
+            "state": self.state,
+            "fired_price": None if self.fired_price is None else str(self.fired_price),
+            "params": self.params,
+            "response": self.response,
+        }
+
+
+class _SymbolBook:
+    """Both trigger sides of one symbol as heaps whose top is the next to fire."""
+
+    __slots__ = ("above", "below", "live", "dead")
+
+    def __init__(self) -> None:
+        # (price, seq, trigger): lowest trigger price first
+        self.above: List[Tuple[Decimal, int, Trigger]] = []
+        # (-price, seq, trigger): highest trigger price first
+        self.below: List[Tuple[Decimal, int, Trigger]] = []
+        self.live = 0
+        self.dead = 0  # cancelled entries still sitting in the heaps
+
+    def compact(self) -> None:
+        self.above = [e for e in self.above if e[2].state == "pending"]
+        self.below = [e for e in self.below if e[2].state == "pending"]
+        heapq.heapify(self.above)
+        heapq.heapify(self.below)
+        self.dead = 0
+
+
+class TriggerEngine:
+    """
+    Client-side conditional orders, evaluated against mark-price ticks.
+
+    Pending triggers live in two heaps per symbol, one per side, keyed by
+    trigger price, so a tick only looks at the heap tops: O(1) when nothing
+    fires and O(log n) per fired trigger. Cancelling only flags the trigger;
+    its heap entry is dropped when it reaches the top or when cancelled
+    entries outnumber live ones.
+
+    Fired orders are sent with `client.place_order` on a worker pool so the
+    price feed is never held up by a round-trip (`max_workers=0` sends on
+    the ticking thread; `client=None` fires without sending, for replays).
+    Feed it with `attach(MarketDataStream)`, `handle_event` or `on_price`.
+    """
+
+    def __init__(self, client=None, max_workers: int = 8) -> None:
+        self.client = client
+        self.logger = getattr(client, "logger", None) or logging.getLogger(__name__)
+        self._books: Dict[str, _SymbolBook] = {}
+        self._triggers: Dict[int, Trigger] = {}
+        self._last: Dict[str, Decimal] = {}
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="trigger") if client is not None and max_workers > 0 else None
+
+    def __len__(self) -> int:
+        return len(self._triggers)
+
+    def attach(self, stream) -> None:
+        stream.add_handler(self.handle_event)
+
+    def add(self, symbol: str, condition: str, price: Any, params: Dict[str, Any], on_fire: Optional[Callable[[Trigger], None]] = None) -> Trigger:
+        """
+        Send `params` once the mark price is at or `condition` ("above" /
+        "below") `price`. Like an exchange STOP, a trigger that would fire on
+        the last seen price is rejected with ValueError.
+        """
+        if condition not in (ABOVE, BELOW):
+            raise ValueError(f"condition must be {ABOVE!r} or {BELOW!r}")
+        symbol = symbol.upper()
+        price = Decimal(str(price))
+        with self._lock:
+            last = self._last.get(symbol)
+            if last is not None and (last >= price if condition == ABOVE else last <= price):
+                raise ValueError(f"trigger {condition} {price} would fire immediately (last price {last})")
+            trigger = Trigger(next(self._ids), symbol, condition, price, params, on_fire)
+            book = self._books.get(symbol)
+            if book is None:
+                book = self._books[symbol] = _SymbolBook()
+            if condition == ABOVE:
+                heapq.heappush(book.above, (price, next(self._seq), trigger))
+            else:
+                heapq.heappush(book.below, (-price, next(self._seq), trigger))
+            book.live += 1
+            self._triggers[trigger.trigger_id] = trigger
+        return trigger
+
+    def add_stop(
+        self,
+        rules,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+        price: Optional[float] = None,
+        time_in_force: str = "GTC",
+        on_fire: Optional[Callable[[Trigger], None]] = None,
+    ) -> Trigger:
+        """
+        Local stop order: a LIMIT at `price` (or a MARKET without one) sent
+        when the mark price reaches `stop_price`; BUY stops trigger on the way
+        up, SELL stops on the way down. Validated against `rules` up front.
+        """
+        symbol = symbol.upper()
+        if not rules:
+            raise ValueError(f"symbol {symbol} not found in exchangeInfo")
+        trigger_price = rules.validate_price(stop_price)
+        if price is None:
+            params = market_order_params(rules, symbol, side, quantity)
+        else:
+            params = limit_order_params(rules, symbol, side, quantity, price, time_in_force)
+        return self.add(symbol, ABOVE if side == "BUY" else BELOW, trigger_price, params, on_fire)
+
+    def cancel(self, trigger_id: int) -> bool:
+        """Withdraw a pending trigger; False if it already fired or is unknown."""
+        with self._lock:
+            trigger = self._triggers.pop(trigger_id, None)
+            if trigger is None:
+                return False
+            trigger.state = "cancelled"
+            book = self._books[trigger.symbol]
+            book.live -= 1
+            book.dead += 1
+            if book.dead > _COMPACT_MIN and book.dead > book.live:
+                book.compact()
+        return True
+
+    def pending(self, symbol: Optional[str] = None) -> List[Trigger]:
+        with self._lock:
+            triggers = list(self._triggers.values())
+        return [t for t in triggers if symbol is None or t.symbol == symbol.upper()]
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply one market stream message (raw or combined-stream form); only markPriceUpdate counts."""
+        data = event.get("data", event)
+        if data.get("e") == "markPriceUpdate":
+            self.on_price(data["s"], data["p"])
+
+    def on_price(self, symbol: str, price: Any) -> List[Trigger]:
+        """Evaluate one mark-price tick; fires and returns the triggers it crossed, nearest trigger price first per side."""
+        symbol = symbol.upper()
+        price = price if isinstance(price, Decimal) else Decimal(str(price))
+        fired: List[Trigger] = []
+        with self._lock:
+            self._last[symbol] = price
+            book = self._books.get(symbol)
+            if book is None:
+                return fired
+            above = book.above
+            while above and above[0][0] <= price:
+                self._pop(book, heapq.heappop(above)[2], price, fired)
+            below = book.below
+            while below and -below[0][0] >= price:
+                self._pop(book, heapq.heappop(below)[2], price, fired)
+        for trigger in fired:
+            self._fire(trigger)
+        return fired
+
+    def _pop(self, book: _SymbolBook, trigger: Trigger, price: Decimal, fired: List[Trigger]) -> None:
+        # Caller holds self._lock
+        if trigger.state != "pending":
+            book.dead -= 1
+            return
+        trigger.state = "fired"
+        trigger.fired_price = price
+        del self._triggers[trigger.trigger_id]
+        book.live -= 1
+        fired.append(trigger)
+
+    def _fire(self, trigger: Trigger) -> None:
+        if self.client is None:
+            self._done(trigger)
+        elif self._pool is None:
+            self._send(trigger)
+        else:
+            self._pool.submit(self._send, trigger)
+
+    def _send(self, trigger: Trigger) -> None:
+        sw = stopwatch("trigger", getattr(self.client, "metrics", None))
+        try:
+            res = self.client.place_order(dict(trigger.params))
+        except Exception as e:
+            res = {"error": str(e)}
+        sw.lap("submit")
+        trigger.response = res
+        trigger.state = "sent" if isinstance(res, dict) and "orderId" in res else "failed"
+        self.logger.info(
+            "trigger fired",
+            extra={"event": "trigger_fired", "data": {"trigger_id": trigger.trigger_id, "symbol": trigger.symbol, "condition": trigger.condition, "price": str(trigger.price), "mark": str(trigger.fired_price), "state": trigger.state}},
+        )
+        self._done(trigger)
+
+    def _done(self, trigger: Trigger) -> None:
+        if trigger.on_fire is not None:
+            try:
+                trigger.on_fire(trigger)
+            except Exception as e:
+                # A callback error must not stop other triggers from firing
+                self.logger.error("trigger callback error", extra={"event": "trigger_error", "error": str(e)})
+
+    def replay(self, ticks: Iterable[Tuple[str, Any]]) -> List[Trigger]:
+        """Feed a recorded (symbol, mark price) series through `on_price`; returns every fired trigger in order."""
+        fired: List[Trigger] = []
+        for symbol, price in ticks:
+            fired.extend(self.on_price(symbol, price))
+        return fired
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+
+
+def read_ticks(path: str) -> Iterator[Tuple[str, str]]:
+    """
+    (symbol, mark price) pairs from a recorded series: a CSV file with
+    `symbol` and `price` columns, or JSON lines holding markPriceUpdate
+    events as the stream sends them (raw or combined) or {"symbol", "price"}.
+    """
+    with open(path, newline="") as f:
+        if path.lower().endswith(".csv"):
+            for row in csv.DictReader(f):
+                yield row["symbol"].upper(), row["price"]
+            return
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            event = json.loads(line)
+            data = event.get("data", event)
+            if data.get("e") == "markPriceUpdate":
+                yield data["s"], data["p"]
+            elif "symbol" in data and "price" in data:
+                yield str(data["symbol"]).upper(), str(data["price"])
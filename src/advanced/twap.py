@@ -1,8 +1,103 @@
-import time
+import asyncio
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
-from src.common.validation import get_symbol_info, validate_side, validate_qty, validate_price
+from src.advanced.twap_results import SliceRecord, TwapResults
+from src.advanced.twap_scheduler import TwapJob, TwapScheduler, jitter_summary
+from src.common.market_data import reference_price
+from src.common.metrics import stopwatch
+from src.common.validation import validate_side
+
+
+def _check_twap_args(slices: int, interval_sec: float) -> None:
+    if slices <= 0:
+        raise ValueError("slices must be > 0")
+    if interval_sec < 0:
+        raise ValueError("interval_sec must be >= 0")
+
+
+def twap_slice_params(
+    rules,
+    symbol: str,
+    side: str,
+    total_quantity: float,
+    slices: int,
+    order_type: str = "MARKET",
+    limit_price: Optional[float] = None,
+    ref_price: Optional[Decimal] = None,
+) -> Dict[str, Any]:
+    """Validate and build the params sent for every slice (shared by the sync and async paths).
+
+    Each slice must meet minNotional: at `limit_price` for LIMIT, at the
+    locally cached `ref_price` for MARKET (skipped if there is none).
+    Slices ask for RESULT responses: the Futures default (ACK) reports no
+    fill, which would leave the fill summary and VWAP empty.
+    """
+    if not rules:
+        raise ValueError(f"symbol {symbol} not found in exchangeInfo")
+
+    validate_side(side)
+    total_qty = rules.validate_qty(total_quantity)
+
+    per_slice_qty = (total_qty / Decimal(slices)).quantize(total_qty)  # keep precision
+
+    if order_type == "MARKET":
+        if ref_price is not None:
+            rules.validate_notional(ref_price, per_slice_qty)
+        return {
+            "symbol": symbol,
+            "side": side,
+            "type": "MARKET",
+            "quantity": str(per_slice_qty),
+            "newOrderRespType": "RESULT",
+        }
+    if order_type == "LIMIT":
+        if limit_price is None:
+            raise ValueError("limit_price required for LIMIT TWAP")
+        lp = rules.validate_price(limit_price)
+        rules.validate_notional(lp, per_slice_qty)
+        return {
+            "symbol": symbol,
+            "side": side,
+            "type": "LIMIT",
+            "timeInForce": "GTC",
+            "quantity": str(per_slice_qty),
+            "price": str(lp),
+            "newOrderRespType": "RESULT",
+        }
+    raise ValueError("order_type must be MARKET or LIMIT")
+
+
+def start_twap(
+    scheduler: TwapScheduler,
+    client,
+    symbol: str,
+    side: str,
+    total_quantity: float,
+    slices: int,
+    interval_sec: float,
+    order_type: str = "MARKET",
+    limit_price: Optional[float] = None,
+    on_slice: Optional[Callable[[SliceRecord], None]] = None,
+    keep_slices: bool = True,
+) -> TwapJob:
+    """Validate and start a TWAP on `scheduler` without blocking; use the job to pause, cancel or wait."""
+    _check_twap_args(slices, interval_sec)
+    sw = stopwatch("twap", getattr(client, "metrics", None))
+    rules = client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = twap_slice_params(
+        rules,
+        symbol,
+        side,
+        total_quantity,
+        slices,
+        order_type,
+        limit_price,
+        reference_price(client, symbol, side),
+    )
+    sw.lap("validation")
+    return scheduler.submit(client, params, slices, interval_sec, on_slice, keep_slices)
 
 
 def execute_twap(
@@ -14,54 +109,111 @@ def execute_twap(
     interval_sec: float,
     order_type: str = "MARKET",
     limit_price: Optional[float] = None,
+    scheduler: Optional[TwapScheduler] = None,
+    on_slice: Optional[Callable[[SliceRecord], None]] = None,
+    keep_slices: bool = True,
 ) -> Dict[str, Any]:
     """Execute a simple TWAP by splitting into evenly sized slices over time.
 
     - MARKET: places market orders per slice
     - LIMIT: places limit orders per slice at `limit_price`
+    - interval_sec == 0 submits all slices through batchOrders
+    - otherwise slices are sent on monotonic deadlines (see `TwapScheduler`)
+      and the result carries a `timing` jitter summary
+
+    Each slice becomes a compact `SliceRecord` passed to `on_slice` as it
+    completes (e.g. a `JsonlSliceSink`). The result holds a `summary` with
+    the fill VWAP, plus the records under `slices` unless `keep_slices` is off.
     """
-    if slices <= 0:
-        raise ValueError("slices must be > 0")
-    if interval_sec < 0:
-        raise ValueError("interval_sec must be >= 0")
+    _check_twap_args(slices, interval_sec)
+    sw = stopwatch("twap", getattr(client, "metrics", None))
+    rules = client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = twap_slice_params(
+        rules,
+        symbol,
+        side,
+        total_quantity,
+        slices,
+        order_type,
+        limit_price,
+        reference_price(client, symbol, side),
+    )
+    sw.lap("validation")
 
-    exi = client.exchange_info()
-    si = get_symbol_info(exi, symbol)
-    if not si:
-        raise ValueError(f"symbol {symbol} not found in exchangeInfo")
+    if interval_sec == 0:
+        # No spacing between slices: send them in ceil(slices/5) batch requests
+        responses = client.place_orders([dict(params) for _ in range(slices)])
+        sw.lap("submit")
+        results = TwapResults(slices, on_slice, keep_slices)
+        for i, res in enumerate(responses):
+            results.add(SliceRecord(i + 1, params, res))
+        return results.to_dict()
 
-    validate_side(side)
-    total_qty = validate_qty(si, total_quantity)
+    own = scheduler is None
+    scheduler = scheduler or TwapScheduler(max_workers=4)
+    try:
+        job = scheduler.submit(client, params, slices, interval_sec, on_slice, keep_slices)
+        res = job.wait()
+    finally:
+        if own:
+            scheduler.shutdown()
+    res.pop("state")
+    return res
 
-    per_slice_qty = (total_qty / Decimal(slices)).quantize(total_qty)  # keep precision
 
-    results = {"slices": []}
+async def execute_twap_async(
+    client,
+    symbol: str,
+    side: str,
+    total_quantity: float,
+    slices: int,
+    interval_sec: float,
+    order_type: str = "MARKET",
+    limit_price: Optional[float] = None,
+    on_slice: Optional[Callable[[SliceRecord], None]] = None,
+    keep_slices: bool = True,
+) -> Dict[str, Any]:
+    """`execute_twap` for an `AsyncBinanceFuturesClient`.
+
+    Slice i is sent at start + i * interval_sec on the loop clock, so request
+    latency does not accumulate and other coroutines run while it waits.
+    """
+    _check_twap_args(slices, interval_sec)
+    sw = stopwatch("twap", getattr(client, "metrics", None))
+    rules = await client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = twap_slice_params(
+        rules,
+        symbol,
+        side,
+        total_quantity,
+        slices,
+        order_type,
+        limit_price,
+        reference_price(client, symbol, side),
+    )
+    sw.lap("validation")
+
+    results = TwapResults(slices, on_slice, keep_slices)
+    if interval_sec == 0:
+        responses = await client.place_orders([dict(params) for _ in range(slices)])
+        sw.lap("submit")
+        for i, res in enumerate(responses):
+            results.add(SliceRecord(i + 1, params, res))
+        return results.to_dict()
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    jitter = []
     for i in range(slices):
-        if order_type == "MARKET":
-            params = {
-                "symbol": symbol,
-                "side": side,
-                "type": "MARKET",
-                "quantity": str(per_slice_qty),
-            }
-        elif order_type == "LIMIT":
-            if limit_price is None:
-                raise ValueError("limit_price required for LIMIT TWAP")
-            lp = validate_price(si, limit_price)
-            params = {
-                "symbol": symbol,
-                "side": side,
-                "type": "LIMIT",
-                "timeInForce": "GTC",
-                "quantity": str(per_slice_qty),
-                "price": str(lp),
-            }
-        else:
-            raise ValueError("order_type must be MARKET or LIMIT")
-
-        res = client.place_order(params)
-        results["slices"].append({"index": i + 1, "response": res})
-        if i < slices - 1 and interval_sec > 0:
-            time.sleep(interval_sec)
-
-    return results
\ No newline at end of file
+        deadline = start + i * interval_sec
+        delay = deadline - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        late = loop.time() - deadline
+        jitter.append(late)
+        res = await client.place_order(dict(params))
+        results.add(SliceRecord(i + 1, params, res, late))
+
+    return {**results.to_dict(), "timing": jitter_summary(jitter)}
@@ -0,0 +1,156 @@
+import json
+import threading
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+
+def jitter_summary(jitter: List[float]) -> Dict[str, Any]:
+    """Send lateness vs. the slice deadlines (seconds in, milliseconds out)."""
+    j = sorted(jitter)
+    if not j:
+        return {"slices_sent": 0}
+    return {
+        "slices_sent": len(j),
+        "jitter_mean_ms": sum(j) / len(j) * 1000,
+        "jitter_p50_ms": j[len(j) // 2] * 1000,
+        "jitter_p95_ms": j[min(len(j) - 1, int(len(j) * 0.95))] * 1000,
+        "jitter_max_ms": j[-1] * 1000,
+    }
+
+
+class SliceRecord:
+    """
+    The fields of one slice's order response worth keeping (a full Futures
+    order response has ~25), plus how late the slice was sent.
+    """
+
+    __slots__ = ("index", "symbol", "side", "type", "order_id", "client_order_id", "status", "executed_qty", "avg_price", "cum_quote", "jitter_ms", "error")
+
+    def __init__(self, index: int, params: Dict[str, Any], response: Any, jitter: Optional[float] = None) -> None:
+        self.index = index
+        # Taken from the shared slice params, so every record points at the same strings
+        self.symbol = params.get("symbol")
+        self.side = params.get("side")
+        self.type = params.get("type")
+        self.jitter_ms = None if jitter is None else round(jitter * 1000, 3)
+        res = response if isinstance(response, dict) else {}
+        self.order_id = res.get("orderId")
+        self.client_order_id = res.get("clientOrderId")
+        self.status = res.get("status")
+        self.executed_qty = res.get("executedQty")
+        self.avg_price = res.get("avgPrice")
+        self.cum_quote = res.get("cumQuote")
+        if self.order_id is not None:
+            self.error = None
+        elif "code" in res:
+            self.error = f"{res['code']}: {res.get('msg', '')}"
+        else:
+            self.error = str(res.get("error", response))
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {
+            "index": self.index,
+            "symbol": self.symbol,
+            "side": self.side,
+            "type": self.type,
+            "orderId": self.order_id,
+            "clientOrderId": self.client_order_id,
+            "status": self.status,
+            "executedQty": self.executed_qty,
+            "avgPrice": self.avg_price,
+            "cumQuote": self.cum_quote,
+            "jitter_ms": self.jitter_ms,
+            "error": self.error,
+        }
+        return {k: v for k, v in out.items() if v is not None}
+
+
+class TwapResults:
+    """
+    Collects a TWAP's slice records as they complete: running fill totals
+    for the summary, the compact records themselves unless `keep_slices` is
+    off, and each record handed to `on_slice` (e.g. a `JsonlSliceSink`).
+    Thread-safe; memory is constant with `keep_slices=False`.
+    """
+
+    def __init__(self, slices: int, on_slice: Optional[Callable[[SliceRecord], None]] = None, keep_slices: bool = True) -> None:
+        self.slices = slices
+        self.on_slice = on_slice
+        self.records: Optional[List[SliceRecord]] = [] if keep_slices else None
+        self.sent = 0
+        self.accepted = 0
+        self.failed = 0
+        self.filled_qty = Decimal(0)
+        self.filled_quote = Decimal(0)
+        self._lock = threading.Lock()
+
+    def add(self, record: SliceRecord) -> None:
+        qty = Decimal(record.executed_qty) if record.executed_qty else Decimal(0)
+        if qty and record.cum_quote:
+            quote = Decimal(record.cum_quote)
+        elif qty and record.avg_price:
+            quote = qty * Decimal(record.avg_price)
+        else:
+            quote = Decimal(0)
+        with self._lock:
+            self.sent += 1
+            if record.order_id is not None:
+                self.accepted += 1
+            else:
+                self.failed += 1
+            self.filled_qty += qty
+            self.filled_quote += quote
+            if self.records is not None:
+                self.records.append(record)
+        if self.on_slice is not None:
+            self.on_slice(record)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Slice counts, filled quantity and quote, and the fill VWAP (None until
+        something fills), as reported by the slice responses: a LIMIT slice
+        that rests and fills later is not included.
+        """
+        with self._lock:
+            qty, quote = self.filled_qty, self.filled_quote
+            return {
+                "slices": self.slices,
+                "sent": self.sent,
+                "accepted": self.accepted,
+                "failed": self.failed,
+                "filled_qty": str(qty),
+                "filled_quote": str(quote),
+                "vwap": str((quote / qty).quantize(Decimal("0.00000001"))) if qty else None,
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"summary": self.summary()}
+        if self.records is not None:
+            with self._lock:
+                records = sorted(self.records, key=lambda r: r.index)
+            out["slices"] = [r.to_dict() for r in records]
+        return out
+
+
+class JsonlSliceSink:
+    """Appends one JSON line per slice record as it completes; pass as `on_slice`, then `close()`."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._f = open(path, "a")
+        self._lock = threading.Lock()
+
+    def __call__(self, record: SliceRecord) -> None:
+        line = json.dumps(record.to_dict(), separators=(",", ":"))
+        with self._lock:
+            self._f.write(line + "\n")
+            self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "JsonlSliceSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
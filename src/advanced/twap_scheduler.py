@@ -0,0 +1,196 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.advanced.twap_results import SliceRecord, TwapResults, jitter_summary
+
+
+class TwapJob:
+    """
+    One TWAP run managed by `TwapScheduler`.
+
+    Slice i is due at start + i * interval_sec on the monotonic clock (shifted
+    by any time spent paused), so request latency never pushes later slices
+    back. `jitter` records how late each slice was actually sent. Slice
+    outcomes go to a `TwapResults` (`on_slice`, `keep_slices`).
+    """
+
+    def __init__(
+        self,
+        job_id: int,
+        client,
+        params: Dict[str, Any],
+        slices: int,
+        interval_sec: float,
+        on_slice: Optional[Callable[[SliceRecord], None]] = None,
+        keep_slices: bool = True,
+    ) -> None:
+        self.job_id = job_id
+        self.client = client
+        self.params = params
+        self.slices = slices
+        self.interval_sec = interval_sec
+        self.state = "running"
+        self.results = TwapResults(slices, on_slice, keep_slices)
+        self.jitter: List[float] = []
+        self._start = 0.0
+        self._paused_total = 0.0
+        self._paused_at: Optional[float] = None
+        self._held: Optional[int] = None  # slice index popped while paused
+        self._in_flight = 0
+        self._next = 0  # next slice index to put on the heap
+        self._sent = 0
+        self._scheduler: Optional["TwapScheduler"] = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def deadline(self, index: int) -> float:
+        return self._start + self._paused_total + index * self.interval_sec
+
+    def pause(self) -> None:
+        with self._lock:
+            if self.state == "running":
+                self.state = "paused"
+                self._paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        with self._lock:
+            if self.state != "paused":
+                return
+            self._paused_total += time.monotonic() - self._paused_at
+            self._paused_at = None
+            self.state = "running"
+            held, self._held = self._held, None
+        if held is not None:
+            self._scheduler._push(self, held)
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self.state in ("done", "cancelled"):
+                return
+            self.state = "cancelled"
+            self._finish_if_idle()
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        self._done.wait(timeout)
+        return self.result()
+
+    def result(self) -> Dict[str, Any]:
+        return {**self.results.to_dict(), "state": self.state, "timing": self.timing()}
+
+    def timing(self) -> Dict[str, Any]:
+        return jitter_summary(self.jitter)
+
+    def _finish_if_idle(self) -> None:
+        # Caller holds self._lock
+        if self._in_flight == 0 and (self.state == "cancelled" or self._sent >= self.slices):
+            if self.state != "cancelled":
+                self.state = "done"
+            self._done.set()
+
+
+class TwapScheduler:
+    """
+    Runs many TWAP jobs from one timer heap.
+
+    A single timer thread pops due slices and hands them to a small worker
+    pool, so a slow order on one job never delays slices of the others. The
+    next slice of a job is scheduled as soon as the current one fires.
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        self._heap: List[Tuple[float, int, TwapJob, int]] = []
+        self._seq = itertools.count()
+        self._job_ids = itertools.count(1)
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="twap")
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="twap-timer", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        client,
+        params: Dict[str, Any],
+        slices: int,
+        interval_sec: float,
+        on_slice: Optional[Callable[[SliceRecord], None]] = None,
+        keep_slices: bool = True,
+    ) -> TwapJob:
+        """Start sending `params` `slices` times, one every `interval_sec` seconds."""
+        job = TwapJob(next(self._job_ids), client, params, slices, interval_sec, on_slice, keep_slices)
+        job._scheduler = self
+        job._start = time.monotonic()
+        job._next = 1
+        self._push(job, 0)
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._pool.shutdown(wait=wait)
+
+    def _push(self, job: TwapJob, index: int) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (job.deadline(index), next(self._seq), job, index))
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._heap:
+                        delay = self._heap[0][0] - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self._cond.wait(delay)
+                    else:
+                        self._cond.wait()
+                if self._closed:
+                    return
+                deadline, _, job, index = heapq.heappop(self._heap)
+            self._dispatch(job, index, deadline)
+
+    def _dispatch(self, job: TwapJob, index: int, deadline: float) -> None:
+        nxt = None
+        with job._lock:
+            if job.state == "cancelled":
+                return
+            if job.state == "paused":
+                job._held = index
+                return
+            # Pushed before a pause/resume shifted the schedule: wait for the new deadline
+            resched = job.deadline(index) > deadline
+            if not resched:
+                job._in_flight += 1
+                job._sent += 1
+                if job._next < job.slices:
+                    nxt = job._next
+                    job._next += 1
+        if resched:
+            self._push(job, index)
+            return
+        if nxt is not None:
+            self._push(job, nxt)
+        self._pool.submit(self._send, job, index, deadline)
+
+    def _send(self, job: TwapJob, index: int, deadline: float) -> None:
+        jitter = time.monotonic() - deadline
+        job.jitter.append(jitter)
+        try:
+            res = job.client.place_order(dict(job.params))
+        except Exception as e:
+            res = {"error": str(e)}
+        try:
+            # Before the job can finish, so a sink has every record once wait() returns
+            job.results.add(SliceRecord(index + 1, job.params, res, jitter))
+        except Exception as e:
+            job.client.logger.error("twap slice sink error", extra={"event": "twap_error", "error": str(e)})
+        with job._lock:
+            job._in_flight -= 1
+            job._finish_if_idle()
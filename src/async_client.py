@@ -0,0 +1,197 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+import aiohttp
+
+from src.binance_client import _FuturesClientBase, _map_batch, next_request_id
+from src.common.time_sync import ServerClock
+from src.common.validation import SymbolRules
+
+
+# Same statuses the sync client retries for idempotent GETs
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class AsyncBinanceFuturesClient(_FuturesClientBase):
+    """
+    asyncio counterpart of `BinanceFuturesClient`, built on aiohttp.
+
+    Signing, logging, endpoints and the exchangeInfo cache are shared with
+    the sync client. All requests go through one aiohttp connection pool of
+    `pool_size` keep-alive connections, so many orders and symbols can be in
+    flight from a single event loop. Pass `session` to share a pool between
+    clients. Use `async with` or call `close()` when done.
+    """
+
+    def __init__(self, *args: Any, session: Optional[aiohttp.ClientSession] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._session = session
+        self._owns_session = session is None
+        self._exchange_info_lock: Optional[asyncio.Lock] = None
+        self._sync_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._owns_session = True
+        return self._session
+
+    async def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, private: bool = False, keyed: bool = False) -> Any:
+        if private and self.clock is not None and self.clock.stale():
+            if self._sync_lock is None:
+                self._sync_lock = asyncio.Lock()
+            async with self._sync_lock:
+                # Only the first coroutine to notice resyncs; the rest reuse its result
+                if self.clock.stale():
+                    await self.sync_time()
+        t0 = time.perf_counter()
+        await self.rate_limiter.acquire_async(method, path)
+        t1 = time.perf_counter()
+        request_id = next_request_id()
+        url, params = self._prepare(method, path, params, private, request_id)
+        t2 = time.perf_counter()
+        # Encode exactly what was signed instead of letting aiohttp re-encode
+        body: Optional[str] = urlencode(params, doseq=True)
+        if method == "GET":
+            if body:
+                url = f"{url}?{body}"
+            body = None
+        attempts = self.max_retries + 1
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            try:
+                async with self.session.request(method, url, headers=self._headers(private or keyed), data=body) as resp:
+                    status = resp.status
+                    text = await resp.text()
+                    self.rate_limiter.reconcile(status, resp.headers)
+            except aiohttp.ClientConnectorError:
+                # Never reached the server: safe to retry any method
+                if last:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if last or method != "GET":
+                    raise
+            else:
+                if last or method != "GET" or status not in _RETRY_STATUSES:
+                    break
+            await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+        t3 = time.perf_counter()
+        try:
+            payload = json.loads(text)
+        except Exception:
+            payload = {"status_code": status, "text": text}
+        t4 = time.perf_counter()
+        # network includes retries and their backoff
+        self.metrics.observe_stages(
+            "request_stage_seconds",
+            (("throttle", t1 - t0), ("signing", t2 - t1), ("network", t3 - t2), ("parse", t4 - t3)),
+            endpoint=f"{method} {path}",
+        )
+        own_window = params.get("recvWindow", self.recv_window) != self.recv_window
+        return self._finish(status < 400, payload, request_id, round((t4 - t0) * 1e3, 3), own_window, path)
+
+    async def close(self) -> None:
+        self.exchange_info_cache.stop()
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncBinanceFuturesClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    # Public endpoints
+    async def _ensure_exchange_info(self) -> Optional[Dict[str, Any]]:
+        """Refresh the shared cache if stale; returns the error payload if nothing usable is held."""
+        cache = self.exchange_info_cache
+        if cache.is_fresh():
+            return None
+        if self._exchange_info_lock is None:
+            self._exchange_info_lock = asyncio.Lock()
+        async with self._exchange_info_lock:
+            if cache.is_fresh():
+                return None
+            payload = await self._request("GET", "/v1/exchangeInfo")
+            if not cache.load(payload) and cache.current() is None:
+                return payload
+        return None
+
+    async def server_time(self) -> Dict[str, Any]:
+        return await self._request("GET", "/v1/time")
+
+    async def sync_time(self) -> Optional[ServerClock]:
+        """Sample /v1/time and update the clock used to stamp signed requests."""
+        clock = self.clock or ServerClock()
+        samples = []
+        # Sequential on purpose: concurrent samples would queue behind each other and skew the RTTs
+        for _ in range(clock.samples):
+            t0 = time.time() * 1000
+            res = await self.server_time()
+            t1 = time.time() * 1000
+            if isinstance(res, dict) and "serverTime" in res:
+                samples.append((t0, float(res["serverTime"]), t1))
+        clock.update(samples)
+        self.clock = clock
+        return clock
+
+    async def exchange_info(self) -> Dict[str, Any]:
+        error = await self._ensure_exchange_info()
+        return error if error is not None else self.exchange_info_cache.current()
+
+    async def symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        await self._ensure_exchange_info()
+        return self.exchange_info_cache.symbol(symbol)
+
+    async def symbol_rules(self, symbol: str) -> Optional[SymbolRules]:
+        await self._ensure_exchange_info()
+        return self.exchange_info_cache.rules(symbol)
+
+    # User data stream (API key header, unsigned)
+    async def new_listen_key(self) -> Dict[str, Any]:
+        return await self._request("POST", "/v1/listenKey", keyed=True)
+
+    async def keepalive_listen_key(self) -> Dict[str, Any]:
+        return await self._request("PUT", "/v1/listenKey", keyed=True)
+
+    async def close_listen_key(self) -> Dict[str, Any]:
+        return await self._request("DELETE", "/v1/listenKey", keyed=True)
+
+    # Private endpoints
+    async def place_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._request("POST", "/v1/order", params=params, private=True)
+
+    async def cancel_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._request("DELETE", "/v1/order", params=params, private=True)
+
+    async def query_order(self, symbol: str, order_id: Optional[int] = None, orig_client_order_id: Optional[str] = None) -> Dict[str, Any]:
+        """Order status by orderId or origClientOrderId (-2013 if the exchange never accepted it)."""
+        return await self._request("GET", "/v1/order", params=self._query_order_params(symbol, order_id, orig_client_order_id), private=True)
+
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Place orders via batchOrders; chunks are sent concurrently and results align with `orders`."""
+        chunks = list(self._batch_place_params(orders))
+        payloads = await asyncio.gather(*(self._request("POST", "/v1/batchOrders", params=p, private=True) for p, _ in chunks))
+        results: List[Dict[str, Any]] = []
+        for (_, n), payload in zip(chunks, payloads):
+            results.extend(_map_batch(payload, n))
+        return results
+
+    async def cancel_orders(
+        self,
+        symbol: str,
+        order_ids: Optional[List[int]] = None,
+        client_order_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        chunks = list(self._batch_cancel_params(symbol, order_ids, client_order_ids))
+        payloads = await asyncio.gather(*(self._request("DELETE", "/v1/batchOrders", params=p, private=True) for p, _ in chunks))
+        results: List[Dict[str, Any]] = []
+        for (_, n), payload in zip(chunks, payloads):
+            results.extend(_map_batch(payload, n))
+        return results
@@ -0,0 +1,189 @@
+import csv
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from src.advanced.hedged import place_order_hedged
+from src.advanced.stop_limit import stop_limit_order_params
+from src.common.market_data import reference_price
+from src.common.metrics import stopwatch
+from src.common.rate_limit import RateLimitExceeded
+from src.limit_orders import limit_order_params
+from src.market_orders import market_order_params
+
+# Accepted column names -> canonical field; the CLI's own names plus Binance's
+_ALIASES = {
+    "stopprice": "stop_price",
+    "timeinforce": "tif",
+    "time_in_force": "tif",
+    "newclientorderid": "client_order_id",
+    "clientorderid": "client_order_id",
+    "qty": "quantity",
+}
+
+# Order type column -> params builder (by CLI command name)
+_TYPES = {
+    "MARKET": "market",
+    "LIMIT": "limit",
+    "STOP": "stop-limit",
+    "STOP_LIMIT": "stop-limit",
+    "STOP-LIMIT": "stop-limit",
+}
+
+
+def _normalize(row: Dict[str, Any]) -> Dict[str, Any]:
+    out = {}
+    for key, value in row.items():
+        if key is None or value is None or value == "":
+            continue  # csv: missing/extra cells
+        k = key.strip().lower()
+        out[_ALIASES.get(k.replace("-", "_"), k)] = value.strip() if isinstance(value, str) else value
+    return out
+
+
+def read_orders(f: IO[str], fmt: str = "jsonl") -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Yield (line number, order row) from a CSV file with a header row or a
+    JSONL file, one row at a time. Blank lines (and JSONL lines starting with
+    `#`) are skipped; unparseable JSONL lines are yielded as {"_error": ...}.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, _normalize(row)
+        return
+    for n, line in enumerate(f, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield n, {"_error": f"invalid JSON: {e}"}
+            continue
+        yield n, _normalize(row) if isinstance(row, dict) else {"_error": "expected a JSON object"}
+
+
+def order_params(rules, row: Dict[str, Any], ref_price: Optional[Decimal] = None) -> Dict[str, Any]:
+    """Validate one row against `rules` and build its order params; raises ValueError.
+
+    `ref_price` is the local price a MARKET row is checked against (see `market_order_params`).
+    """
+    if "_error" in row:
+        raise ValueError(row["_error"])
+    missing = [k for k in ("symbol", "side", "type", "quantity") if k not in row]
+    if missing:
+        raise ValueError(f"missing field(s): {', '.join(missing)}")
+    kind = _TYPES.get(str(row["type"]).upper())
+    if kind is None:
+        raise ValueError(f"unsupported type {row['type']} (MARKET, LIMIT or STOP)")
+    symbol = str(row["symbol"]).upper()
+    side = str(row["side"]).upper()
+    quantity = float(row["quantity"])
+    tif = str(row.get("tif", "GTC")).upper()
+    if kind == "market":
+        params = market_order_params(rules, symbol, side, quantity, ref_price)
+    elif kind == "limit":
+        if "price" not in row:
+            raise ValueError("LIMIT requires price")
+        params = limit_order_params(rules, symbol, side, quantity, float(row["price"]), tif)
+    else:
+        if "price" not in row or "stop_price" not in row:
+            raise ValueError("STOP requires price and stop_price")
+        params = stop_limit_order_params(rules, symbol, side, quantity, float(row["price"]), float(row["stop_price"]), tif)
+    if "client_order_id" in row:
+        params["newClientOrderId"] = str(row["client_order_id"])
+    return params
+
+
+class BatchRunner:
+    """
+    Submit a stream of order rows through `client` with at most `workers`
+    requests in flight, writing one JSON result line to `out` per row as it
+    completes (completion order; `line` ties it back to the input).
+
+    Rows are validated on the reading thread against per-symbol
+    `SymbolRules`, so rejects never occupy a worker. Input is read only as
+    fast as workers free up, so memory does not grow with the input size.
+    Requests shed by the client's rate governor were never sent and are
+    retried after a pause; every other outcome is reported as-is. With
+    `hedge`, slow submissions are hedged (see src/advanced/hedged.py).
+    """
+
+    def __init__(self, client, out: IO[str], workers: int = 8, journal=None, rate_limit_retries: int = 10, hedge: bool = False) -> None:
+        self.client = client
+        self.hedge = hedge
+        self.out = out
+        self.workers = workers
+        self.journal = journal
+        self.rate_limit_retries = rate_limit_retries
+        self.counts = {"rows": 0, "rejected": 0, "accepted": 0, "failed": 0}
+        self._rules: Dict[str, Any] = {}
+        self._slots = threading.BoundedSemaphore(workers)
+        self._write_lock = threading.Lock()
+
+    def _symbol_rules(self, symbol: str):
+        rules = self._rules.get(symbol)
+        if rules is None:
+            rules = self._rules[symbol] = self.client.symbol_rules(symbol)
+        return rules
+
+    def _write(self, result: Dict[str, Any], counter: str, response: Any = None) -> None:
+        line = json.dumps(result, default=str)
+        with self._write_lock:
+            self.counts[counter] += 1
+            self.out.write(line + "\n")
+            self.out.flush()
+            if self.journal is not None and response is not None:
+                self.journal.record("Batch Order Response", response, "batch")
+
+    def _submit(self, n: int, params: Dict[str, Any]) -> None:
+        sw = stopwatch("batch", getattr(self.client, "metrics", None))
+        try:
+            for attempt in range(self.rate_limit_retries + 1):
+                try:
+                    res = place_order_hedged(self.client, params) if self.hedge else self.client.place_order(dict(params))
+                    break
+                except RateLimitExceeded:
+                    if attempt == self.rate_limit_retries:
+                        raise
+                    time.sleep(self.client.rate_limiter.max_wait)
+            sw.lap("submit")
+            ok = isinstance(res, dict) and "orderId" in res
+            self._write({"line": n, "ok": ok, "symbol": params["symbol"], "response": res}, "accepted" if ok else "failed", res)
+        except Exception as e:
+            self._write({"line": n, "ok": False, "symbol": params["symbol"], "error": f"{type(e).__name__}: {e}"}, "failed")
+        finally:
+            self._slots.release()
+
+    def run(self, rows: Iterable[Tuple[int, Dict[str, Any]]]) -> Dict[str, int]:
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch") as pool:
+            for n, row in rows:
+                self.counts["rows"] += 1
+                sw = stopwatch("batch", getattr(self.client, "metrics", None))
+                try:
+                    symbol = str(row.get("symbol", "")).upper()
+                    rules = self._symbol_rules(symbol) if symbol else None
+                    params = order_params(rules, row, reference_price(self.client, symbol, str(row.get("side", "")).upper()))
+                except Exception as e:
+                    self._write({"line": n, "ok": False, "symbol": row.get("symbol"), "error": f"{type(e).__name__}: {e}"}, "rejected")
+                    continue
+                sw.lap("validation")
+                # Blocks while `workers` orders are in flight
+                self._slots.acquire()
+                pool.submit(self._submit, n, params)
+        return self.counts
+
+
+def run_batch(client, path: str, out: IO[str], fmt: Optional[str] = None, workers: int = 8, journal=None, hedge: bool = False) -> Dict[str, int]:
+    """Stream orders from `path` ("-" for stdin; format from the extension unless given) through a `BatchRunner`."""
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    runner = BatchRunner(client, out, workers, journal, hedge=hedge)
+    if path == "-":
+        return runner.run(read_orders(sys.stdin, fmt))
+    with open(path, newline="") as f:
+        return runner.run(read_orders(f, fmt))
@@ -1,19 +1,45 @@
 import time
 import hmac
 import hashlib
+import itertools
+import json
+import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import get_environ_proxies
+from urllib3.util.retry import Retry
 from urllib.parse import urlencode
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from src.common.exchange_info import ExchangeInfoCache
 from src.common.logger import get_logger
+from src.common.market_data import MarketDataCache
+from src.common.metrics import REGISTRY, MetricsRegistry
+from src.common.rate_limit import RateLimitGovernor
+from src.common.time_sync import ServerClock
+from src.common.validation import SymbolRules
 
 
-class BinanceFuturesClient:
+# Process-wide request sequence; ids are "<pid>-<n>" so several CLI runs can share one log file
+_request_seq = itertools.count(1)
+
+
+def next_request_id() -> str:
+    return f"{os.getpid()}-{next(_request_seq)}"
+
+
+class _FuturesClientBase:
     """
-    Minimal REST client for Binance USDT-M Futures.
-    Defaults to Testnet base URL per requirements.
+    Transport-independent parts of the Futures clients: configuration,
+    signing, request/response logging, the exchangeInfo cache and batch
+    chunking. Subclasses supply `_request` (blocking or async).
     """
 
+    # Per-request limits of /fapi/v1/batchOrders
+    BATCH_PLACE_MAX = 5
+    BATCH_CANCEL_MAX = 10
+
     def __init__(
         self,
         api_key: str,
@@ -21,6 +47,17 @@ class BinanceFuturesClient:
         base_url: str = "https://testnet.binancefuture.com",
         recv_window: int = 5000,
         log_file_path: str = "bot.log",
+        exchange_info_ttl: float = 300.0,
+        exchange_info_snapshot: Optional[str] = None,
+        exchange_info_cache: Optional[ExchangeInfoCache] = None,
+        timeout: float = 10.0,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.2,
+        rate_limiter: Optional[RateLimitGovernor] = None,
+        time_sync: bool = False,
+        market_data: Optional[MarketDataCache] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ) -> None:
         self.api_key = api_key
         self.api_secret = api_secret.encode()
@@ -28,6 +65,22 @@ class BinanceFuturesClient:
         self.recv_window = recv_window
         self.logger = get_logger("bot", log_file_path)
         self._fapi_prefix = "/fapi"
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        # Limits are per IP/account: share one governor between clients of the same account
+        self.rate_limiter = rate_limiter or RateLimitGovernor()
+        # With time_sync, signed requests are stamped with the estimated server time
+        self.clock: Optional[ServerClock] = ServerClock() if time_sync else None
+        # Local bid/ask/mark prices for MARKET notional checks (fed by a MarketDataStream)
+        self.market_data = market_data
+        # Per-endpoint stage timings (throttle, signing, network, parse); process-wide by default
+        self.metrics = metrics or REGISTRY
+        # Pass the same cache to several clients to share one copy of exchangeInfo
+        self.exchange_info_cache = exchange_info_cache or ExchangeInfoCache(
+            ttl=exchange_info_ttl, snapshot_path=exchange_info_snapshot
+        )
 
     def _sign(self, params: Dict[str, Any]) -> str:
         query = urlencode(params, doseq=True)
@@ -39,35 +92,215 @@ class BinanceFuturesClient:
             headers["X-MBX-APIKEY"] = self.api_key
         return headers
 
-    def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, private: bool = False) -> Dict[str, Any]:
+    def _prepare(self, method: str, path: str, params: Optional[Dict[str, Any]], private: bool, request_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
         url = f"{self.base_url}{self._fapi_prefix}{path}"
         params = params or {}
         if private:
-            params["timestamp"] = int(time.time() * 1000)
-            params["recvWindow"] = self.recv_window
+            params["timestamp"] = self.clock.now_ms() if self.clock else int(time.time() * 1000)
+            # A caller-set recvWindow (e.g. hedged submission) wins over the client default
+            params["recvWindow"] = params.get("recvWindow", self.recv_window)
             params["signature"] = self._sign(params)
         self.logger.info(
             "sending request",
-            extra={"event": "api_request", "data": {"method": method, "url": url, "params": params}},
+            extra={"event": "api_request", "data": {"method": method, "url": url, "params": params}, "request_id": request_id},
+        )
+        return url, params
+
+    def _finish(self, ok: bool, payload: Any, request_id: Optional[str] = None, elapsed_ms: Optional[float] = None, own_window: bool = False, path: Optional[str] = None) -> Any:
+        if self.clock is not None and not own_window and isinstance(payload, dict) and payload.get("code") == -1021:
+            # Timestamp outside recvWindow: our offset is off, resync before the next signed call.
+            # Not for a caller-set (deliberately short) window, which says nothing about the clock.
+            self.clock.invalidate()
+        data = payload
+        if ok and path == "/v1/exchangeInfo" and isinstance(payload, dict):
+            # Hundreds of KB on every refresh: log what was fetched, not the document
+            data = {"summary": True, "symbols": len(payload.get("symbols") or ()), "serverTime": payload.get("serverTime")}
+        extra = {"data": data, "request_id": request_id, "elapsed_ms": elapsed_ms}
+        if ok:
+            self.logger.info("received response", extra={"event": "api_response", **extra})
+        else:
+            self.logger.error("api error", extra={"event": "api_error", **extra})
+        return payload
+
+    def _query_order_params(self, symbol: str, order_id: Optional[int], orig_client_order_id: Optional[str]) -> Dict[str, Any]:
+        if order_id is not None:
+            return {"symbol": symbol, "orderId": order_id}
+        if orig_client_order_id:
+            return {"symbol": symbol, "origClientOrderId": orig_client_order_id}
+        raise ValueError("order_id or orig_client_order_id required")
+
+    def _batch_place_params(self, orders: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], int]]:
+        for i in range(0, len(orders), self.BATCH_PLACE_MAX):
+            chunk = orders[i : i + self.BATCH_PLACE_MAX]
+            yield {"batchOrders": json.dumps(chunk, separators=(",", ":"))}, len(chunk)
+
+    def _batch_cancel_params(
+        self,
+        symbol: str,
+        order_ids: Optional[List[int]],
+        client_order_ids: Optional[List[str]],
+    ) -> Iterator[Tuple[Dict[str, Any], int]]:
+        if order_ids:
+            key, ids = "orderIdList", list(order_ids)
+        elif client_order_ids:
+            key, ids = "origClientOrderIdList", list(client_order_ids)
+        else:
+            raise ValueError("order_ids or client_order_ids required")
+        for i in range(0, len(ids), self.BATCH_CANCEL_MAX):
+            chunk = ids[i : i + self.BATCH_CANCEL_MAX]
+            yield {"symbol": symbol, key: json.dumps(chunk, separators=(",", ":"))}, len(chunk)
+
+
+class BinanceFuturesClient(_FuturesClientBase):
+    """
+    Minimal REST client for Binance USDT-M Futures.
+    Defaults to Testnet base URL per requirements.
+    """
+
+    def __init__(self, *args: Any, exchange_info_refresh: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # One keep-alive connection pool shared by every thread using this client.
+        # Only idempotent GETs are retried on read errors / 5xx; connect errors are
+        # retried for all methods since the request never reached the server.
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
         )
-        resp = requests.request(method, url, headers=self._headers(private), params=params if method == "GET" else None, data=params if method != "GET" else None, timeout=10)
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        if exchange_info_refresh:
+            self.exchange_info_cache.start_background_refresh(self._fetch_exchange_info)
+
+    @property
+    def session(self) -> requests.Session:
+        """Per-thread Session mounted on the shared adapter (Session itself is not thread-safe)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            # Resolve proxy/CA settings from the environment once: with trust_env,
+            # requests rescans os.environ and ~/.netrc on every call (~1ms each)
+            session.proxies.update(get_environ_proxies(self.base_url))
+            ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+            if ca_bundle:
+                session.verify = ca_bundle
+            session.trust_env = False
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
+    def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, private: bool = False, keyed: bool = False) -> Any:
+        if private and self.clock is not None and self.clock.stale():
+            with self._sync_lock:
+                # Only the first thread to notice resyncs; the rest reuse its result
+                if self.clock.stale():
+                    self.sync_time()
+        t0 = time.perf_counter()
+        # Throttle before signing so the timestamp is taken after any wait
+        self.rate_limiter.acquire(method, path)
+        t1 = time.perf_counter()
+        request_id = next_request_id()
+        url, params = self._prepare(method, path, params, private, request_id)
+        t2 = time.perf_counter()
+        resp = self.session.request(method, url, headers=self._headers(private or keyed), params=params if method == "GET" else None, data=params if method != "GET" else None, timeout=self.timeout)
+        t3 = time.perf_counter()
+        self.rate_limiter.reconcile(resp.status_code, resp.headers)
         try:
             payload = resp.json()
         except Exception:
             payload = {"status_code": resp.status_code, "text": resp.text}
-        if resp.ok:
-            self.logger.info("received response", extra={"event": "api_response", "data": payload})
-        else:
-            self.logger.error("api error", extra={"event": "api_error", "data": payload})
-        return payload
+        t4 = time.perf_counter()
+        self.metrics.observe_stages(
+            "request_stage_seconds",
+            (("throttle", t1 - t0), ("signing", t2 - t1), ("network", t3 - t2), ("parse", t4 - t3)),
+            endpoint=f"{method} {path}",
+        )
+        own_window = params.get("recvWindow", self.recv_window) != self.recv_window
+        return self._finish(resp.ok, payload, request_id, round((t4 - t0) * 1e3, 3), own_window, path)
+
+    def close(self) -> None:
+        self.exchange_info_cache.stop()
+        self._adapter.close()
 
     # Public endpoints
-    def exchange_info(self) -> Dict[str, Any]:
+    def _fetch_exchange_info(self) -> Dict[str, Any]:
         return self._request("GET", "/v1/exchangeInfo")
 
+    def server_time(self) -> Dict[str, Any]:
+        return self._request("GET", "/v1/time")
+
+    def sync_time(self) -> Optional[ServerClock]:
+        """Sample /v1/time and update the clock used to stamp signed requests."""
+        clock = self.clock or ServerClock()
+        samples = []
+        for _ in range(clock.samples):
+            t0 = time.time() * 1000
+            res = self.server_time()
+            t1 = time.time() * 1000
+            if isinstance(res, dict) and "serverTime" in res:
+                samples.append((t0, float(res["serverTime"]), t1))
+        clock.update(samples)
+        self.clock = clock
+        return clock
+
+    def exchange_info(self) -> Dict[str, Any]:
+        """Cached exchangeInfo; only hits the network when the cache is stale."""
+        return self.exchange_info_cache.get(self._fetch_exchange_info)
+
+    def symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self.exchange_info_cache.symbol(symbol, self._fetch_exchange_info)
+
+    def symbol_rules(self, symbol: str) -> Optional[SymbolRules]:
+        return self.exchange_info_cache.rules(symbol, self._fetch_exchange_info)
+
+    # User data stream (API key header, unsigned)
+    def new_listen_key(self) -> Dict[str, Any]:
+        return self._request("POST", "/v1/listenKey", keyed=True)
+
+    def keepalive_listen_key(self) -> Dict[str, Any]:
+        return self._request("PUT", "/v1/listenKey", keyed=True)
+
+    def close_listen_key(self) -> Dict[str, Any]:
+        return self._request("DELETE", "/v1/listenKey", keyed=True)
+
     # Private endpoints
     def place_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
         return self._request("POST", "/v1/order", params=params, private=True)
 
     def cancel_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        return self._request("DELETE", "/v1/order", params=params, private=True)
\ No newline at end of file
+        return self._request("DELETE", "/v1/order", params=params, private=True)
+
+    def query_order(self, symbol: str, order_id: Optional[int] = None, orig_client_order_id: Optional[str] = None) -> Dict[str, Any]:
+        """Order status by orderId or origClientOrderId (-2013 if the exchange never accepted it)."""
+        return self._request("GET", "/v1/order", params=self._query_order_params(symbol, order_id, orig_client_order_id), private=True)
+
+    def place_orders(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Place orders via batchOrders, 5 per request; result i belongs to orders[i]."""
+        results: List[Dict[str, Any]] = []
+        for params, n in self._batch_place_params(orders):
+            results.extend(_map_batch(self._request("POST", "/v1/batchOrders", params=params, private=True), n))
+        return results
+
+    def cancel_orders(
+        self,
+        symbol: str,
+        order_ids: Optional[List[int]] = None,
+        client_order_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Cancel by orderId or origClientOrderId via batchOrders, 10 per request; results align with the ids."""
+        results: List[Dict[str, Any]] = []
+        for params, n in self._batch_cancel_params(symbol, order_ids, client_order_ids):
+            results.extend(_map_batch(self._request("DELETE", "/v1/batchOrders", params=params, private=True), n))
+        return results
+
+
+def _map_batch(payload: Any, n: int) -> List[Dict[str, Any]]:
+    # A successful call returns one entry (order or {code, msg}) per input;
+    # a request-level error is a single dict that applies to every order
+    if isinstance(payload, list) and len(payload) == n:
+        return payload
+    return [dict(payload) if isinstance(payload, dict) else {"error": payload} for _ in range(n)]
\ No newline at end of file
@@ -1,13 +1,34 @@
 import os
 import argparse
-from typing import Optional
+import json
+import time
+from typing import TYPE_CHECKING, Optional
 
-from src.binance_client import BinanceFuturesClient
-from src.market_orders import place_market_order
-from src.limit_orders import place_limit_order
-from src.advanced.stop_limit import place_stop_limit_order
-from src.advanced.twap import execute_twap
-from src.advanced.oco import place_oco_order
+from src.common.metrics import REGISTRY
+from src.daemon import DaemonError, call, default_socket_path
+
+if TYPE_CHECKING:
+    from src.binance_client import BinanceFuturesClient
+
+# Heavy modules (requests, strategies, asyncio) are imported only on the path
+# that needs them, so --help, argument errors and daemon round-trips stay
+# cheap; `python -m src.tools.check_import_time` enforces the budget.
+
+# Options that configure the client rather than the order; everything else
+# in the parsed namespace is passed to run_command (or the daemon) as-is
+_GLOBAL_OPTIONS = {
+    "api_key",
+    "api_secret",
+    "realnet",
+    "log_file",
+    "exchange_info_snapshot",
+    "recv_window",
+    "time_sync",
+    "socket",
+    "no_daemon",
+    "journal",
+    "command",
+}
 
 
 def load_env_from_file():
@@ -35,22 +56,161 @@ def load_env_from_file():
             break
 
 
-def get_client(api_key: Optional[str], api_secret: Optional[str], testnet: bool, log_file_path: str) -> BinanceFuturesClient:
+def get_client(
+    api_key: Optional[str],
+    api_secret: Optional[str],
+    testnet: bool,
+    log_file_path: str,
+    exchange_info_snapshot: Optional[str] = None,
+    recv_window: int = 5000,
+    time_sync: bool = False,
+    exchange_info_refresh: bool = False,
+) -> "BinanceFuturesClient":
+    from src.binance_client import BinanceFuturesClient
+
     api_key = api_key or os.environ.get("BINANCE_API_KEY")
     api_secret = api_secret or os.environ.get("BINANCE_API_SECRET")
     if not api_key or not api_secret:
         raise SystemExit("BINANCE_API_KEY and BINANCE_API_SECRET are required (env or CLI).")
-    base_url = "https://testnet.binancefuture.com" if testnet else "https://fapi.binance.com"
-    return BinanceFuturesClient(api_key, api_secret, base_url=base_url, log_file_path=log_file_path)
+    # BINANCE_BASE_URL points the CLI at a stand-in such as src/tools/mock_exchange.py
+    base_url = os.environ.get("BINANCE_BASE_URL") or ("https://testnet.binancefuture.com" if testnet else "https://fapi.binance.com")
+    return BinanceFuturesClient(
+        api_key,
+        api_secret,
+        base_url=base_url,
+        log_file_path=log_file_path,
+        exchange_info_snapshot=exchange_info_snapshot,
+        recv_window=recv_window,
+        time_sync=time_sync,
+        exchange_info_refresh=exchange_info_refresh,
+    )
+
+
+def print_response(response, title="Order Response", journal_path=None, command=None):
+    print("\n" + "="*50)
+    print(f"{title}:")
+    print("="*50)
+    if isinstance(response, dict):
+        for key, value in response.items():
+            print(f"{key}: {value}")
+    else:
+        print(response)
+    print("="*50 + "\n")
+    # Also append the response to the local order journal for later inspection
+    if journal_path:
+        from src.common.journal import OrderJournal
+
+        try:
+            OrderJournal(journal_path).record(title, response, command)
+        except Exception as e:
+            # The order has already gone through; a journal failure must not look like an order failure
+            import logging
+
+            logging.getLogger("bot").warning("journal write failed", extra={"event": "journal_error", "error": str(e)})
+
+
+def print_metrics() -> None:
+    summary = REGISTRY.summary()
+    if summary:
+        print("Timings:")
+        print(summary)
+
+
+def run_batch_command(client, args) -> None:
+    import sys
+
+    from src.batch import run_batch
+
+    journal = None
+    if args.journal:
+        from src.common.journal import OrderJournal
+
+        journal = OrderJournal(args.journal)
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    started = time.perf_counter()
+    try:
+        counts = run_batch(client, args.file, out, args.format, args.workers, journal, args.hedge)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - started
+    # Results may be on stdout, so the summary goes to stderr
+    print(
+        f"{counts['rows']} rows: {counts['accepted']} accepted, {counts['failed']} failed, "
+        f"{counts['rejected']} rejected by validation in {elapsed:.1f}s",
+        file=sys.stderr,
+    )
+    summary = REGISTRY.summary()
+    if summary:
+        print("Timings:", summary, sep="\n", file=sys.stderr)
+
+
+def print_history(args) -> None:
+    from src.common.journal import OrderJournal
+
+    journal = OrderJournal(args.journal)
+    if args.last:
+        entry = journal.last_entry()
+        if entry is None:
+            print("No recorded orders.")
+        else:
+            print(json.dumps(entry, indent=2))
+        return
+    rows, cursor = journal.orders(
+        symbol=args.symbol,
+        client_order_id=args.client_order_id,
+        order_id=args.order_id,
+        before_id=args.before,
+        limit=args.limit,
+    )
+    for row in rows:
+        ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(row["ts_ms"] / 1000))
+        print(
+            f"{row['id']:>8}  {ts}  {row['symbol'] or '-':<10} {row['side'] or '-':<4} {row['type'] or '-':<12}"
+            f" {row['status'] or '-':<16} orderId={row['order_id']} clientOrderId={row['client_order_id']}"
+        )
+    if cursor is not None:
+        print(f"-- more: add --before {cursor}")
 
 
 def main():
-    load_env_from_file()
     parser = argparse.ArgumentParser(description="CLI-based Binance USDT-M Futures Bot (Testnet by default)")
     parser.add_argument("--api-key", dest="api_key", help="Binance API key", default=None)
     parser.add_argument("--api-secret", dest="api_secret", help="Binance API secret", default=None)
     parser.add_argument("--realnet", action="store_true", help="Use realnet instead of testnet (default is testnet)")
     parser.add_argument("--log-file", dest="log_file", default="bot.log", help="Path to structured log file")
+    parser.add_argument(
+        "--exchange-info-snapshot",
+        dest="exchange_info_snapshot",
+        default=None,
+        help="Path to an exchangeInfo snapshot reused across runs while younger than the cache TTL",
+    )
+
+    parser.add_argument("--recv-window", dest="recv_window", type=int, default=5000, help="recvWindow (ms) for signed requests")
+    parser.add_argument(
+        "--time-sync",
+        dest="time_sync",
+        action="store_true",
+        help="Stamp signed requests with the estimated server time (samples /fapi/v1/time first)",
+    )
+    parser.add_argument(
+        "--socket",
+        dest="socket",
+        default=None,
+        help="Daemon Unix socket (default: $PRIMETRADE_SOCKET or primetrade-<uid>.sock in the temp dir)",
+    )
+    parser.add_argument(
+        "--journal",
+        dest="journal",
+        default=os.environ.get("PRIMETRADE_JOURNAL", "orders.db"),
+        help="SQLite order journal every result is appended to (empty string disables it)",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        dest="no_daemon",
+        action="store_true",
+        help="Always run in-process, even if a daemon is listening",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -86,6 +246,7 @@ def main():
     sp_twap.add_argument("--interval", required=True, type=float, help="Seconds between slices")
     sp_twap.add_argument("--type", default="MARKET", choices=["MARKET", "LIMIT"], help="Order type per slice")
     sp_twap.add_argument("--limit-price", type=float, default=None, help="Limit price if type=LIMIT")
+    sp_twap.add_argument("--slices-out", dest="slices_out", default=None, help="Append one JSON line per slice here as it completes; the result then holds only the summary")
     
     # OCO
     sp_oco = subparsers.add_parser("oco", help="Place an OCO (One-Cancels-the-Other) order")
@@ -96,69 +257,107 @@ def main():
     sp_oco.add_argument("--stop-price", required=True, type=float, help="Stop trigger price")
     sp_oco.add_argument("--stop-limit-price", type=float, help="Stop-limit price (defaults to stop price if not provided)")
 
+    # History
+    sp_hist = subparsers.add_parser("history", help="Show orders recorded in the local journal, newest first")
+    sp_hist.add_argument("--symbol", default=None)
+    sp_hist.add_argument("--client-order-id", dest="client_order_id", default=None)
+    sp_hist.add_argument("--order-id", dest="order_id", type=int, default=None)
+    sp_hist.add_argument("--limit", type=int, default=50, help="Orders per page")
+    sp_hist.add_argument("--before", type=int, default=None, help="Page cursor printed by the previous page")
+    sp_hist.add_argument("--last", action="store_true", help="Print the last recorded result in full")
+
+    # Batch
+    sp_batch = subparsers.add_parser("batch", help="Place orders from a CSV/JSONL file or stdin, one JSON result line per order")
+    sp_batch.add_argument("file", help="Orders file (.csv with a header row, or JSON lines); - reads stdin")
+    sp_batch.add_argument("--format", dest="format", choices=["csv", "jsonl"], default=None, help="Input format (default: from the extension, jsonl for stdin)")
+    sp_batch.add_argument("--workers", type=int, default=8, help="Orders in flight at once")
+    sp_batch.add_argument("-o", "--output", dest="output", default="-", help="Results file (default: stdout)")
+    sp_batch.add_argument("--hedge", action="store_true", help="Hedge slow submissions with a second attempt (same clientOrderId, no duplicates); best with --time-sync")
+
+    # Daemon
+    sp_serve = subparsers.add_parser("serve", help="Keep a warm client running and serve the other commands over a Unix socket")
+    sp_serve.add_argument(
+        "--market-data",
+        dest="market_data",
+        default=None,
+        help="Comma-separated symbols to follow bookTicker/markPrice for local MARKET/TWAP notional checks",
+    )
+
     args = parser.parse_args()
-    client = get_client(args.api_key, args.api_secret, not args.realnet, args.log_file)
-
-    def print_response(response, title="Order Response"):
-        print("\n" + "="*50)
-        print(f"{title}:")
-        print("="*50)
-        if isinstance(response, dict):
-            for key, value in response.items():
-                print(f"{key}: {value}")
-        else:
-            print(response)
-        print("="*50 + "\n")
-        # Also persist the last response to a file for easy inspection
+    socket_path = args.socket or default_socket_path()
+    network = os.environ.get("BINANCE_BASE_URL") or ("realnet" if args.realnet else "testnet")
+    order_args = {k: v for k, v in vars(args).items() if k not in _GLOBAL_OPTIONS}
+    if order_args.get("slices_out"):
+        # The daemon may run from another directory
+        order_args["slices_out"] = os.path.abspath(order_args["slices_out"])
+
+    if args.command == "history":
+        print_history(args)
+        return
+
+    # Explicit credentials may differ from the daemon's, so they always run in-process;
+    # batch streams its input and results, which the one-line daemon protocol does not
+    if args.command not in ("serve", "batch") and not (args.no_daemon or args.api_key or args.api_secret):
+        started = time.perf_counter()
+        # A TWAP replies only after its last slice
+        timeout = 60.0 + (args.slices * args.interval if args.command == "twap" else 0.0)
         try:
-            import json
-            with open("last_response.json", "w") as f:
-                json.dump({"title": title, "response": response}, f, indent=2)
-        except Exception:
-            pass
-
-    if args.command == "market":
-        res = place_market_order(client, args.symbol, args.side, args.quantity)
-        print_response(res, "Market Order Response")
-    elif args.command == "limit":
-        res = place_limit_order(client, args.symbol, args.side, args.quantity, args.price, time_in_force=args.tif)
-        print_response(res, "Limit Order Response")
-    elif args.command == "stop-limit":
-        res = place_stop_limit_order(
-            client,
-            args.symbol,
-            args.side,
-            args.quantity,
-            args.price,
-            args.stop_price,
-            time_in_force=args.tif,
-        )
-        print_response(res, "Stop-Limit Order Response")
-    elif args.command == "twap":
-        res = execute_twap(
-            client,
-            args.symbol,
-            args.side,
-            args.total_quantity,
-            args.slices,
-            args.interval,
-            order_type=args.type,
-            limit_price=args.limit_price,
-        )
-        print_response(res, "TWAP Strategy Response")
-    elif args.command == "oco":
-        res = place_oco_order(
-            client,
-            args.symbol,
-            args.side,
-            args.quantity,
-            args.price,
-            args.stop_price,
-            args.stop_limit_price,
-        )
-        print_response(res, "OCO Order Response")
-    else:
-        raise SystemExit("Unknown command")
+            reply = call(socket_path, args.command, order_args, network, timeout)
+        except DaemonError as e:
+            # Never fall back to running it in-process: that could place the order twice
+            raise SystemExit(str(e))
+        if reply is not None and not reply.get("mismatch"):
+            if not reply["ok"]:
+                raise SystemExit(reply["error"])
+            REGISTRY.observe("command_seconds", time.perf_counter() - started, command=args.command, via="daemon")
+            print_response(reply["response"], reply["title"], args.journal, args.command)
+            print_metrics()
+            return
+
+    load_env_from_file()
+    if args.command == "batch":
+        from src.common.logger import get_logger
+
+        # Keep stdout for the result lines: the first get_logger call fixes the handlers
+        get_logger("bot", args.log_file, stdout=False)
+    client = get_client(
+        args.api_key,
+        args.api_secret,
+        not args.realnet,
+        args.log_file,
+        args.exchange_info_snapshot,
+        recv_window=args.recv_window,
+        time_sync=args.time_sync,
+        exchange_info_refresh=args.command == "serve",
+    )
+
+    if args.command == "serve":
+        from src.daemon import DaemonRunning, serve
+
+        if args.market_data:
+            from src.common.market_data import MarketDataCache
+            from src.streams import MarketDataStream, default_stream_url
+
+            client.market_data = MarketDataCache()
+            symbols = [s.strip() for s in args.market_data.split(",") if s.strip()]
+            MarketDataStream(client.market_data, symbols, default_stream_url(client.base_url), logger=client.logger).start_in_thread()
+        try:
+            serve(client, socket_path, network)
+        except DaemonRunning as e:
+            raise SystemExit(str(e))
+        return
+
+    if args.command == "batch":
+        run_batch_command(client, args)
+        return
+
+    from src.commands import run_command
+
+    started = time.perf_counter()
+    title, res = run_command(client, args.command, order_args)
+    REGISTRY.observe("command_seconds", time.perf_counter() - started, command=args.command, via="in_process")
+    print_response(res, title, args.journal, args.command)
+    print_metrics()
 
 
 if __name__ == "__main__":
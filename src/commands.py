@@ -0,0 +1,68 @@
+from typing import Any, Dict, Tuple
+
+
+def run_command(client, command: str, a: Dict[str, Any]) -> Tuple[str, Any]:
+    """Run one CLI order command against `client`; returns (title, response).
+
+    `a` holds the subcommand's parsed arguments by argparse dest name. Shared
+    by the in-process CLI path and the daemon (src/daemon.py).
+    """
+    if command == "market":
+        from src.market_orders import place_market_order
+
+        return "Market Order Response", place_market_order(client, a["symbol"], a["side"], a["quantity"])
+    if command == "limit":
+        from src.limit_orders import place_limit_order
+
+        res = place_limit_order(client, a["symbol"], a["side"], a["quantity"], a["price"], time_in_force=a["tif"])
+        return "Limit Order Response", res
+    if command == "stop-limit":
+        from src.advanced.stop_limit import place_stop_limit_order
+
+        res = place_stop_limit_order(
+            client,
+            a["symbol"],
+            a["side"],
+            a["quantity"],
+            a["price"],
+            a["stop_price"],
+            time_in_force=a["tif"],
+        )
+        return "Stop-Limit Order Response", res
+    if command == "twap":
+        from src.advanced.twap import execute_twap
+        from src.advanced.twap_results import JsonlSliceSink
+
+        # With a slice file, results stream there and only the summary is returned
+        sink = JsonlSliceSink(a["slices_out"]) if a.get("slices_out") else None
+        try:
+            res = execute_twap(
+                client,
+                a["symbol"],
+                a["side"],
+                a["total_quantity"],
+                a["slices"],
+                a["interval"],
+                order_type=a["type"],
+                limit_price=a["limit_price"],
+                on_slice=sink,
+                keep_slices=sink is None,
+            )
+        finally:
+            if sink is not None:
+                sink.close()
+        return "TWAP Strategy Response", res
+    if command == "oco":
+        from src.advanced.oco import place_oco_order
+
+        res = place_oco_order(
+            client,
+            a["symbol"],
+            a["side"],
+            a["quantity"],
+            a["price"],
+            a["stop_price"],
+            a["stop_limit_price"],
+        )
+        return "OCO Order Response", res
+    raise ValueError(f"unknown command {command}")
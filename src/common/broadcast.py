@@ -0,0 +1,77 @@
+import queue
+import threading
+from typing import Any, List, Optional
+
+
+class Subscription:
+    """One consumer's bounded buffer; `dropped` counts events it lost by falling behind."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self.dropped = 0
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Next event, or None if nothing arrived within `timeout` seconds."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get_batch(self, timeout: Optional[float] = None, max_items: int = 100) -> List[Any]:
+        """Block for the next event, then take whatever else is already buffered (up to `max_items`)."""
+        first = self.get(timeout)
+        if first is None:
+            return []
+        batch = [first]
+        while len(batch) < max_items:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _offer(self, event: Any) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                # Evict the oldest event to make room for the newest
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+
+class Broadcaster:
+    """
+    Thread-safe fan-out of events to any number of subscribers.
+
+    `publish` never blocks: each subscriber has its own buffer of `maxsize`
+    events and a subscriber that falls behind loses its oldest events rather
+    than stalling the publisher or the other subscribers.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, maxsize: Optional[int] = None) -> Subscription:
+        sub = Subscription(maxsize or self.maxsize)
+        with self._lock:
+            self._subscribers = self._subscribers + [sub]
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not sub]
+
+    def publish(self, event: Any) -> None:
+        # Copy-on-write list: iterate without holding the lock
+        for sub in self._subscribers:
+            sub._offer(event)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
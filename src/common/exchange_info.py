@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.common.validation import SymbolRules
+
+
+Fetcher = Callable[[], Dict[str, Any]]
+
+
+class ExchangeInfoCache:
+    """
+    Thread-safe cache for `/fapi/v1/exchangeInfo`.
+
+    Holds the last good payload plus a symbol -> symbol info index so that
+    lookups are O(1), and compiles `SymbolRules` lazily per symbol. Entries
+    expire after `ttl` seconds. An optional background thread refreshes
+    ahead of expiry, and an optional on-disk snapshot serves cold starts
+    without a round-trip.
+    """
+
+    def __init__(self, ttl: float = 300.0, snapshot_path: Optional[str] = None) -> None:
+        self.ttl = ttl
+        self.snapshot_path = snapshot_path
+        self._payload: Optional[Dict[str, Any]] = None
+        self._symbols: Dict[str, Dict[str, Any]] = {}
+        self._rules: Dict[str, SymbolRules] = {}
+        self._loaded_at = 0.0  # time.monotonic() of the data currently held
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if snapshot_path:
+            self._load_snapshot(snapshot_path)
+
+    def is_fresh(self) -> bool:
+        return self._payload is not None and (time.monotonic() - self._loaded_at) < self.ttl
+
+    def current(self) -> Optional[Dict[str, Any]]:
+        """Payload held right now (possibly stale), without fetching."""
+        return self._payload
+
+    def load(self, payload: Dict[str, Any], age: float = 0.0, persist: bool = True) -> bool:
+        """Install a payload; error payloads (no `symbols`) are ignored and return False."""
+        symbols = payload.get("symbols") if isinstance(payload, dict) else None
+        if not isinstance(symbols, list):
+            return False
+        index = {s["symbol"]: s for s in symbols if "symbol" in s}
+        with self._lock:
+            self._payload = payload
+            self._symbols = index
+            self._rules = {}
+            self._loaded_at = time.monotonic() - age
+        if persist and self.snapshot_path:
+            self._write_snapshot(self.snapshot_path, payload)
+        return True
+
+    def refresh(self, fetch: Fetcher) -> Dict[str, Any]:
+        """Fetch unconditionally; on failure keep serving the previous payload."""
+        with self._refresh_lock:
+            payload = fetch()
+            if not self.load(payload) and self._payload is None:
+                return payload
+            return self._payload
+
+    def get(self, fetch: Fetcher) -> Dict[str, Any]:
+        if self.is_fresh():
+            return self._payload
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self.is_fresh():
+                return self._payload
+            payload = fetch()
+            if not self.load(payload) and self._payload is None:
+                return payload
+            return self._payload
+
+    def symbol(self, symbol: str, fetch: Optional[Fetcher] = None) -> Optional[Dict[str, Any]]:
+        """Look up one symbol; without `fetch` whatever is held is served (async callers `load` themselves)."""
+        if fetch is not None and not self.is_fresh():
+            self.get(fetch)
+        return self._symbols.get(symbol)
+
+    def rules(self, symbol: str, fetch: Optional[Fetcher] = None) -> Optional[SymbolRules]:
+        if fetch is not None and not self.is_fresh():
+            self.get(fetch)
+        rules = self._rules.get(symbol)
+        if rules is None:
+            si = self._symbols.get(symbol)
+            if si is None:
+                return None
+            # Racing threads may both compile; the results are identical
+            rules = self._rules[symbol] = SymbolRules(si)
+        return rules
+
+    def start_background_refresh(self, fetch: Fetcher, interval: Optional[float] = None) -> None:
+        """Refresh every `interval` seconds (default 80% of ttl) on a daemon thread."""
+        if self._thread is not None:
+            return
+        interval = interval if interval is not None else self.ttl * 0.8
+        self._stop.clear()
+
+        def _run() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh(fetch)
+                except Exception:
+                    # Keep serving the previous payload; the next tick retries
+                    pass
+
+        self._thread = threading.Thread(target=_run, name="exchange-info-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _load_snapshot(self, path: str) -> None:
+        try:
+            age = max(0.0, time.time() - os.path.getmtime(path))
+            with open(path, "r") as f:
+                payload = json.load(f)
+        except Exception:
+            return
+        self.load(payload, age=age, persist=False)
+
+    @staticmethod
+    def _write_snapshot(path: str, payload: Dict[str, Any]) -> None:
+        tmp = f"{path}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except Exception:
+            # A missing snapshot only costs one round-trip on the next cold start
+            pass
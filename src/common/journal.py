@@ -0,0 +1,178 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts_ms INTEGER NOT NULL,
+    title TEXT,
+    command TEXT,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entry_id INTEGER NOT NULL REFERENCES entries(id),
+    ts_ms INTEGER NOT NULL,
+    symbol TEXT,
+    side TEXT,
+    type TEXT,
+    status TEXT,
+    client_order_id TEXT,
+    order_id INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_symbol ON orders(symbol, id);
+CREATE INDEX IF NOT EXISTS orders_client_order_id ON orders(client_order_id);
+CREATE INDEX IF NOT EXISTS orders_order_id ON orders(order_id);
+CREATE INDEX IF NOT EXISTS orders_ts ON orders(ts_ms);
+"""
+
+_ORDER_COLUMNS = "id, entry_id, ts_ms, symbol, side, type, status, client_order_id, order_id, payload"
+
+
+def iter_orders(response: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every exchange order object nested in a command result (single, batch, OCO, TWAP)."""
+    if isinstance(response, dict):
+        if "orderId" in response or ("clientOrderId" in response and "symbol" in response):
+            yield response
+            return
+        for value in response.values():
+            yield from iter_orders(value)
+    elif isinstance(response, list):
+        for item in response:
+            yield from iter_orders(item)
+
+
+class OrderJournal:
+    """
+    Append-only local order history in SQLite (WAL mode).
+
+    Each recorded command result is one `entries` row holding the full
+    response; every order found in it is also a row in `orders`, indexed by
+    symbol, clientOrderId, orderId and time. Queries page by keyset
+    (`before_id`), newest first, so a page costs the same at any depth.
+    Safe to share between threads and processes.
+    """
+
+    def __init__(self, path: str = "orders.db") -> None:
+        self.path = path
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def record(self, title: str, response: Any, command: Optional[str] = None) -> int:
+        """Append a command result and the orders in it; returns the entry id."""
+        ts_ms = int(time.time() * 1000)
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "INSERT INTO entries (ts_ms, title, command, payload) VALUES (?, ?, ?, ?)",
+                (ts_ms, title, command, json.dumps(response, default=str)),
+            )
+            entry_id = cur.lastrowid
+            conn.executemany(
+                "INSERT INTO orders (entry_id, ts_ms, symbol, side, type, status, client_order_id, order_id, payload)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        entry_id,
+                        ts_ms,
+                        o.get("symbol"),
+                        o.get("side"),
+                        o.get("type"),
+                        o.get("status"),
+                        o.get("clientOrderId"),
+                        o.get("orderId"),
+                        json.dumps(o, default=str),
+                    )
+                    for o in iter_orders(response)
+                ],
+            )
+        return entry_id
+
+    def last_entry(self) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute("SELECT * FROM entries ORDER BY id DESC LIMIT 1").fetchone()
+        return _entry(row) if row is not None else None
+
+    def entries(self, before_id: Optional[int] = None, limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """One page of recorded results, newest first, plus the cursor for the next page."""
+        sql, params = "SELECT * FROM entries", []
+        if before_id is not None:
+            sql += " WHERE id < ?"
+            params.append(before_id)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        rows = [_entry(r) for r in self._conn().execute(sql, params)]
+        return rows, _next_cursor(rows, limit)
+
+    def orders(
+        self,
+        symbol: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+        order_id: Optional[int] = None,
+        since_ms: Optional[int] = None,
+        until_ms: Optional[int] = None,
+        before_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """One page of matching orders, newest first, plus the cursor (`before_id`) for the next page."""
+        where, params = [], []
+        for column, value in (("symbol", symbol), ("client_order_id", client_order_id), ("order_id", order_id)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(value)
+        if since_ms is not None:
+            where.append("ts_ms >= ?")
+            params.append(since_ms)
+        if until_ms is not None:
+            where.append("ts_ms < ?")
+            params.append(until_ms)
+        if before_id is not None:
+            where.append("id < ?")
+            params.append(before_id)
+        sql = f"SELECT {_ORDER_COLUMNS} FROM orders"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        rows = [_order(r) for r in self._conn().execute(sql, params)]
+        return rows, _next_cursor(rows, limit)
+
+
+def _entry(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "ts_ms": row["ts_ms"],
+        "title": row["title"],
+        "command": row["command"],
+        "response": json.loads(row["payload"]),
+    }
+
+
+def _order(row: sqlite3.Row) -> Dict[str, Any]:
+    out = {k: row[k] for k in row.keys() if k != "payload"}
+    out["order"] = json.loads(row["payload"])
+    return out
+
+
+def _next_cursor(rows: List[Dict[str, Any]], limit: int) -> Optional[int]:
+    return rows[-1]["id"] if len(rows) == limit else None
@@ -1,10 +1,45 @@
+import atexit
+import gzip
 import logging
+import logging.handlers
 import json
+import os
+import queue
+import random
+import shutil
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+
+# Records above this are truncated by default: the odd large response (e.g. a
+# failed request echoing exchangeInfo) must not bloat every log line
+DEFAULT_MAX_PAYLOAD_BYTES = 16 * 1024
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
 
 
 class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record.
+
+    `data` payloads whose encoding exceeds `max_payload_bytes` are truncated,
+    except for a random `payload_sample_rate` fraction kept in full.
+    """
+
+    def __init__(self, max_payload_bytes: Optional[int] = None, payload_sample_rate: float = 0.0) -> None:
+        super().__init__()
+        self.max_payload_bytes = max_payload_bytes
+        self.payload_sample_rate = payload_sample_rate
+
     def format(self, record: logging.LogRecord) -> str:
         payload: Dict[str, Any] = {
             "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
@@ -18,26 +53,85 @@ class JsonFormatter(logging.Formatter):
             payload["data"] = getattr(record, "data")
         if hasattr(record, "error"):
             payload["error"] = getattr(record, "error")
-        return json.dumps(payload)
+        # Request/response pairing for log analytics (src/tools/log_stats.py)
+        if getattr(record, "request_id", None) is not None:
+            payload["request_id"] = record.request_id
+        if getattr(record, "elapsed_ms", None) is not None:
+            payload["elapsed_ms"] = record.elapsed_ms
+        line = _dumps(payload)
+        limit = self.max_payload_bytes
+        if limit is not None and len(line) > limit and "data" in payload and random.random() >= self.payload_sample_rate:
+            data = _dumps(payload["data"])
+            payload["data"] = {"truncated": True, "bytes": len(data), "head": data[:limit]}
+            line = _dumps(payload)
+        return line
 
 
-def get_logger(name: str = "bot", log_file_path: str = "bot.log") -> logging.Logger:
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    # The stock prepare() formats in the caller's thread; formatting is the
+    # expensive part, so hand the record over untouched and let the writer do it
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def get_logger(
+    name: str = "bot",
+    log_file_path: str = "bot.log",
+    max_bytes: int = 50 * 1024 * 1024,
+    backup_count: int = 5,
+    when: Optional[str] = None,
+    compress: bool = True,
+    max_payload_bytes: Optional[int] = DEFAULT_MAX_PAYLOAD_BYTES,
+    payload_sample_rate: float = 0.0,
+    stdout: bool = True,
+) -> logging.Logger:
+    """
+    JSON logger whose records are written by a background thread.
+
+    Callers only enqueue the record; a QueueListener formats and writes it to
+    `log_file_path` (rotated by size, or by time if `when` is set, with gzip
+    compression of rotated files) and to stdout. Records longer than
+    `max_payload_bytes` get their `data` truncated (None logs everything).
+    Options apply on the first call for a given `name`.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
     if not logger.handlers:
+        formatter = JsonFormatter(max_payload_bytes, payload_sample_rate)
+
         # File handler
-        fh = logging.FileHandler(log_file_path)
+        if when:
+            fh: logging.Handler = logging.handlers.TimedRotatingFileHandler(log_file_path, when=when, backupCount=backup_count)
+        else:
+            fh = logging.handlers.RotatingFileHandler(log_file_path, maxBytes=max_bytes, backupCount=backup_count)
+        if compress:
+            fh.namer = lambda default_name: default_name + ".gz"
+            fh.rotator = _gzip_rotator
         fh.setLevel(logging.INFO)
-        fh.setFormatter(JsonFormatter())
+        fh.setFormatter(formatter)
+        handlers = [fh]
 
         # Stdout handler
-        sh = logging.StreamHandler(sys.stdout)
-        sh.setLevel(logging.INFO)
-        sh.setFormatter(JsonFormatter())
+        if stdout:
+            sh = logging.StreamHandler(sys.stdout)
+            sh.setLevel(logging.INFO)
+            sh.setFormatter(formatter)
+            handlers.append(sh)
+
+        q: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(q, *handlers, respect_handler_level=True)
+        listener.start()
+        # Drain what is still queued when the process exits
+        atexit.register(listener.stop)
 
-        logger.addHandler(fh)
-        logger.addHandler(sh)
+        logger.addHandler(_RecordQueueHandler(q))
         logger.propagate = False
 
-    return logger
\ No newline at end of file
+    return logger
@@ -0,0 +1,68 @@
+import time
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+
+
+class MarketDataCache:
+    """
+    Latest best bid/ask and mark price per symbol, fed from the bookTicker
+    and markPrice WebSocket streams (see `MarketDataStream`).
+
+    Prices are kept as the strings the stream sent and only turned into
+    Decimals when read. A value older than `max_age_sec` (local receive time)
+    is treated as missing, so a dead stream never validates orders against an
+    old price. Attach to a client as `client.market_data`.
+    """
+
+    def __init__(self, max_age_sec: float = 5.0) -> None:
+        self.max_age_sec = max_age_sec
+        # symbol -> (bid, ask, received_at) / (mark, received_at); whole-tuple
+        # replacement keeps readers consistent without a lock
+        self._book: Dict[str, Tuple[str, str, float]] = {}
+        self._mark: Dict[str, Tuple[str, float]] = {}
+
+    def update_book(self, symbol: str, bid: str, ask: str, received_at: Optional[float] = None) -> None:
+        self._book[symbol] = (bid, ask, time.monotonic() if received_at is None else received_at)
+
+    def update_mark(self, symbol: str, mark: str, received_at: Optional[float] = None) -> None:
+        self._mark[symbol] = (mark, time.monotonic() if received_at is None else received_at)
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply one stream message (raw or combined-stream `{"stream", "data"}` form)."""
+        data = event.get("data", event)
+        kind = data.get("e")
+        if kind == "bookTicker":
+            self.update_book(data["s"], data["b"], data["a"])
+        elif kind == "markPriceUpdate":
+            self.update_mark(data["s"], data["p"])
+
+    def _fresh(self, received_at: float) -> bool:
+        return time.monotonic() - received_at <= self.max_age_sec
+
+    def book(self, symbol: str) -> Optional[Tuple[Decimal, Decimal]]:
+        """Fresh (bid, ask) or None."""
+        entry = self._book.get(symbol)
+        if entry is None or not self._fresh(entry[2]):
+            return None
+        return Decimal(entry[0]), Decimal(entry[1])
+
+    def mark_price(self, symbol: str) -> Optional[Decimal]:
+        entry = self._mark.get(symbol)
+        if entry is None or not self._fresh(entry[1]):
+            return None
+        return Decimal(entry[0])
+
+    def reference_price(self, symbol: str, side: str) -> Optional[Decimal]:
+        """Price a MARKET order on `side` would take: the ask for BUY, the bid for SELL, else the mark price."""
+        book = self.book(symbol)
+        if book is not None:
+            price = book[1] if side == "BUY" else book[0]
+            if price > 0:
+                return price
+        return self.mark_price(symbol)
+
+
+def reference_price(client, symbol: str, side: str) -> Optional[Decimal]:
+    """Fresh local price for a MARKET notional check, or None if the client has no (fresh) market data."""
+    cache = getattr(client, "market_data", None)
+    return cache.reference_price(symbol, side) if cache is not None else None
@@ -0,0 +1,220 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Log-linear buckets over integer microseconds, HdrHistogram style: values
+# below 2 * _HALF get one bucket each, above that every power of two is split
+# into _HALF buckets, so any recorded value is off by less than 1/_HALF (~1.6%)
+_HALF = 64
+_BUCKETS = 2 * _HALF + _HALF * 40  # up to 2**47 us (~4.5 years); larger values land in the last bucket
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def _bucket(us: int) -> int:
+    if us < 2 * _HALF:
+        return us if us > 0 else 0
+    shift = us.bit_length() - 7  # 7 == log2(2 * _HALF)
+    return min(_HALF * shift + (us >> shift), _BUCKETS - 1)
+
+
+def _bucket_value(index: int) -> int:
+    """Highest value (us) that lands in bucket `index`."""
+    if index < 2 * _HALF:
+        return index
+    shift = index // _HALF - 1
+    return ((index - _HALF * shift + 1) << shift) - 1
+
+
+class Histogram:
+    """
+    Fixed-memory latency histogram with ~1.6% relative precision.
+
+    Recording is one bucket increment under a lock; quantiles are computed on
+    read by walking the buckets.
+    """
+
+    __slots__ = ("counts", "count", "sum", "max", "_lock")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        i = _bucket(int(seconds * 1e6))
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def merge(self, other: "Histogram") -> None:
+        """Add `other`'s samples (e.g. a histogram built in another process)."""
+        with other._lock:
+            counts, count, total, top = list(other.counts), other.count, other.sum, other.max
+        with self._lock:
+            for i, c in enumerate(counts):
+                if c:
+                    self.counts[i] += c
+            self.count += count
+            self.sum += total
+            if top > self.max:
+                self.max = top
+
+    # Picklable without the lock, so worker processes can return histograms
+    def __getstate__(self):
+        return self.counts, self.count, self.sum, self.max
+
+    def __setstate__(self, state) -> None:
+        self.counts, self.count, self.sum, self.max = state
+        self._lock = threading.Lock()
+
+    def quantiles(self, qs: Iterable[float] = QUANTILES) -> Dict[float, float]:
+        """Seconds at each quantile (0 for an empty histogram)."""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.count
+            top = self.max
+        out: Dict[float, float] = {}
+        targets = sorted(qs)
+        seen = 0
+        t = 0
+        for i, c in enumerate(counts):
+            if not c:
+                continue
+            seen += c
+            while t < len(targets) and seen >= targets[t] * total:
+                out[targets[t]] = min(_bucket_value(i) / 1e6, top)
+                t += 1
+            if t == len(targets):
+                break
+        for q in targets[t:]:
+            out[q] = top
+        return out
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class MetricsRegistry:
+    """
+    Named, labelled latency histograms.
+
+    `observe` records one duration; `observe_stages` records several stages of
+    one operation under a shared label set. `render_prometheus` exports them
+    as summaries (quantiles, _sum, _count) plus a _max gauge.
+    """
+
+    def __init__(self, namespace: str = "primetrade") -> None:
+        self.namespace = namespace
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def histogram(self, name: str, labels: Labels) -> Histogram:
+        key = (name, labels)
+        h = self._histograms.get(key)
+        if h is None:
+            with self._lock:
+                h = self._histograms.setdefault(key, Histogram())
+        return h
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        self.histogram(name, tuple(sorted(labels.items()))).record(seconds)
+
+    def observe_stages(self, name: str, stages: Iterable[Tuple[str, float]], **labels: str) -> None:
+        base = tuple(sorted(labels.items()))
+        for stage, seconds in stages:
+            self.histogram(name, tuple(sorted(base + (("stage", stage),)))).record(seconds)
+
+    def stopwatch(self, name: str, **labels: str) -> "Stopwatch":
+        return Stopwatch(self, name, tuple(sorted(labels.items())))
+
+    def snapshot(self) -> List[Tuple[str, Labels, Histogram]]:
+        with self._lock:
+            return [(name, labels, h) for (name, labels), h in sorted(self._histograms.items(), key=lambda kv: kv[0])]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+        described = set()
+        snapshot = self.snapshot()
+        for name, labels, h in snapshot:
+            full = f"{self.namespace}_{name}"
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {full} {self._help.get(name, name)}")
+                lines.append(f"# TYPE {full} summary")
+            for q, v in h.quantiles().items():
+                lines.append(f"{full}{_labels(labels + (('quantile', str(q)),))} {v:.6f}")
+            lines.append(f"{full}_sum{_labels(labels)} {h.sum:.6f}")
+            lines.append(f"{full}_count{_labels(labels)} {h.count}")
+        # A summary family only has quantiles, _sum and _count: the max is its own gauge
+        described.clear()
+        for name, labels, h in snapshot:
+            full = f"{self.namespace}_{name}_max"
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {full} Largest observed value of {self.namespace}_{name}")
+                lines.append(f"# TYPE {full} gauge")
+            lines.append(f"{full}{_labels(labels)} {h.max:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """Human-readable table (milliseconds), e.g. for the end of a CLI run."""
+        rows = []
+        for name, labels, h in self.snapshot():
+            if not h.count:
+                continue
+            q = h.quantiles((0.5, 0.99))
+            label = ",".join(f"{k}={v}" for k, v in labels)
+            rows.append(f"{name}{{{label}}}  n={h.count}  p50={q[0.5] * 1e3:.2f}ms  p99={q[0.99] * 1e3:.2f}ms  max={h.max * 1e3:.2f}ms")
+        return "\n".join(rows)
+
+
+class Stopwatch:
+    """Times consecutive stages of one operation: call `lap(stage)` at the end of each."""
+
+    __slots__ = ("_registry", "_name", "_labels", "_t")
+
+    def __init__(self, registry: MetricsRegistry, name: str, labels: Labels) -> None:
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+        self._t = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self._registry.histogram(self._name, tuple(sorted(self._labels + (("stage", stage),)))).record(now - self._t)
+        self._t = now
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+# Process-wide registry used by the clients and strategies unless one is passed in
+REGISTRY = MetricsRegistry()
+REGISTRY.describe("request_stage_seconds", "REST request time per endpoint and stage (throttle, signing, network, parse)")
+REGISTRY.describe("strategy_stage_seconds", "Order placement time per strategy and stage (exchange_info, validation, submit)")
+REGISTRY.describe("command_seconds", "End-to-end CLI command time, in-process or via the daemon")
+
+
+def stopwatch(strategy: str, registry: Optional[MetricsRegistry] = None) -> Stopwatch:
+    return (registry or REGISTRY).stopwatch("strategy_stage_seconds", strategy=strategy)
@@ -0,0 +1,150 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+# (method, path) -> (request weight, order count); anything else costs (1, 0)
+ENDPOINT_WEIGHTS: Dict[Tuple[str, str], Tuple[int, int]] = {
+    ("GET", "/v1/exchangeInfo"): (1, 0),
+    ("GET", "/v1/time"): (1, 0),
+    ("POST", "/v1/order"): (0, 1),
+    ("GET", "/v1/order"): (1, 0),
+    ("DELETE", "/v1/order"): (1, 0),
+    ("POST", "/v1/batchOrders"): (5, 5),
+    ("DELETE", "/v1/batchOrders"): (1, 0),
+}
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised instead of sending a request that would have to wait longer than `max_wait`."""
+
+
+class TokenBucket:
+    """
+    Continuous-refill bucket for one exchange limit (`limit` per `window` seconds).
+
+    Reservations may drive the balance negative; the deficit divided by the
+    refill rate is how long the caller must wait before sending.
+    """
+
+    def __init__(self, limit: int, window: float, headroom: float = 0.9) -> None:
+        self.limit = limit
+        self.window = window
+        self.capacity = limit * headroom
+        self.rate = self.capacity / window
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, n: float, now: float) -> float:
+        self._refill(now)
+        self.tokens -= n
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def refund(self, n: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + n)
+
+    def observe(self, used: float, now: float) -> None:
+        """Server reports `used` in its current window: never believe we have more left than that."""
+        self._refill(now)
+        self.tokens = min(self.tokens, self.capacity - used)
+
+    def utilization(self, now: float) -> float:
+        self._refill(now)
+        return max(0.0, (self.capacity - self.tokens) / self.capacity)
+
+
+class RateLimitGovernor:
+    """
+    Client-side throttle for the Futures REST limits, shared by every caller
+    of a client (pass the same instance to several clients to share it
+    further).
+
+    Keeps a token bucket per limit, charges each request its endpoint weight
+    before it is sent, and tightens the buckets from the X-MBX-USED-WEIGHT-1M
+    and X-MBX-ORDER-COUNT-* response headers. A request that would need to
+    wait more than `max_wait` is shed with `RateLimitExceeded` instead of
+    risking a 429/418; after a 429/418 everything waits out Retry-After.
+    """
+
+    def __init__(
+        self,
+        weight_per_min: int = 2400,
+        orders_per_10s: int = 300,
+        orders_per_min: int = 1200,
+        headroom: float = 0.9,
+        max_wait: float = 5.0,
+    ) -> None:
+        self.max_wait = max_wait
+        self.weight = TokenBucket(weight_per_min, 60.0, headroom)
+        self.orders_10s = TokenBucket(orders_per_10s, 10.0, headroom)
+        self.orders_1m = TokenBucket(orders_per_min, 60.0, headroom)
+        self._banned_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, method: str, path: str) -> float:
+        """Charge one request and return how long to wait before sending it."""
+        weight, orders = ENDPOINT_WEIGHTS.get((method, path), (1, 0))
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._banned_until - now, self.weight.reserve(weight, now))
+            if orders:
+                wait = max(wait, self.orders_10s.reserve(orders, now), self.orders_1m.reserve(orders, now))
+            if wait > self.max_wait:
+                self.weight.refund(weight)
+                if orders:
+                    self.orders_10s.refund(orders)
+                    self.orders_1m.refund(orders)
+                raise RateLimitExceeded(f"{method} {path} would wait {wait:.1f}s for rate limits")
+        return wait
+
+    def acquire(self, method: str, path: str) -> None:
+        wait = self.reserve(method, path)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, method: str, path: str) -> None:
+        # Imported here so sync-only callers (the CLI) do not pay for asyncio
+        import asyncio
+
+        wait = self.reserve(method, path)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def reconcile(self, status: int, headers: Any) -> None:
+        """Feed back a response's status and headers (any case-insensitive mapping)."""
+        with self._lock:
+            now = time.monotonic()
+            used = headers.get("X-MBX-USED-WEIGHT-1M")
+            if used is not None:
+                self.weight.observe(float(used), now)
+            count = headers.get("X-MBX-ORDER-COUNT-10S")
+            if count is not None:
+                self.orders_10s.observe(float(count), now)
+            count = headers.get("X-MBX-ORDER-COUNT-1M")
+            if count is not None:
+                self.orders_1m.observe(float(count), now)
+            if status in (418, 429):
+                retry_after = _float(headers.get("Retry-After"), 60.0)
+                self._banned_until = max(self._banned_until, now + retry_after)
+
+    def utilization(self) -> Dict[str, float]:
+        """Fraction of each limit (after headroom) in use, above 1.0 while requests are queued; plus any remaining ban."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "weight_1m": self.weight.utilization(now),
+                "orders_10s": self.orders_10s.utilization(now),
+                "orders_1m": self.orders_1m.utilization(now),
+                "banned_for_sec": max(0.0, self._banned_until - now),
+            }
+
+
+def _float(value: Optional[str], default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,53 @@
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class ServerClock:
+    """
+    Estimate of the exchange clock relative to the local one.
+
+    Fed with (t0, server_time, t1) samples from `/fapi/v1/time`, all in ms,
+    where t0/t1 are local wall-clock times around the request. Each sample
+    gives rtt = t1 - t0 and offset = server_time - (t0 + t1) / 2; samples
+    whose rtt is well above the fastest one are discarded (their midpoint is
+    unreliable) and the offset is the median of the rest.
+    """
+
+    def __init__(self, samples: int = 5, refresh_sec: float = 300.0, max_rtt_factor: float = 1.5) -> None:
+        self.samples = samples
+        self.refresh_sec = refresh_sec
+        self.max_rtt_factor = max_rtt_factor
+        self.offset_ms = 0.0
+        self.rtt_ms: Optional[float] = None
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def stale(self) -> bool:
+        synced = self._synced_at
+        return synced is None or time.monotonic() - synced > self.refresh_sec
+
+    def invalidate(self) -> None:
+        """Force a resync before the next signed request (e.g. after a -1021 rejection)."""
+        self._synced_at = None
+
+    def update(self, samples: List[Tuple[float, float, float]]) -> bool:
+        measured = sorted((t1 - t0, server - (t0 + t1) / 2) for t0, server, t1 in samples if t1 >= t0)
+        if not measured:
+            # Keep the previous offset and retry after the next refresh interval
+            self._synced_at = time.monotonic()
+            return False
+        cutoff = measured[0][0] * self.max_rtt_factor + 1.0
+        kept = [m for m in measured if m[0] <= cutoff]
+        offsets = sorted(off for _, off in kept)
+        with self._lock:
+            self.offset_ms = offsets[len(offsets) // 2]
+            self.rtt_ms = kept[0][0]
+            self._synced_at = time.monotonic()
+        return True
+
+    def now_ms(self) -> int:
+        return int(time.time() * 1000 + self.offset_ms)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        return {"offset_ms": self.offset_ms, "rtt_ms": self.rtt_ms}
@@ -1,5 +1,5 @@
-from decimal import Decimal, ROUND_DOWN
-from typing import Any, Dict, Optional
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN
+from typing import Any, Dict, Optional, Tuple
 
 
 def _d(x: Any) -> Decimal:
@@ -68,10 +68,266 @@ def validate_price(symbol_info: Dict[str, Any], price: float) -> Decimal:
     return p
 
 
+def _min_notional(symbol_info: Dict[str, Any]) -> Decimal:
+    # Futures may expose NOTIONAL or MIN_NOTIONAL; USD-M futures put the value
+    # under "notional", spot-style filters under "minNotional"
+    for f in symbol_info.get("filters", []):
+        if f.get("filterType") in {"NOTIONAL", "MIN_NOTIONAL"}:
+            return _d(f.get("notional", f.get("minNotional", "0")))
+    return Decimal(0)
+
+
 def validate_notional(symbol_info: Dict[str, Any], price: Decimal, qty: Decimal) -> None:
-    # Futures may expose NOTIONAL or MIN_NOTIONAL
-    notional_filters = [f for f in symbol_info.get("filters", []) if f.get("filterType") in {"NOTIONAL", "MIN_NOTIONAL"}]
-    if notional_filters:
-        min_notional = _d(notional_filters[0].get("minNotional", "0"))
-        if min_notional > 0 and (price * qty) < min_notional:
-            raise ValueError(f"notional {price*qty} below minNotional {min_notional}")
\ No newline at end of file
+    min_notional = _min_notional(symbol_info)
+    if min_notional > 0 and (price * qty) < min_notional:
+        raise ValueError(f"notional {price*qty} below minNotional {min_notional}")
+
+
+def _to_units(value: Any, scale: int) -> Optional[int]:
+    """Positive plain decimal -> integer units at `scale` decimals (truncated).
+
+    Returns None for anything the Decimal path must handle (negatives, zero,
+    exponent notation, nan/inf) so callers can fall back to it.
+    """
+    s = value if isinstance(value, str) else str(value)
+    if not s.replace(".", "", 1).isdigit():
+        return None
+    ip, _, fp = s.partition(".")
+    units = int((ip or "0") + (fp + "0" * scale)[:scale])
+    if units == 0 and not s.strip("0."):
+        return None
+    return units
+
+
+_MAX_UNITS = 10 ** 27
+
+
+class _StepFilter:
+    """LOT_SIZE / PRICE_FILTER with step, min and max pre-scaled to integers at `scale` decimals."""
+
+    __slots__ = ("scale", "places", "drop", "step", "min", "max", "min_str", "max_str")
+
+    def __init__(self, f: Dict[str, Any], step_key: str, min_key: str, max_key: str) -> None:
+        step = _d(f.get(step_key, "0"))
+        lo = _d(f.get(min_key, "0"))
+        hi = _d(f.get(max_key, "0"))
+        self.places = max(0, -step.as_tuple().exponent)
+        self.scale = max(self.places, -lo.as_tuple().exponent, -hi.as_tuple().exponent)
+        unit = Decimal(10) ** self.scale
+        self.drop = 10 ** (self.scale - self.places)
+        self.step = int(step * unit)
+        self.min = int(lo * unit)
+        self.max = int(hi * unit)
+        self.min_str = str(lo)
+        self.max_str = str(hi)
+
+    def floor(self, value: Any) -> Optional[Tuple[int, Decimal]]:
+        """(units at `scale`, Decimal at step precision) rounded down to step, or None to fall back."""
+        units = _to_units(value, self.scale)
+        # Beyond the default 28-digit context the Decimal path raises; let it
+        if units is None or units >= _MAX_UNITS:
+            return None
+        units -= units % self.step
+        return units, Decimal(units // self.drop).scaleb(-self.places)
+
+
+def _step_filter(symbol_info: Dict[str, Any], ftype: str, step_key: str, min_key: str, max_key: str) -> Optional[_StepFilter]:
+    f = _get_filter(symbol_info, ftype)
+    if not f:
+        return None
+    try:
+        sf = _StepFilter(f, step_key, min_key, max_key)
+    except Exception:
+        # Unusual filter values (nan, exponents): the Decimal path handles them
+        return None
+    return sf if sf.step > 0 else None
+
+
+class SymbolRules:
+    """
+    Validation rules for one symbol, compiled once from exchangeInfo.
+
+    `validate_qty`, `validate_price` and `validate_notional` return exactly
+    what the module-level functions return for the same symbol info, but
+    round and compare with pre-scaled integers instead of re-walking the
+    filter list and rebuilding Decimals on every call. Inputs the fast path
+    does not cover fall back to the module-level functions.
+    """
+
+    __slots__ = ("symbol", "info", "lot", "price", "min_notional")
+
+    def __init__(self, symbol_info: Dict[str, Any]) -> None:
+        self.symbol = symbol_info.get("symbol")
+        self.info = symbol_info
+        self.lot = _step_filter(symbol_info, "LOT_SIZE", "stepSize", "minQty", "maxQty")
+        self.price = _step_filter(symbol_info, "PRICE_FILTER", "tickSize", "minPrice", "maxPrice")
+        self.min_notional = _min_notional(symbol_info)
+
+    def validate_qty(self, quantity: float) -> Decimal:
+        lot = self.lot
+        r = lot.floor(quantity) if lot else None
+        if r is None:
+            return validate_qty(self.info, quantity)
+        units, qty = r
+        if units < lot.min:
+            raise ValueError(f"quantity {qty} below minQty {lot.min_str}")
+        if lot.max > 0 and units > lot.max:
+            raise ValueError(f"quantity {qty} above maxQty {lot.max_str}")
+        return qty
+
+    def validate_price(self, price: float) -> Decimal:
+        pf = self.price
+        r = pf.floor(price) if pf else None
+        if r is None:
+            return validate_price(self.info, price)
+        units, p = r
+        if pf.min > 0 and units < pf.min:
+            raise ValueError(f"price {p} below minPrice {pf.min_str}")
+        if pf.max > 0 and units > pf.max:
+            raise ValueError(f"price {p} above maxPrice {pf.max_str}")
+        return p
+
+    def validate_notional(self, price: Decimal, qty: Decimal) -> None:
+        if self.min_notional > 0 and (price * qty) < self.min_notional:
+            raise ValueError(f"notional {price*qty} below minNotional {self.min_notional}")
+
+
+class BulkValidation:
+    """
+    Result of `validate_bulk`.
+
+    `prices` / `quantities` hold the rounded values as float64 (nan where the
+    row is rejected), `rejected` is a boolean mask and `reasons[i]` is the
+    error message the scalar functions raise for row i (None if accepted).
+    Use `price_str` / `qty_str` for the exact order strings.
+    """
+
+    __slots__ = ("prices", "quantities", "rejected", "reasons", "_price", "_qty")
+
+    def __init__(self, prices, quantities, rejected, reasons, price, qty) -> None:
+        self.prices = prices
+        self.quantities = quantities
+        self.rejected = rejected
+        self.reasons = reasons
+        self._price = price
+        self._qty = qty
+
+    def price_str(self, i: int) -> str:
+        return _bulk_str(self._price, i)
+
+    def qty_str(self, i: int) -> str:
+        return _bulk_str(self._qty, i)
+
+    def accepted(self):
+        """Yield (index, price_str, qty_str) for every accepted row."""
+        for i in range(len(self.reasons)):
+            if self.reasons[i] is None:
+                yield i, self.price_str(i), self.qty_str(i)
+
+
+def _bulk_str(col: Tuple[Any, int, Dict[int, Decimal]], i: int) -> str:
+    units, places, exact = col
+    d = exact.get(i)
+    if d is None:
+        d = Decimal(int(units[i])).scaleb(-places)
+    return str(d)
+
+
+def _bulk_round(np: Any, sf: Optional[_StepFilter], values: Any, scalar: Any) -> Tuple[Any, int, Dict[int, Decimal], Dict[int, str]]:
+    """Round one column to its step with float->integer tricks; returns (units, places, exact, reasons).
+
+    Rows the vectorized path cannot prove exact (non-positive, non-finite,
+    too large, no usable filter) or that fail min/max go through `scalar`,
+    so results and messages always match the scalar validators.
+    """
+    n = values.shape[0]
+    exact: Dict[int, Decimal] = {}
+    reasons: Dict[int, str] = {}
+    if sf is None or sf.scale > 22:
+        units = np.zeros(n, dtype=np.int64)
+        places = 0
+        slow = np.ones(n, dtype=bool)
+    else:
+        unit = 10.0 ** sf.scale  # exact in float64 up to 1e22
+        with np.errstate(invalid="ignore", over="ignore"):
+            y = values * unit
+            fast = np.isfinite(y) & (values > 0) & (y < 2.0 ** 52)
+            r = np.rint(np.where(fast, y, 0.0))
+            # r / unit is the float nearest r units; a value below it has a
+            # shortest repr below r units, so floor lands on r - 1
+            r = np.where(values < r / unit, r - 1, r)
+        units = r.astype(np.int64)
+        units -= units % sf.step
+        bad = (units < sf.min) | ((units > sf.max) if sf.max > 0 else False)
+        slow = ~fast | bad
+        units //= sf.drop
+        places = sf.places
+    for i in np.flatnonzero(slow).tolist():
+        try:
+            exact[i] = scalar(float(values[i]))
+        except Exception as e:
+            reasons[i] = str(e)
+    return units, places, exact, reasons
+
+
+def validate_bulk(rules: SymbolRules, prices: Any, quantities: Any) -> BulkValidation:
+    """
+    Validate a ladder of LIMIT orders for one symbol in a few array passes.
+
+    `prices` and `quantities` are 1-D array-likes of equal length. Each row is
+    checked in the same order as the scalar path (quantity, price, notional)
+    and yields exactly what `rules.validate_qty` / `validate_price` /
+    `validate_notional` would produce for it.
+    """
+    import numpy as np
+
+    prices = np.asarray(prices, dtype=np.float64)
+    quantities = np.asarray(quantities, dtype=np.float64)
+    if prices.ndim != 1 or prices.shape != quantities.shape:
+        raise ValueError("prices and quantities must be 1-D arrays of the same length")
+    n = prices.shape[0]
+
+    q_units, q_places, q_exact, q_reasons = _bulk_round(np, rules.lot, quantities, rules.validate_qty)
+    p_units, p_places, p_exact, p_reasons = _bulk_round(np, rules.price, prices, rules.validate_price)
+
+    reasons: list = [None] * n
+    for i, msg in p_reasons.items():
+        reasons[i] = msg
+    for i, msg in q_reasons.items():
+        reasons[i] = msg  # quantity is validated first, so its message wins
+
+    mn = rules.min_notional
+    if mn > 0:
+        # product < minNotional  <=>  product units < ceil(minNotional * 10^places)
+        threshold = int((mn.scaleb(p_places + q_places)).to_integral_value(rounding=ROUND_CEILING))
+        big = float(p_units.max(initial=0)) * float(q_units.max(initial=0)) >= 2.0 ** 62
+        if big:
+            notional = p_units.astype(object) * q_units.astype(object)
+        else:
+            notional = p_units * q_units
+        low = np.flatnonzero(notional < threshold).tolist()
+        slow = set(low) | set(p_exact) | set(q_exact)
+        for i in slow:
+            if reasons[i] is not None:
+                continue
+            p = p_exact.get(i)
+            if p is None:
+                p = Decimal(int(p_units[i])).scaleb(-p_places)
+            q = q_exact.get(i)
+            if q is None:
+                q = Decimal(int(q_units[i])).scaleb(-q_places)
+            try:
+                rules.validate_notional(p, q)
+            except ValueError as e:
+                reasons[i] = str(e)
+
+    rejected = np.fromiter((r is not None for r in reasons), dtype=bool, count=n)
+    price_out = p_units / 10.0 ** p_places
+    qty_out = q_units / 10.0 ** q_places
+    for i, d in p_exact.items():
+        price_out[i] = float(d)
+    for i, d in q_exact.items():
+        qty_out[i] = float(d)
+    price_out[rejected] = np.nan
+    qty_out[rejected] = np.nan
+    return BulkValidation(price_out, qty_out, rejected, reasons, (p_units, p_places, p_exact), (q_units, q_places, q_exact))
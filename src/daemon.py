@@ -0,0 +1,135 @@
+import json
+import os
+import socket
+import socketserver
+import tempfile
+from typing import Any, Dict, Optional
+
+from src.commands import run_command
+
+
+def default_socket_path() -> str:
+    path = os.environ.get("PRIMETRADE_SOCKET")
+    if path:
+        return path
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"primetrade-{user}.sock")
+
+
+class DaemonRunning(RuntimeError):
+    """Another daemon already answers on the socket path."""
+
+
+class DaemonError(RuntimeError):
+    """A command reached the daemon but no reply came back; it may have run."""
+
+
+def _claim_socket(socket_path: str) -> None:
+    # Only a socket nobody listens on is stale; never unlink a live daemon's socket
+    if not hasattr(socket, "AF_UNIX"):
+        return
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except FileNotFoundError:
+        return
+    except ConnectionRefusedError:
+        os.remove(socket_path)
+        return
+    finally:
+        sock.close()
+    raise DaemonRunning(f"a daemon is already listening on {socket_path}")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    # One JSON request per line, one JSON reply per line
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                req = json.loads(line)
+                reply = self.server.dispatch(req)
+            except Exception as e:
+                reply = {"ok": False, "error": f"bad request: {e}"}
+            self.wfile.write(json.dumps(reply, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class OrderDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Resident process holding a warm client (connection pool, exchangeInfo
+    cache, SymbolRules) that serves CLI commands over a Unix socket.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, client, socket_path: str, network: str) -> None:
+        self.client = client
+        self.network = network
+        self.socket_path = socket_path
+        _claim_socket(socket_path)
+        # Created owner-only from the start, not chmod-ed after other users could connect
+        umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, _Handler)
+        finally:
+            os.umask(umask)
+
+    def dispatch(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        if req.get("network") != self.network:
+            return {"ok": False, "mismatch": True, "error": f"daemon serves {self.network}"}
+        try:
+            title, response = run_command(self.client, req["command"], req.get("args") or {})
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "title": title, "response": response}
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.remove(self.socket_path)
+        except OSError:
+            pass
+
+
+def serve(client, socket_path: str, network: str) -> None:
+    """Warm up `client` and serve until interrupted; DaemonRunning if one already listens on `socket_path`."""
+    _claim_socket(socket_path)
+    client.exchange_info()
+    if client.clock is not None:
+        client.sync_time()
+    server = OrderDaemon(client, socket_path, network)
+    client.logger.info("daemon listening", extra={"event": "daemon_start", "data": {"socket": socket_path, "network": network}})
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        client.close()
+
+
+def call(socket_path: str, command: str, args: Dict[str, Any], network: str, timeout: float = 60.0) -> Optional[Dict[str, Any]]:
+    """
+    Send one command to a running daemon; None if no daemon is listening.
+    Once connected the command may have run, so a missing reply (EOF, error
+    or nothing within `timeout` seconds) raises DaemonError instead.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    try:
+        with sock, sock.makefile("rwb") as f:
+            f.write(json.dumps({"command": command, "args": args, "network": network}).encode() + b"\n")
+            f.flush()
+            line = f.readline()
+    except OSError as e:
+        raise DaemonError(f"daemon did not reply ({type(e).__name__}: {e}); the order may have been placed, check before retrying")
+    if not line:
+        raise DaemonError("daemon closed the connection without replying; the order may have been placed, check before retrying")
+    return json.loads(line)
@@ -1,21 +1,20 @@
 from typing import Any, Dict
 
-from src.common.validation import get_symbol_info, validate_side, validate_qty, validate_price, validate_notional
+from src.common.metrics import stopwatch
+from src.common.validation import validate_side
 
 
-def place_limit_order(client, symbol: str, side: str, quantity: float, price: float, time_in_force: str = "GTC") -> Dict[str, Any]:
-    """Place a LIMIT order on USDT-M Futures."""
-    exi = client.exchange_info()
-    si = get_symbol_info(exi, symbol)
-    if not si:
+def limit_order_params(rules, symbol: str, side: str, quantity: float, price: float, time_in_force: str = "GTC") -> Dict[str, Any]:
+    """Validate and build the LIMIT order params (shared by the sync and async paths)."""
+    if not rules:
         raise ValueError(f"symbol {symbol} not found in exchangeInfo")
 
     validate_side(side)
-    qty = validate_qty(si, quantity)
-    p = validate_price(si, price)
-    validate_notional(si, p, qty)
+    qty = rules.validate_qty(quantity)
+    p = rules.validate_price(price)
+    rules.validate_notional(p, qty)
 
-    params = {
+    return {
         "symbol": symbol,
         "side": side,
         "type": "LIMIT",
@@ -23,4 +22,27 @@ def place_limit_order(client, symbol: str, side: str, quantity: float, price: fl
         "quantity": str(qty),
         "price": str(p),
     }
-    return client.place_order(params)
\ No newline at end of file
+
+
+def place_limit_order(client, symbol: str, side: str, quantity: float, price: float, time_in_force: str = "GTC") -> Dict[str, Any]:
+    """Place a LIMIT order on USDT-M Futures."""
+    sw = stopwatch("limit", getattr(client, "metrics", None))
+    rules = client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = limit_order_params(rules, symbol, side, quantity, price, time_in_force)
+    sw.lap("validation")
+    res = client.place_order(params)
+    sw.lap("submit")
+    return res
+
+
+async def place_limit_order_async(client, symbol: str, side: str, quantity: float, price: float, time_in_force: str = "GTC") -> Dict[str, Any]:
+    """Place a LIMIT order through an `AsyncBinanceFuturesClient`."""
+    sw = stopwatch("limit", getattr(client, "metrics", None))
+    rules = await client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = limit_order_params(rules, symbol, side, quantity, price, time_in_force)
+    sw.lap("validation")
+    res = await client.place_order(params)
+    sw.lap("submit")
+    return res
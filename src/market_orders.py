@@ -1,23 +1,54 @@
-from typing import Any, Dict
+from decimal import Decimal
+from typing import Any, Dict, Optional
 
-from src.common.validation import get_symbol_info, validate_side, validate_qty, validate_notional
+from src.common.market_data import reference_price
+from src.common.metrics import stopwatch
+from src.common.validation import validate_side
 
 
-def place_market_order(client, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
-    """Place a MARKET order on USDT-M Futures."""
-    exi = client.exchange_info()
-    si = get_symbol_info(exi, symbol)
-    if not si:
+def market_order_params(
+    rules, symbol: str, side: str, quantity: float, ref_price: Optional[Decimal] = None
+) -> Dict[str, Any]:
+    """Validate and build the MARKET order params (shared by the sync and async paths).
+
+    The notional check uses `ref_price` (the locally cached price the order
+    would take) and is skipped when no fresh price is available.
+    """
+    if not rules:
         raise ValueError(f"symbol {symbol} not found in exchangeInfo")
 
     validate_side(side)
-    qty = validate_qty(si, quantity)
+    qty = rules.validate_qty(quantity)
+    if ref_price is not None:
+        rules.validate_notional(ref_price, qty)
 
-    # For MARKET orders, notional check is best-effort (requires current price). Skipped here.
-    params = {
+    return {
         "symbol": symbol,
         "side": side,
         "type": "MARKET",
         "quantity": str(qty),
     }
-    return client.place_order(params)
\ No newline at end of file
+
+
+def place_market_order(client, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
+    """Place a MARKET order on USDT-M Futures."""
+    sw = stopwatch("market", getattr(client, "metrics", None))
+    rules = client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = market_order_params(rules, symbol, side, quantity, reference_price(client, symbol, side))
+    sw.lap("validation")
+    res = client.place_order(params)
+    sw.lap("submit")
+    return res
+
+
+async def place_market_order_async(client, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
+    """Place a MARKET order through an `AsyncBinanceFuturesClient`."""
+    sw = stopwatch("market", getattr(client, "metrics", None))
+    rules = await client.symbol_rules(symbol)
+    sw.lap("exchange_info")
+    params = market_order_params(rules, symbol, side, quantity, reference_price(client, symbol, side))
+    sw.lap("validation")
+    res = await client.place_order(params)
+    sw.lap("submit")
+    return res
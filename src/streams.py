@@ -0,0 +1,185 @@
+import asyncio
+import inspect
+import json
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import aiohttp
+
+
+TESTNET_STREAM_URL = "wss://stream.binancefuture.com"
+REALNET_STREAM_URL = "wss://fstream.binance.com"
+
+Handler = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+
+def default_stream_url(base_url: str) -> str:
+    return REALNET_STREAM_URL if "fapi.binance.com" in base_url else TESTNET_STREAM_URL
+
+
+class UserDataStream:
+    """
+    Futures user data stream for an `AsyncBinanceFuturesClient`.
+
+    Creates a listenKey, keeps it alive, reconnects on drops or
+    `listenKeyExpired`, and hands every decoded event (ORDER_TRADE_UPDATE,
+    ACCOUNT_UPDATE, ...) to the registered handlers in arrival order.
+    `stream_url` may point at a local WebSocket server for testing.
+    """
+
+    def __init__(
+        self,
+        client,
+        stream_url: Optional[str] = None,
+        keepalive_sec: float = 30 * 60,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        self.client = client
+        self.stream_url = (stream_url or default_stream_url(client.base_url)).rstrip("/")
+        self.keepalive_sec = keepalive_sec
+        self.reconnect_delay = reconnect_delay
+        self.connected = asyncio.Event()
+        self._handlers: List[Handler] = []
+        self._stopped = False
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+
+    def add_handler(self, handler: Handler) -> None:
+        """Register a sync or async callable taking one event dict."""
+        self._handlers.append(handler)
+
+    async def run(self) -> None:
+        """Consume events until `stop()`; reconnects with a fresh listenKey after failures."""
+        while not self._stopped:
+            keepalive: Optional[asyncio.Task] = None
+            try:
+                resp = await self.client.new_listen_key()
+                key = resp.get("listenKey") if isinstance(resp, dict) else None
+                if not key:
+                    raise RuntimeError(f"listenKey request failed: {resp}")
+                keepalive = asyncio.create_task(self._keepalive())
+                async with self.client.session.ws_connect(f"{self.stream_url}/ws/{key}", heartbeat=60) as ws:
+                    self._ws = ws
+                    self.connected.set()
+                    async for msg in ws:
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            break
+                        event = json.loads(msg.data)
+                        await self._dispatch(event)
+                        if event.get("e") == "listenKeyExpired":
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.client.logger.error("user data stream error", extra={"event": "stream_error", "error": str(e)})
+            finally:
+                self.connected.clear()
+                self._ws = None
+                if keepalive is not None:
+                    keepalive.cancel()
+            if not self._stopped:
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def _keepalive(self) -> None:
+        while True:
+            await asyncio.sleep(self.keepalive_sec)
+            await self.client.keepalive_listen_key()
+
+    async def _dispatch(self, event: Dict[str, Any]) -> None:
+        for handler in self._handlers:
+            try:
+                res = handler(event)
+                if inspect.isawaitable(res):
+                    await res
+            except Exception as e:
+                # One faulty handler must not stop the stream for the others
+                self.client.logger.error("stream handler error", extra={"event": "stream_error", "error": str(e)})
+
+
+class MarketDataStream:
+    """
+    Public bookTicker + markPrice streams for `symbols`, applied to a
+    `MarketDataCache` (combined stream, one connection for all symbols).
+
+    Reconnects after drops; while disconnected the cache simply goes stale
+    and MARKET notional checks are skipped rather than run on old prices.
+    `stream_url` may point at a local WebSocket server for testing.
+    Handlers added with `add_handler` see every message after the cache.
+    """
+
+    def __init__(
+        self,
+        cache,
+        symbols: List[str],
+        stream_url: str = TESTNET_STREAM_URL,
+        session: Optional[aiohttp.ClientSession] = None,
+        reconnect_delay: float = 1.0,
+        logger=None,
+    ) -> None:
+        self.cache = cache
+        self.symbols = [s.upper() for s in symbols]
+        self.stream_url = stream_url.rstrip("/")
+        self.reconnect_delay = reconnect_delay
+        self.logger = logger or logging.getLogger(__name__)
+        self.connected = asyncio.Event()
+        self._session = session
+        self._stopped = False
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._handlers: List[Callable[[Dict[str, Any]], None]] = []
+
+    def add_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a sync callable taking one message; it runs on the stream's loop, so keep it fast."""
+        self._handlers.append(handler)
+
+    @property
+    def url(self) -> str:
+        streams = "/".join(f"{s.lower()}@bookTicker/{s.lower()}@markPrice@1s" for s in self.symbols)
+        return f"{self.stream_url}/stream?streams={streams}"
+
+    async def run(self) -> None:
+        own = self._session is None
+        session = self._session or aiohttp.ClientSession()
+        try:
+            while not self._stopped:
+                try:
+                    async with session.ws_connect(self.url, heartbeat=60) as ws:
+                        self._ws = ws
+                        self.connected.set()
+                        async for msg in ws:
+                            if msg.type != aiohttp.WSMsgType.TEXT:
+                                break
+                            event = json.loads(msg.data)
+                            self.cache.handle_event(event)
+                            for handler in self._handlers:
+                                try:
+                                    handler(event)
+                                except Exception as e:
+                                    self.logger.error("market data handler error", extra={"event": "stream_error", "error": str(e)})
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.logger.error("market data stream error", extra={"event": "stream_error", "error": str(e)})
+                finally:
+                    self.connected.clear()
+                    self._ws = None
+                if not self._stopped:
+                    await asyncio.sleep(self.reconnect_delay)
+        finally:
+            if own:
+                await session.close()
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._ws is not None:
+            await self._ws.close()
+
+    def start_in_thread(self) -> threading.Thread:
+        """Run on a private event loop in a daemon thread (for sync clients)."""
+        thread = threading.Thread(target=lambda: asyncio.run(self.run()), name="market-data", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,380 @@
+"""
+Benchmark suite for the order path.
+
+Every benchmark uses a fixed workload and seed so runs are comparable; the
+best of several repeats is reported. Results can be written as JSON and
+compared against an earlier run:
+
+    python -m src.tools.benchmark                          # all, print table
+    python -m src.tools.benchmark --only signing,logging   # subset
+    python -m src.tools.benchmark --quick -o bench.json    # smaller workloads
+    python -m src.tools.benchmark -o new.json --compare base.json --threshold 0.10
+
+Metric names carry their direction: `*_per_sec` is higher-is-better,
+`*_us` / `*_ms` lower-is-better; anything else is informational.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.common.validation import SymbolRules, validate_notional, validate_price, validate_qty
+
+
+# Filters as returned by testnet exchangeInfo for BTCUSDT
+SAMPLE_SYMBOL_INFO: Dict[str, Any] = {
+    "symbol": "BTCUSDT",
+    "filters": [
+        {"filterType": "PRICE_FILTER", "minPrice": "261.10", "maxPrice": "809484", "tickSize": "0.10"},
+        {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+        {"filterType": "MARKET_LOT_SIZE", "minQty": "0.001", "maxQty": "120", "stepSize": "0.001"},
+        {"filterType": "MAX_NUM_ORDERS", "limit": 200},
+        {"filterType": "MAX_NUM_ALGO_ORDERS", "limit": 10},
+        {"filterType": "MIN_NOTIONAL", "notional": "100"},
+        {"filterType": "PERCENT_PRICE", "multiplierUp": "1.0500", "multiplierDown": "0.9500", "multiplierDecimal": "4"},
+    ],
+}
+
+SAMPLE_ORDER = {"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "timeInForce": "GTC", "quantity": "0.002", "price": "60000.10"}
+
+
+def sample_orders(n: int, seed: int = 7) -> List[Dict[str, float]]:
+    rng = random.Random(seed)
+    return [
+        {"price": round(rng.uniform(60000, 120000), rng.randint(0, 4)), "quantity": round(rng.uniform(0.001, 2), rng.randint(3, 6))}
+        for _ in range(n)
+    ]
+
+
+def _per_call_us(fn: Callable[[], None], n: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) / n * 1e6
+
+
+def _quiet_bot_logger(log_dir: str) -> None:
+    # Clients log through the "bot" logger; configure it first so benchmark
+    # output is not flooded with one stdout line per request
+    from src.common.logger import get_logger
+
+    get_logger("bot", os.path.join(log_dir, "bot.log"), stdout=False)
+
+
+def bench_validation(n: int = 2000, repeat: int = 5) -> Dict[str, float]:
+    """Per-order cost of qty + price + notional validation: dict filters vs SymbolRules."""
+    si = SAMPLE_SYMBOL_INFO
+    orders = sample_orders(n)
+
+    def dict_path() -> None:
+        for o in orders:
+            q = validate_qty(si, o["quantity"])
+            p = validate_price(si, o["price"])
+            try:
+                validate_notional(si, p, q)
+            except ValueError:
+                pass
+
+    def rules_path() -> None:
+        rules = SymbolRules(si)
+        for o in orders:
+            q = rules.validate_qty(o["quantity"])
+            p = rules.validate_price(o["price"])
+            try:
+                rules.validate_notional(p, q)
+            except ValueError:
+                pass
+
+    # Both paths must agree before their timings mean anything
+    rules = SymbolRules(si)
+    for o in orders:
+        assert str(validate_qty(si, o["quantity"])) == str(rules.validate_qty(o["quantity"]))
+        assert str(validate_price(si, o["price"])) == str(rules.validate_price(o["price"]))
+
+    dict_us = _per_call_us(dict_path, n, repeat)
+    rules_us = _per_call_us(rules_path, n, repeat)
+    return {
+        "dict_us": dict_us,
+        "rules_us": rules_us,
+        "rules_orders_per_sec": 1e6 / rules_us,
+        "speedup": dict_us / rules_us,
+    }
+
+
+def bench_bulk_validation(n: int = 100_000, repeat: int = 5) -> Dict[str, float]:
+    """validate_bulk throughput on a LIMIT ladder (rows include rejects)."""
+    import numpy as np
+
+    from src.common.validation import validate_bulk
+
+    rules = SymbolRules(SAMPLE_SYMBOL_INFO)
+    orders = sample_orders(n, seed=11)
+    prices = np.array([o["price"] for o in orders])
+    quantities = np.array([o["quantity"] for o in orders])
+    best = min(timeit.repeat(lambda: validate_bulk(rules, prices, quantities), number=1, repeat=repeat))
+    return {"rows": n, "rows_per_sec": n / best, "batch_ms": best * 1000}
+
+
+def bench_signing(n: int = 20_000, repeat: int = 5) -> Dict[str, float]:
+    """HMAC-SHA256 request signing (`_sign`) and the full `_prepare` step (timestamp, sign, log enqueue)."""
+    from src.binance_client import BinanceFuturesClient
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _quiet_bot_logger(tmp)
+        client = BinanceFuturesClient("k" * 64, "s" * 64, log_file_path=os.path.join(tmp, "bot.log"))
+        params = dict(SAMPLE_ORDER, timestamp=1700000000000, recvWindow=5000)
+
+        def sign() -> None:
+            for _ in range(n):
+                client._sign(params)
+
+        def prepare() -> None:
+            for _ in range(n):
+                client._prepare("POST", "/v1/order", dict(SAMPLE_ORDER), True)
+
+        sign_us = _per_call_us(sign, n, repeat)
+        prepare_us = _per_call_us(prepare, n, repeat)
+        client.close()
+    return {"sign_us": sign_us, "signatures_per_sec": 1e6 / sign_us, "prepare_us": prepare_us}
+
+
+def _percentile_ms(samples: List[float], q: float) -> float:
+    s = sorted(samples)
+    return s[min(len(s) - 1, int(len(s) * q))] * 1000
+
+
+def bench_end_to_end(n: int = 500, threads: int = 8, concurrency: int = 32) -> Dict[str, float]:
+    """Orders/sec and latency against the local mock exchange (sync sequential, sync threaded, async)."""
+    from src.async_client import AsyncBinanceFuturesClient
+    from src.binance_client import BinanceFuturesClient
+    from src.common.rate_limit import RateLimitGovernor
+    from src.tools.mock_exchange import MockExchangeServer
+
+    huge = dict(weight_per_min=10**9, orders_per_10s=10**9, orders_per_min=10**9)
+    order = {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": "0.002"}
+    out: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp, MockExchangeServer(**huge) as ex:
+        _quiet_bot_logger(tmp)
+        client = BinanceFuturesClient(
+            ex.api_key,
+            ex.api_secret,
+            base_url=ex.url,
+            log_file_path=os.path.join(tmp, "bot.log"),
+            pool_size=threads,
+            rate_limiter=RateLimitGovernor(**huge),
+        )
+        client.exchange_info()
+
+        latencies = []
+        t0 = time.perf_counter()
+        for _ in range(n):
+            t = time.perf_counter()
+            client.place_order(dict(order))
+            latencies.append(time.perf_counter() - t)
+        elapsed = time.perf_counter() - t0
+        out.update(
+            sync_orders_per_sec=n / elapsed,
+            sync_p50_ms=_percentile_ms(latencies, 0.5),
+            sync_p99_ms=_percentile_ms(latencies, 0.99),
+        )
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(lambda _: client.place_order(dict(order)), range(n)))
+        out["threaded_orders_per_sec"] = n / (time.perf_counter() - t0)
+        client.close()
+
+        async def run_async() -> float:
+            async with AsyncBinanceFuturesClient(
+                ex.api_key,
+                ex.api_secret,
+                base_url=ex.url,
+                log_file_path=os.path.join(tmp, "bot.log"),
+                pool_size=concurrency,
+                rate_limiter=RateLimitGovernor(**huge),
+            ) as ac:
+                await ac.exchange_info()
+                sem = asyncio.Semaphore(concurrency)
+
+                async def one() -> None:
+                    async with sem:
+                        await ac.place_order(dict(order))
+
+                t = time.perf_counter()
+                await asyncio.gather(*[one() for _ in range(n)])
+                return time.perf_counter() - t
+
+        out["async_orders_per_sec"] = n / asyncio.run(run_async())
+    return out
+
+
+def bench_logging(n: int = 20_000, repeat: int = 3) -> Dict[str, float]:
+    """JsonFormatter cost per record and caller-side cost of logging through the queued logger."""
+    from src.common.logger import JsonFormatter, get_logger
+
+    formatter = JsonFormatter()
+    record = logging.LogRecord("bench", logging.INFO, __file__, 0, "sending request", None, None)
+    record.event = "api_request"
+    record.data = {"method": "POST", "url": "https://testnet.binancefuture.com/fapi/v1/order", "params": SAMPLE_ORDER}
+
+    def fmt() -> None:
+        for _ in range(n):
+            formatter.format(record)
+
+    format_us = _per_call_us(fmt, n, repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = get_logger(f"bench-{os.getpid()}-{time.monotonic_ns()}", os.path.join(tmp, "bench.log"), stdout=False)
+        extra = {"event": "api_request", "data": record.data}
+
+        def log() -> None:
+            for _ in range(n):
+                logger.info("sending request", extra=extra)
+
+        enqueue_us = _per_call_us(log, n, repeat)
+        # Let the writer drain before the directory goes away
+        for h in logger.handlers:
+            h.flush()
+        time.sleep(0.2)
+    return {"format_us": format_us, "records_per_sec": 1e6 / format_us, "enqueue_us": enqueue_us}
+
+
+class _NullOrderClient:
+    def place_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "NEW"}
+
+
+def bench_twap_jitter(slices: int = 40, interval_sec: float = 0.025, jobs: int = 20) -> Dict[str, float]:
+    """Slice send lateness of TwapScheduler: one job alone, then `jobs` concurrent jobs."""
+    from src.advanced.twap_scheduler import TwapScheduler, jitter_summary
+
+    scheduler = TwapScheduler()
+    try:
+        # Warm-up: start the timer and worker threads outside the measurement
+        scheduler.submit(_NullOrderClient(), dict(SAMPLE_ORDER), 4, 0.001).wait()
+        single = scheduler.submit(_NullOrderClient(), dict(SAMPLE_ORDER), slices, interval_sec).wait()["timing"]
+        running = [scheduler.submit(_NullOrderClient(), dict(SAMPLE_ORDER), slices, interval_sec) for _ in range(jobs)]
+        for job in running:
+            job.wait()
+        many = jitter_summary([j for job in running for j in job.jitter])
+    finally:
+        scheduler.shutdown()
+    return {
+        "single_p50_ms": single["jitter_p50_ms"],
+        "single_p95_ms": single["jitter_p95_ms"],
+        "single_max_ms": single["jitter_max_ms"],
+        f"concurrent{jobs}_p50_ms": many["jitter_p50_ms"],
+        f"concurrent{jobs}_p95_ms": many["jitter_p95_ms"],
+        f"concurrent{jobs}_max_ms": many["jitter_max_ms"],
+    }
+
+
+# name -> (function, full-size kwargs, --quick kwargs)
+BENCHMARKS: Dict[str, Any] = {
+    "validation": (bench_validation, {}, {"n": 500, "repeat": 3}),
+    "bulk_validation": (bench_bulk_validation, {}, {"n": 20_000, "repeat": 3}),
+    "signing": (bench_signing, {}, {"n": 5000, "repeat": 3}),
+    "end_to_end": (bench_end_to_end, {}, {"n": 150}),
+    "logging": (bench_logging, {}, {"n": 5000, "repeat": 2}),
+    "twap_jitter": (bench_twap_jitter, {}, {"slices": 20, "jobs": 5}),
+}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names: List[str], quick: bool = False) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name in names:
+        fn, full, small = BENCHMARKS[name]
+        try:
+            results[name] = fn(**(small if quick else full))
+        except ImportError as e:
+            results[name] = {"skipped": str(e)}
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "quick": quick,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def _direction(metric: str) -> int:
+    """+1 if higher is better, -1 if lower is better, 0 if informational."""
+    if metric.endswith("_per_sec"):
+        return 1
+    if metric.endswith("_us") or metric.endswith("_ms"):
+        return -1
+    return 0
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a comparison table; return the metrics that regressed by more than `threshold`."""
+    regressions = []
+    print(f"\n{'metric':<42} {'base':>12} {'new':>12} {'change':>9}")
+    for name, metrics in new["results"].items():
+        for metric, value in metrics.items():
+            old = base.get("results", {}).get(name, {}).get(metric)
+            direction = _direction(metric)
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)) or not old or not direction:
+                continue
+            change = (value - old) / old
+            worse = -change * direction
+            flag = "  REGRESSION" if worse > threshold else ""
+            print(f"{name + '.' + metric:<42} {old:>12.3f} {value:>12.3f} {change:>+8.1%}{flag}")
+            if flag:
+                regressions.append(f"{name}.{metric}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Order-path benchmark suite")
+    parser.add_argument("--only", default=None, help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--quick", action="store_true", help="Smaller workloads (smoke runs, CI)")
+    parser.add_argument("-o", "--output", default=None, help="Write results as JSON to this path")
+    parser.add_argument("--compare", default=None, help="Earlier JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change counted as a regression")
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        raise SystemExit(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    report = run(names, args.quick)
+    for name, metrics in report["results"].items():
+        print(f"\n[{name}]")
+        for metric, value in metrics.items():
+            print(f"  {metric:<28} {value:.3f}" if isinstance(value, float) else f"  {metric:<28} {value}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)
+        regressions = compare(base, report, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Import-time regression check for the CLI entry point.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters, takes
+the best cumulative time of the target module over several runs and fails
+(exit status 1) if it exceeds the budget or if any module listed in
+FORBIDDEN was imported. Also times `python -m src.cli --help` end to end.
+tests/test_import_time.py runs the same check under pytest.
+
+    python -m src.tools.check_import_time [--budget-ms 50] [--runs 5]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+# Modules the CLI must not load before a subcommand needs them
+FORBIDDEN = ("requests", "urllib3", "aiohttp", "asyncio", "flask", "reportlab", "numpy")
+BUDGET_MS = 50.0
+
+
+def parse_importtime(stderr: str) -> Tuple[Dict[str, int], Set[str]]:
+    """Cumulative microseconds per module, plus the set of top-level packages imported."""
+    cumulative: Dict[str, int] = {}
+    packages: Set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line[len("import time:"):].split("|", 2)
+        name = name.strip()
+        try:
+            cumulative[name] = int(cum)
+        except ValueError:
+            continue  # header line
+        packages.add(name.split(".", 1)[0])
+    return cumulative, packages
+
+
+def measure_import(module: str, runs: int) -> Tuple[float, Set[str]]:
+    best = float("inf")
+    packages: Set[str] = set()
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cumulative, packages = parse_importtime(proc.stderr)
+        best = min(best, cumulative.get(module, 0) / 1000.0)
+    return best, packages
+
+
+def measure_wall(argv: List[str], runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, *argv], capture_output=True, check=False)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the CLI import-time budget")
+    parser.add_argument("--module", default="src.cli")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="Maximum cumulative import time of --module")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement (best is kept)")
+    args = parser.parse_args()
+
+    import_ms, packages = measure_import(args.module, args.runs)
+    leaked = sorted(p for p in FORBIDDEN if p in packages)
+    interpreter_ms = measure_wall(["-c", "pass"], args.runs)
+    help_ms = measure_wall(["-m", "src.cli", "--help"], args.runs)
+
+    print(f"import {args.module}: {import_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"python -m src.cli --help: {help_ms:.1f} ms (bare interpreter {interpreter_ms:.1f} ms)")
+    failed = False
+    if import_ms > args.budget_ms:
+        print(f"FAIL: {args.module} import time over budget")
+        failed = True
+    if leaked:
+        print(f"FAIL: {args.module} imports {', '.join(leaked)} at startup")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
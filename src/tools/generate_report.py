@@ -1,37 +1,164 @@
+import argparse
+import os
+from typing import Any, Dict, List, Optional
+
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.shapes import Drawing
+from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
+from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.units import inch
+from reportlab.platypus import KeepTogether, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from src.tools.log_stats import BUCKETS, LogStats, analyze, rotated_files
+
+CHART_WIDTH = 6.5 * inch
+CHART_HEIGHT = 2.6 * inch
+MAX_BARS = 48  # most recent time buckets shown in the orders chart
+SERIES_COLORS = [colors.HexColor(c) for c in ("#4C72B0", "#DD8452", "#55A868", "#C44E52", "#8172B3", "#937860")]
+
+
+def _table(rows: List[List[Any]], col_widths: Optional[List[float]] = None) -> Table:
+    table = Table(rows, colWidths=col_widths, hAlign="LEFT", repeatRows=1)
+    table.setStyle(TableStyle([
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 9),
+        ("FONT", (0, 1), (-1, -1), "Helvetica", 8),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.black),
+        ("ALIGN", (1, 0), (-1, -1), "RIGHT"),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F2F2F2")]),
+    ]))
+    return table
+
+
+def _bar_chart(categories: List[str], series: List[List[float]], names: List[str], label_every: int = 1) -> Drawing:
+    drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+    chart = VerticalBarChart()
+    chart.x, chart.y = 40, 45
+    chart.width, chart.height = CHART_WIDTH - 60, CHART_HEIGHT - 70
+    chart.data = series
+    chart.categoryAxis.categoryNames = [c if i % label_every == 0 else "" for i, c in enumerate(categories)]
+    chart.categoryAxis.labels.angle = 30
+    chart.categoryAxis.labels.boxAnchor = "ne"
+    chart.categoryAxis.labels.fontName = "Helvetica"
+    chart.categoryAxis.labels.fontSize = 6
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.labels.fontName = "Helvetica"
+    chart.valueAxis.labels.fontSize = 7
+    chart.barSpacing = 0 if len(series) > 1 else 1
+    for i in range(len(series)):
+        chart.bars[i].fillColor = SERIES_COLORS[i % len(SERIES_COLORS)]
+        chart.bars[i].strokeColor = None
+    drawing.add(chart)
+    if len(series) > 1:
+        legend = Legend()
+        legend.x, legend.y = CHART_WIDTH - 10, CHART_HEIGHT - 5
+        legend.alignment = "right"
+        legend.columnMaximum = 1
+        legend.fontName = "Helvetica"
+        legend.fontSize = 7
+        legend.colorNamePairs = [(SERIES_COLORS[i % len(SERIES_COLORS)], n) for i, n in enumerate(names)]
+        legend.boxAnchor = "ne"
+        drawing.add(legend)
+    return drawing
+
+
+def _latency_section(stats: LogStats, styles) -> List[Any]:
+    rows = stats.latency_table()
+    if not rows:
+        return [Paragraph("No request latencies recorded (responses logged without elapsed_ms).", styles["Normal"])]
+    story: List[Any] = [_table(
+        [["Endpoint", "Requests", "Mean ms", "p50 ms", "p90 ms", "p99 ms", "Max ms"]]
+        + [[r["endpoint"], r["n"], f"{r['mean_ms']:.1f}", f"{r['p50_ms']:.1f}", f"{r['p90_ms']:.1f}", f"{r['p99_ms']:.1f}", f"{r['max_ms']:.1f}"] for r in rows]
+    )]
+    endpoints = [r for r in rows if r["endpoint"] != "all"][:8]
+    if endpoints:
+        story += [Spacer(1, 0.15 * inch), _bar_chart(
+            [r["endpoint"] for r in endpoints],
+            [[r["p50_ms"] for r in endpoints], [r["p99_ms"] for r in endpoints]],
+            ["p50 ms", "p99 ms"],
+        )]
+    return story
+
+
+def _error_section(stats: LogStats, styles) -> List[Any]:
+    rows = stats.error_table()
+    if not rows:
+        return [Paragraph("No API errors.", styles["Normal"])]
+    cell = styles["BodyText"].clone("cell", fontSize=8, leading=10)
+    body = []
+    for r in rows[:20]:
+        endpoints = ", ".join(f"{ep} ({n})" for ep, n in sorted(r["endpoints"].items(), key=lambda kv: -kv[1])[:3])
+        body.append([r["code"], r["count"], Paragraph(r["msg"][:120], cell), Paragraph(endpoints, cell)])
+    table = _table([["Code", "Count", "Message", "Endpoints"]] + body, [0.8 * inch, 0.6 * inch, 2.8 * inch, 2.4 * inch])
+    table.setStyle(TableStyle([("ALIGN", (2, 0), (-1, -1), "LEFT")]))
+    return [table]
+
 
+def _orders_section(stats: LogStats, styles) -> List[Any]:
+    if not stats.orders:
+        return [Paragraph("No orders submitted.", styles["Normal"])]
+    total = sum(stats.orders.values())
+    story: List[Any] = [_table(
+        [["Symbol", "Orders", "Share"]]
+        + [[s, n, f"{n / total:.1%}"] for s, n in stats.orders.most_common(15)]
+    )]
+    buckets = sorted(stats.orders_over_time)[-MAX_BARS:]
+    top = [s for s, _ in stats.orders.most_common(5)]
+    series = [[stats.orders_over_time[b].get(s, 0) for b in buckets] for s in top]
+    story += [Spacer(1, 0.15 * inch), KeepTogether([
+        Paragraph(f"Orders per {stats.bucket} (top {len(top)} symbols, last {len(buckets)} buckets)", styles["Normal"]),
+        _bar_chart(buckets, series, top, label_every=max(1, len(buckets) // 12)),
+    ])]
+    return story
 
-def generate_report(path: str = "report.pdf"):
-    c = canvas.Canvas(path, pagesize=A4)
-    width, height = A4
 
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(1 * inch, height - 1 * inch, "PrimeTrade Bot Report")
+def generate_report(path: str = "report.pdf", log_path: str = "bot.log", bucket: str = "hour", processes: Optional[int] = None, stats: Optional[LogStats] = None) -> Dict[str, Any]:
+    """
+    Render request latency, error-code and order statistics of `log_path`
+    (and its rotations) into a PDF. Pass `stats` to reuse an earlier
+    `log_stats.analyze` result. Returns the statistics as a dict.
+    """
+    if stats is None:
+        files = rotated_files(log_path)
+        stats = analyze(files, bucket, processes or os.cpu_count() or 1)
+    styles = getSampleStyleSheet()
+    doc = SimpleDocTemplate(path, pagesize=A4, leftMargin=0.8 * inch, rightMargin=0.8 * inch, topMargin=0.8 * inch, bottomMargin=0.8 * inch, title="PrimeTrade Bot Report")
 
-    c.setFont("Helvetica", 12)
-    lines = [
-        "This report summarizes the CLI Binance USDT-M Futures bot.",
-        "",
-        "Contents:",
-        "- Screenshots of successful MARKET and LIMIT orders (add later).",
-        "- Log excerpts showing requests and responses.",
-        "- Validation strategy using exchangeInfo filters.",
-        "- TWAP demonstration and parameters.",
-        "- Future work: Grid and OCO order strategies.",
-        "",
-        "Refer to README.md for setup, usage, and design notes.",
-    ]
+    story: List[Any] = [Paragraph("PrimeTrade Bot Report", styles["Title"])]
+    if not stats.lines:
+        story.append(Paragraph(f"No log records found for {log_path}.", styles["Normal"]))
+    else:
+        story += [
+            Paragraph(
+                f"{stats.lines:,} log records from {stats.first_time} to {stats.last_time}: "
+                f"{stats.events.get('api_request', 0):,} requests, {stats.events.get('api_response', 0):,} responses, "
+                f"{stats.events.get('api_error', 0):,} errors "
+                f"({stats.unmatched_requests:,} requests and {stats.unmatched_responses:,} responses unpaired).",
+                styles["Normal"],
+            ),
+            Paragraph("Request latency", styles["Heading2"]),
+            *_latency_section(stats, styles),
+            Paragraph("Errors by code", styles["Heading2"]),
+            *_error_section(stats, styles),
+            Paragraph("Orders by symbol", styles["Heading2"]),
+            *_orders_section(stats, styles),
+        ]
+    doc.build(story)
+    return stats.to_dict()
 
-    y = height - 1.4 * inch
-    for line in lines:
-        c.drawString(1 * inch, y, line)
-        y -= 0.25 * inch
 
-    c.showPage()
-    c.save()
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PDF report of bot.log statistics")
+    parser.add_argument("-o", "--output", default="report.pdf")
+    parser.add_argument("--log", default="bot.log", help="Log file; rotated siblings are included")
+    parser.add_argument("--bucket", choices=list(BUCKETS), default="hour")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+    generate_report(args.output, args.log, args.bucket, args.processes)
+    print(f"wrote {args.output}")
 
 
 if __name__ == "__main__":
-    generate_report()
\ No newline at end of file
+    main()
@@ -0,0 +1,383 @@
+"""
+Single-pass analytics over the JSON-lines `bot.log`.
+
+Reads the log (and its rotated, optionally gzipped, siblings) as a stream,
+so memory stays bounded regardless of file size: latencies go into fixed-size
+histograms and only requests still waiting for their response are held.
+Requests are paired with responses by `request_id`; records written before
+request ids existed are paired in arrival order.
+
+    python -m src.tools.log_stats                        # bot.log + rotations
+    python -m src.tools.log_stats bot.log.1.gz --bucket minute
+    python -m src.tools.log_stats --processes 4 --json stats.json
+
+Each file is analysed in its own worker process when `--processes` > 1 and
+the partial results are merged, including pairs split across a rotation.
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.common.metrics import Histogram
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Length of the "time" prefix ("2024-01-02T03:04:05") that names each bucket
+BUCKETS = {"minute": 16, "hour": 13, "day": 10}
+
+ORDER_ENDPOINTS = ("POST /v1/order", "POST /v1/batchOrders")
+
+
+def _endpoint(data: Any) -> Optional[str]:
+    if not isinstance(data, dict) or "url" not in data:
+        return None  # truncated payload
+    url = data["url"]
+    i = url.find("/fapi/")
+    return f"{data.get('method', '?')} {url[i + 5:] if i >= 0 else url}"
+
+
+def _order_symbols(endpoint: str, params: Any) -> List[str]:
+    if not isinstance(params, dict):
+        return []
+    if endpoint == "POST /v1/order":
+        return [params["symbol"]] if "symbol" in params else []
+    try:
+        return [o.get("symbol", "?") for o in json.loads(params.get("batchOrders", "[]"))]
+    except (TypeError, ValueError):
+        return []
+
+
+def _error_code(data: Any) -> Tuple[str, str]:
+    """(code, message) of an error payload; HTTP status when the body was not JSON."""
+    if isinstance(data, dict):
+        if "code" in data:
+            return str(data["code"]), str(data.get("msg", ""))
+        if "status_code" in data:
+            return f"HTTP {data['status_code']}", str(data.get("text", ""))[:200]
+        if data.get("truncated"):
+            return "truncated", ""
+    return "unknown", ""
+
+
+class LogStats:
+    """
+    Accumulated statistics of one or more log files; see `feed` and `merge`.
+
+    `max_pending` bounds the requests held while waiting for their response
+    (the oldest are counted as unmatched beyond it), and likewise responses
+    whose request has not been seen, which `merge` may still pair with a
+    request from the previous rotated file.
+    """
+
+    def __init__(self, bucket: str = "hour", max_pending: int = 100_000) -> None:
+        if bucket not in BUCKETS:
+            raise ValueError(f"bucket must be one of {', '.join(BUCKETS)}")
+        self.bucket = bucket
+        self.max_pending = max_pending
+        self.lines = 0
+        self.bad_lines = 0
+        self.events: Counter = Counter()
+        self.latency: Dict[str, Histogram] = {}
+        self.errors: Counter = Counter()  # code -> count
+        self.error_messages: Dict[str, str] = {}  # code -> first message seen
+        self.endpoint_errors: Counter = Counter()  # (endpoint, code) -> count
+        self.orders: Counter = Counter()  # symbol -> count
+        self.orders_over_time: Dict[str, Counter] = {}  # bucket -> symbol -> count
+        self.first_time: Optional[str] = None
+        self.last_time: Optional[str] = None
+        self.unmatched_requests = 0
+        self.unmatched_responses = 0
+        # request_id -> endpoint; legacy (id-less) requests in arrival order
+        self._pending: Dict[str, str] = {}
+        self._legacy: Deque[str] = deque()
+        # Responses whose request has not been seen: request_id -> (elapsed_ms, error codes)
+        self._orphans: Dict[str, Tuple[Optional[float], Tuple[str, ...]]] = {}
+
+    # Feeding
+
+    def feed_line(self, line: bytes) -> None:
+        self.lines += 1
+        try:
+            record = _loads(line)
+        except ValueError:
+            self.bad_lines += 1
+            return
+        if isinstance(record, dict):
+            self.feed(record)
+        else:
+            self.bad_lines += 1
+
+    def feed(self, record: Dict[str, Any]) -> None:
+        event = record.get("event")
+        if event is None:
+            return
+        self.events[event] += 1
+        ts = record.get("time")
+        if ts:
+            if self.first_time is None or ts < self.first_time:
+                self.first_time = ts
+            if self.last_time is None or ts > self.last_time:
+                self.last_time = ts
+        if event == "api_request":
+            self._on_request(record, ts)
+        elif event == "api_response" or event == "api_error":
+            self._on_response(record, event == "api_error")
+
+    def _on_request(self, record: Dict[str, Any], ts: Optional[str]) -> None:
+        data = record.get("data")
+        endpoint = _endpoint(data) or "?"
+        rid = record.get("request_id")
+        if rid is None:
+            self._legacy.append(endpoint)
+            if len(self._legacy) > self.max_pending:
+                self._legacy.popleft()
+                self.unmatched_requests += 1
+        else:
+            orphan = self._orphans.pop(rid, None)
+            if orphan is not None:
+                self._pair(endpoint, *orphan)
+            else:
+                self._pending[rid] = endpoint
+                if len(self._pending) > self.max_pending:
+                    del self._pending[next(iter(self._pending))]
+                    self.unmatched_requests += 1
+        if endpoint in ORDER_ENDPOINTS:
+            symbols = _order_symbols(endpoint, data.get("params"))
+            if symbols:
+                self.orders.update(symbols)
+                key = ts[: BUCKETS[self.bucket]] if ts else "?"
+                per_bucket = self.orders_over_time.get(key)
+                if per_bucket is None:
+                    per_bucket = self.orders_over_time[key] = Counter()
+                per_bucket.update(symbols)
+
+    def _on_response(self, record: Dict[str, Any], failed: bool) -> None:
+        data = record.get("data")
+        elapsed = record.get("elapsed_ms")
+        codes: Tuple[str, ...] = ()
+        if failed:
+            codes = (self._count_error(data),)
+        elif isinstance(data, list):
+            # batchOrders: per-order failures inside a successful response
+            codes = tuple(self._count_error(item) for item in data if isinstance(item, dict) and "code" in item and "orderId" not in item)
+        if elapsed is not None:
+            self._histogram("all").record(elapsed / 1e3)
+        rid = record.get("request_id")
+        if rid is None:
+            if self._legacy:
+                self._pair(self._legacy.popleft(), elapsed, codes)
+            else:
+                self.unmatched_responses += 1
+            return
+        endpoint = self._pending.pop(rid, None)
+        if endpoint is not None:
+            self._pair(endpoint, elapsed, codes)
+        else:
+            self._orphans[rid] = (elapsed, codes)
+            if len(self._orphans) > self.max_pending:
+                del self._orphans[next(iter(self._orphans))]
+                self.unmatched_responses += 1
+
+    def _count_error(self, data: Any) -> str:
+        code, msg = _error_code(data)
+        self.errors[code] += 1
+        if code not in self.error_messages and msg:
+            self.error_messages[code] = msg
+        return code
+
+    def _pair(self, endpoint: str, elapsed: Optional[float], codes: Tuple[str, ...]) -> None:
+        # "all" was recorded when the response was read
+        if elapsed is not None:
+            self._histogram(endpoint).record(elapsed / 1e3)
+        for code in codes:
+            self.endpoint_errors[(endpoint, code)] += 1
+
+    def _histogram(self, key: str) -> Histogram:
+        h = self.latency.get(key)
+        if h is None:
+            h = self.latency[key] = Histogram()
+        return h
+
+    # Combining
+
+    def merge(self, other: "LogStats") -> None:
+        """Fold in the stats of another file (in any order)."""
+        self.lines += other.lines
+        self.bad_lines += other.bad_lines
+        self.events.update(other.events)
+        for key, h in other.latency.items():
+            self._histogram(key).merge(h)
+        self.errors.update(other.errors)
+        for code, msg in other.error_messages.items():
+            self.error_messages.setdefault(code, msg)
+        self.endpoint_errors.update(other.endpoint_errors)
+        self.orders.update(other.orders)
+        for key, counts in other.orders_over_time.items():
+            self.orders_over_time.setdefault(key, Counter()).update(counts)
+        for attr, pick in (("first_time", min), ("last_time", max)):
+            values = [v for v in (getattr(self, attr), getattr(other, attr)) if v]
+            setattr(self, attr, pick(values) if values else None)
+        self.unmatched_requests += other.unmatched_requests
+        self.unmatched_responses += other.unmatched_responses
+        self.unmatched_requests += len(other._legacy)  # id-less pairs cannot cross files
+        # Pairs split by a rotation: request at the end of one file, response at the start of the next
+        for rid, endpoint in other._pending.items():
+            orphan = self._orphans.pop(rid, None)
+            if orphan is not None:
+                self._pair(endpoint, *orphan)
+            else:
+                self._pending[rid] = endpoint
+        for rid, orphan in other._orphans.items():
+            endpoint = self._pending.pop(rid, None)
+            if endpoint is not None:
+                self._pair(endpoint, *orphan)
+            else:
+                self._orphans[rid] = orphan
+
+    def finish(self) -> "LogStats":
+        """Count whatever is still unpaired; call once after the last feed/merge."""
+        self.unmatched_requests += len(self._pending) + len(self._legacy)
+        self.unmatched_responses += len(self._orphans)
+        self._pending.clear()
+        self._legacy.clear()
+        self._orphans.clear()
+        return self
+
+    # Reporting
+
+    def latency_table(self) -> List[Dict[str, Any]]:
+        """Per-endpoint latency in ms, "all" first, then by request count."""
+        rows = []
+        for key, h in self.latency.items():
+            if not h.count:
+                continue
+            q = h.quantiles((0.5, 0.9, 0.99))
+            rows.append({
+                "endpoint": key,
+                "n": h.count,
+                "mean_ms": round(h.sum / h.count * 1e3, 3),
+                "p50_ms": round(q[0.5] * 1e3, 3),
+                "p90_ms": round(q[0.9] * 1e3, 3),
+                "p99_ms": round(q[0.99] * 1e3, 3),
+                "max_ms": round(h.max * 1e3, 3),
+            })
+        rows.sort(key=lambda r: (r["endpoint"] != "all", -r["n"]))
+        return rows
+
+    def error_table(self) -> List[Dict[str, Any]]:
+        rows = []
+        for code, count in self.errors.most_common():
+            endpoints = {ep: n for (ep, c), n in self.endpoint_errors.items() if c == code}
+            rows.append({"code": code, "count": count, "msg": self.error_messages.get(code, ""), "endpoints": endpoints})
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "lines": self.lines,
+            "bad_lines": self.bad_lines,
+            "first_time": self.first_time,
+            "last_time": self.last_time,
+            "events": dict(self.events),
+            "unmatched_requests": self.unmatched_requests,
+            "unmatched_responses": self.unmatched_responses,
+            "latency": self.latency_table(),
+            "errors": self.error_table(),
+            "orders_by_symbol": dict(self.orders.most_common()),
+            "bucket": self.bucket,
+            "orders_over_time": {k: dict(v) for k, v in sorted(self.orders_over_time.items())},
+        }
+
+
+def _open(path: str):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb", buffering=1 << 20)
+
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    with _open(path) as f:
+        for line in f:
+            if line.strip():
+                yield line
+
+
+def analyze_file(path: str, bucket: str = "hour", max_pending: int = 100_000) -> LogStats:
+    """Stats of one file, left unfinished so it can be merged with its neighbours."""
+    stats = LogStats(bucket, max_pending)
+    for line in iter_lines(path):
+        stats.feed_line(line)
+    return stats
+
+
+def rotated_files(path: str) -> List[str]:
+    """`path` and its rotations (`bot.log.1`, `bot.log.2.gz`, `bot.log.2024-01-02`, ...), oldest first."""
+    files = [p for p in glob.glob(glob.escape(path) + ".*") if os.path.isfile(p)]
+    if os.path.isfile(path):
+        files.append(path)
+    return sorted(files, key=os.path.getmtime)
+
+
+def analyze(paths: Iterable[str], bucket: str = "hour", processes: int = 1, max_pending: int = 100_000) -> LogStats:
+    """Analyse `paths` (one worker process per file when `processes` > 1) and merge the results."""
+    paths = list(paths)
+    total = LogStats(bucket, max_pending)
+    if processes > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(processes, len(paths))) as pool:
+            parts = list(pool.map(analyze_file, paths, [bucket] * len(paths), [max_pending] * len(paths)))
+    else:
+        parts = [analyze_file(p, bucket, max_pending) for p in paths]
+    for part in parts:
+        total.merge(part)
+    return total.finish()
+
+
+def format_stats(stats: LogStats) -> str:
+    out = [
+        f"Lines: {stats.lines} ({stats.bad_lines} unparseable), {stats.first_time or '-'} .. {stats.last_time or '-'}",
+        "Events: " + ", ".join(f"{k}={v}" for k, v in stats.events.most_common()),
+        f"Unmatched: {stats.unmatched_requests} requests, {stats.unmatched_responses} responses",
+        "",
+        f"{'Latency (ms)':<34}{'n':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}",
+    ]
+    for r in stats.latency_table():
+        out.append(f"{r['endpoint']:<34}{r['n']:>8}{r['p50_ms']:>10.2f}{r['p90_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['max_ms']:>10.2f}")
+    out += ["", f"{'Error code':<14}{'count':>8}  message"]
+    for r in stats.error_table():
+        out.append(f"{r['code']:<14}{r['count']:>8}  {r['msg'][:60]}")
+    out += ["", "Orders by symbol: " + (", ".join(f"{s}={n}" for s, n in stats.orders.most_common()) or "-")]
+    for key in sorted(stats.orders_over_time)[-24:]:
+        counts = stats.orders_over_time[key]
+        out.append(f"  {key:<17}{sum(counts.values()):>7}  " + ", ".join(f"{s}={n}" for s, n in counts.most_common(5)))
+    return "\n".join(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Latency, error and order statistics from bot.log")
+    parser.add_argument("paths", nargs="*", help="Log files (default: bot.log and its rotations)")
+    parser.add_argument("--log", default="bot.log", help="Base log path used when no paths are given")
+    parser.add_argument("--bucket", choices=list(BUCKETS), default="hour", help="Time bucket for orders over time")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Worker processes (one file each)")
+    parser.add_argument("--json", default=None, help="Also write the stats as JSON to this path")
+    args = parser.parse_args()
+
+    paths = args.paths or rotated_files(args.log)
+    if not paths:
+        raise SystemExit(f"no log files found for {args.log}")
+    stats = analyze(paths, args.bucket, args.processes)
+    print(format_stats(stats))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(stats.to_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
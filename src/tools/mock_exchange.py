@@ -0,0 +1,604 @@
+"""
+Local stand-in for the Binance USDT-M Futures REST API, for offline and
+load testing of the clients and strategies.
+
+Implements exchangeInfo, time, order (POST/GET/DELETE), batchOrders
+(POST/DELETE) and listenKey under /fapi/v1, with HMAC signature and
+recvWindow checks, request-weight/order-count headers and real 429s when a
+limit is exceeded. Orders are matched against a per-symbol mark price:
+MARKET orders fill at it, marketable LIMIT orders fill at their price, the
+rest rest on the book until `set_price` (or POST /mock/price) crosses them.
+As on Futures, order responses show the order as accepted (status NEW)
+unless newOrderRespType=RESULT is sent.
+Latency, jitter, stalls (tail latency), 5xx errors and spurious 429s can be
+injected.
+
+    python -m src.tools.mock_exchange --port 8080 --latency-ms 20 --jitter-ms 5
+    BINANCE_BASE_URL=http://127.0.0.1:8080 BINANCE_API_KEY=mock-key BINANCE_API_SECRET=mock-secret \
+        python -m src.cli --no-daemon market ...
+
+    with MockExchangeServer(latency_ms=5) as ex:
+        client = BinanceFuturesClient(ex.api_key, ex.api_secret, base_url=ex.url)
+"""
+
+import argparse
+import hashlib
+import hmac
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from decimal import Decimal, InvalidOperation
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from src.common.rate_limit import ENDPOINT_WEIGHTS
+
+# symbol -> (tickSize, stepSize, minQty, maxQty, minNotional, initial mark price)
+DEFAULT_SYMBOLS: Dict[str, Tuple[str, str, str, str, str, str]] = {
+    "BTCUSDT": ("0.10", "0.001", "0.001", "1000", "100", "60000"),
+    "ETHUSDT": ("0.01", "0.001", "0.001", "10000", "20", "3000"),
+    "SOLUSDT": ("0.0100", "1", "1", "1000000", "5", "150"),
+}
+
+_SIGNATURE_RE = re.compile(r"&?signature=[^&]*")
+
+Response = Tuple[int, Any, Dict[str, str]]
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, code: int, msg: str) -> None:
+        super().__init__(msg)
+        self.status = status
+        self.code = code
+        self.msg = msg
+
+
+def _symbol_info(symbol: str, spec: Tuple[str, str, str, str, str, str]) -> Dict[str, Any]:
+    tick, step, min_qty, max_qty, min_notional, _ = spec
+    return {
+        "symbol": symbol,
+        "status": "TRADING",
+        "contractType": "PERPETUAL",
+        "baseAsset": symbol[:-4],
+        "quoteAsset": "USDT",
+        "pricePrecision": max(0, -Decimal(tick).normalize().as_tuple().exponent),
+        "quantityPrecision": max(0, -Decimal(step).normalize().as_tuple().exponent),
+        "filters": [
+            {"filterType": "PRICE_FILTER", "minPrice": tick, "maxPrice": "4529764", "tickSize": tick},
+            {"filterType": "LOT_SIZE", "minQty": min_qty, "maxQty": max_qty, "stepSize": step},
+            {"filterType": "MARKET_LOT_SIZE", "minQty": min_qty, "maxQty": max_qty, "stepSize": step},
+            {"filterType": "MIN_NOTIONAL", "notional": min_notional},
+        ],
+        "orderTypes": ["LIMIT", "MARKET", "STOP", "STOP_MARKET", "TAKE_PROFIT", "TAKE_PROFIT_MARKET"],
+        "timeInForce": ["GTC", "IOC", "FOK", "GTX"],
+    }
+
+
+class _Window:
+    """Sliding-window counter (events in the last `span` seconds)."""
+
+    def __init__(self, span: float) -> None:
+        self.span = span
+        self.events: Deque[Tuple[float, int]] = deque()
+        self.total = 0
+
+    def used(self, now: float) -> int:
+        while self.events and now - self.events[0][0] >= self.span:
+            self.total -= self.events.popleft()[1]
+        return self.total
+
+    def add(self, now: float, n: int) -> None:
+        if n:
+            self.events.append((now, n))
+            self.total += n
+
+    def retry_after(self, now: float) -> int:
+        return max(1, int(self.span - (now - self.events[0][0])) + 1) if self.events else 1
+
+
+class MockExchange:
+    """
+    Exchange state and request handling, independent of the HTTP transport.
+
+    `handle` takes the raw request pieces and returns (status, JSON payload,
+    extra headers). All state is guarded by one lock; injected latency is
+    slept outside it so concurrent requests overlap like on a real server.
+    """
+
+    def __init__(
+        self,
+        api_key: str = "mock-key",
+        api_secret: str = "mock-secret",
+        symbols: Optional[Dict[str, Tuple[str, str, str, str, str, str]]] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        stall_rate: float = 0.0,
+        stall_ms: float = 0.0,
+        clock_offset_ms: int = 0,
+        weight_per_min: int = 2400,
+        orders_per_10s: int = 300,
+        orders_per_min: int = 1200,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.api_key = api_key
+        self.api_secret = api_secret.encode()
+        specs = symbols or DEFAULT_SYMBOLS
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.stall_rate = stall_rate
+        self.stall_ms = stall_ms
+        self.clock_offset_ms = clock_offset_ms
+        self.limits = {"weight": weight_per_min, "orders_10s": orders_per_10s, "orders_1m": orders_per_min}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._weight = _Window(60.0)
+        self._orders_10s = _Window(10.0)
+        self._orders_1m = _Window(60.0)
+        self._order_ids = itertools.count(1)
+        self._exchange_info = {
+            "timezone": "UTC",
+            "rateLimits": [
+                {"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": weight_per_min},
+                {"rateLimitType": "ORDERS", "interval": "SECOND", "intervalNum": 10, "limit": orders_per_10s},
+                {"rateLimitType": "ORDERS", "interval": "MINUTE", "intervalNum": 1, "limit": orders_per_min},
+            ],
+            "symbols": [_symbol_info(s, spec) for s, spec in specs.items()],
+        }
+        self._specs = {s: tuple(Decimal(v) for v in spec) for s, spec in specs.items()}
+        self.marks: Dict[str, Decimal] = {s: spec[5] for s, spec in self._specs.items()}
+        self.orders: Dict[int, Dict[str, Any]] = {}
+        self._by_client_id: Dict[Tuple[str, str], int] = {}
+        self._resting: Dict[str, Dict[int, Dict[str, Any]]] = {s: {} for s in self._specs}
+        self.listen_keys: set = set()
+        self.stats = {"requests": 0, "orders": 0, "fills": 0, "injected_errors": 0, "injected_429": 0, "rejected_429": 0}
+
+    # -- request entry point -------------------------------------------------
+
+    def handle(self, method: str, path: str, query: str, body: str, headers: Any) -> Response:
+        delay = self.latency_ms + (self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0)
+        # A stalled request is held either before it is processed (lost in
+        # transit) or after (slow response), with equal odds
+        stall_before = stall_after = 0.0
+        if self.stall_rate and self._rng.random() < self.stall_rate:
+            if self._rng.random() < 0.5:
+                stall_before = self.stall_ms
+            else:
+                stall_after = self.stall_ms
+        if delay + stall_before > 0:
+            time.sleep((delay + stall_before) / 1000.0)
+        try:
+            with self._lock:
+                self.stats["requests"] += 1
+                response = self._handle(method, path, query, body, headers)
+        except _ApiError as e:
+            response = e.status, {"code": e.code, "msg": e.msg}, {}
+        if stall_after > 0:
+            time.sleep(stall_after / 1000.0)
+        return response
+
+    def _handle(self, method: str, path: str, query: str, body: str, headers: Any) -> Response:
+        if path == "/mock/price" and method == "POST":
+            params = dict(parse_qsl(query or body))
+            self._set_price(params["symbol"], Decimal(params["price"]))
+            return 200, {"symbol": params["symbol"], "markPrice": params["price"]}, {}
+        if not path.startswith("/fapi"):
+            raise _ApiError(404, -1000, f"unknown path {path}")
+        route = path[len("/fapi"):]
+
+        now = time.monotonic()
+        if self.throttle_rate and self._rng.random() < self.throttle_rate:
+            self.stats["injected_429"] += 1
+            return 429, {"code": -1003, "msg": "Too many requests (injected)."}, {"Retry-After": "1"}
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.stats["injected_errors"] += 1
+            return 503, {"code": -1001, "msg": "Internal error; unable to process your request (injected)."}, {}
+
+        weight, order_count = ENDPOINT_WEIGHTS.get((method, route), (1, 0))
+        over = [
+            (window, limit)
+            for window, add, limit in (
+                (self._weight, weight, self.limits["weight"]),
+                (self._orders_10s, order_count, self.limits["orders_10s"]),
+                (self._orders_1m, order_count, self.limits["orders_1m"]),
+            )
+            if add and window.used(now) + add > limit
+        ]
+        if over:
+            self.stats["rejected_429"] += 1
+            retry = max(w.retry_after(now) for w, _ in over)
+            return 429, {"code": -1003, "msg": "Too many requests."}, {**self._usage_headers(now), "Retry-After": str(retry)}
+        self._weight.add(now, weight)
+        self._orders_10s.add(now, order_count)
+        self._orders_1m.add(now, order_count)
+
+        try:
+            status, payload = self._route(method, route, query, body, headers)
+        except _ApiError as e:
+            status, payload = e.status, {"code": e.code, "msg": e.msg}
+        return status, payload, self._usage_headers(now)
+
+    def _usage_headers(self, now: float) -> Dict[str, str]:
+        return {
+            "X-MBX-USED-WEIGHT-1M": str(self._weight.used(now)),
+            "X-MBX-ORDER-COUNT-10S": str(self._orders_10s.used(now)),
+            "X-MBX-ORDER-COUNT-1M": str(self._orders_1m.used(now)),
+        }
+
+    def _route(self, method: str, route: str, query: str, body: str, headers: Any) -> Tuple[int, Any]:
+        if route == "/v1/time" and method == "GET":
+            return 200, {"serverTime": self._now_ms()}
+        if route == "/v1/exchangeInfo" and method == "GET":
+            return 200, self._exchange_info
+        if route == "/v1/listenKey":
+            self._check_key(headers)
+            if method == "POST":
+                key = f"mock-listen-key-{len(self.listen_keys) + 1}"
+                self.listen_keys.add(key)
+                return 200, {"listenKey": key}
+            return 200, {}
+        handler = {
+            ("POST", "/v1/order"): self._new_order,
+            ("GET", "/v1/order"): self._query_order,
+            ("DELETE", "/v1/order"): self._cancel_order,
+            ("POST", "/v1/batchOrders"): self._batch_new,
+            ("DELETE", "/v1/batchOrders"): self._batch_cancel,
+        }.get((method, route))
+        if handler is None:
+            raise _ApiError(404, -1000, f"unknown endpoint {method} {route}")
+        return 200, handler(self._signed_params(query, body, headers))
+
+    # -- auth ----------------------------------------------------------------
+
+    def _now_ms(self) -> int:
+        return int(time.time() * 1000) + self.clock_offset_ms
+
+    def _check_key(self, headers: Any) -> None:
+        if headers.get("X-MBX-APIKEY") != self.api_key:
+            raise _ApiError(401, -2015, "Invalid API-key, IP, or permissions for action.")
+
+    def _signed_params(self, query: str, body: str, headers: Any) -> Dict[str, str]:
+        self._check_key(headers)
+        # Binance signs the query string followed directly by the body
+        total = query + body
+        params = dict(parse_qsl(query, keep_blank_values=True))
+        params.update(parse_qsl(body, keep_blank_values=True))
+        signature = params.pop("signature", None)
+        if signature is None:
+            raise _ApiError(400, -1102, "Mandatory parameter 'signature' was not sent, was empty/null, or malformed.")
+        expected = hmac.new(self.api_secret, _SIGNATURE_RE.sub("", total).encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, signature):
+            raise _ApiError(400, -1022, "Signature for this request is not valid.")
+        try:
+            ts = int(params["timestamp"])
+            recv_window = int(params.get("recvWindow", 5000))
+        except (KeyError, ValueError):
+            raise _ApiError(400, -1102, "Mandatory parameter 'timestamp' was not sent, was empty/null, or malformed.")
+        now = self._now_ms()
+        if ts >= now + 1000 or now - ts > recv_window:
+            raise _ApiError(400, -1021, "Timestamp for this request is outside of the recvWindow.")
+        return params
+
+    # -- orders --------------------------------------------------------------
+
+    def _new_order(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        symbol = p.get("symbol")
+        if symbol not in self._specs:
+            raise _ApiError(400, -1121, "Invalid symbol.")
+        tick, step, min_qty, max_qty, min_notional, _ = self._specs[symbol]
+        side, order_type = p.get("side"), p.get("type")
+        if side not in ("BUY", "SELL"):
+            raise _ApiError(400, -1117, "Invalid side.")
+        if order_type not in ("MARKET", "LIMIT", "STOP"):
+            raise _ApiError(400, -1116, "Invalid orderType.")
+        resp_type = p.get("newOrderRespType", "ACK")
+        if resp_type not in ("ACK", "RESULT"):
+            raise _ApiError(400, -1130, "Data sent for parameter 'newOrderRespType' is not valid.")
+        qty = _decimal(p, "quantity")
+        if qty < min_qty or qty > max_qty:
+            raise _ApiError(400, -4005 if qty > max_qty else -4003, "Quantity out of range.")
+        if qty % step:
+            raise _ApiError(400, -1111, "Precision is over the maximum defined for this asset.")
+        price = stop_price = None
+        if order_type in ("LIMIT", "STOP"):
+            price = _decimal(p, "price")
+            if price % tick:
+                raise _ApiError(400, -4014, "Price not increased by tick size.")
+        if order_type == "STOP":
+            stop_price = _decimal(p, "stopPrice")
+            if stop_price % tick:
+                raise _ApiError(400, -4014, "Price not increased by tick size.")
+        mark = self.marks[symbol]
+        if min_notional and (price or mark) * qty < min_notional:
+            raise _ApiError(400, -4164, f"Order's notional must be no smaller than {min_notional} (unless you choose reduce only).")
+        client_id = p.get("newClientOrderId")
+        if client_id:
+            # Like Binance, an id is only taken while its order is still open
+            earlier = self.orders.get(self._by_client_id.get((symbol, client_id)))
+            if earlier is not None and earlier["status"] in ("NEW", "PARTIALLY_FILLED"):
+                raise _ApiError(400, -4116, "ClientOrderId is duplicated.")
+
+        order_id = next(self._order_ids)
+        client_id = client_id or f"mock-{order_id}"
+        tif = p.get("timeInForce", "GTC") if order_type != "MARKET" else "GTC"
+        order = {
+            "orderId": order_id,
+            "symbol": symbol,
+            "status": "NEW",
+            "clientOrderId": client_id,
+            "price": str(price or 0),
+            "avgPrice": "0",
+            "origQty": str(qty),
+            "executedQty": "0",
+            "cumQuote": "0",
+            "timeInForce": tif,
+            "type": order_type,
+            "reduceOnly": False,
+            "closePosition": False,
+            "side": side,
+            "positionSide": "BOTH",
+            "stopPrice": str(stop_price or 0),
+            "workingType": "CONTRACT_PRICE",
+            "priceProtect": False,
+            "origType": order_type,
+            "updateTime": self._now_ms(),
+        }
+        self.orders[order_id] = order
+        self._by_client_id[(symbol, client_id)] = order_id
+        self.stats["orders"] += 1
+        # Like Futures, the default ACK response is the order as accepted, before any fill
+        ack = dict(order)
+
+        if order_type == "MARKET":
+            self._fill(order, mark)
+        elif order_type == "LIMIT":
+            if _crosses(side, price, mark):
+                self._fill(order, price)
+            elif tif in ("IOC", "FOK"):
+                order["status"] = "EXPIRED"
+            else:
+                self._resting[symbol][order_id] = order
+        else:
+            self._resting[symbol][order_id] = order
+        return dict(order) if resp_type == "RESULT" else ack
+
+    def _fill(self, order: Dict[str, Any], price: Decimal) -> None:
+        qty = Decimal(order["origQty"])
+        order.update(
+            status="FILLED",
+            avgPrice=str(price),
+            executedQty=order["origQty"],
+            cumQuote=str(price * qty),
+            updateTime=self._now_ms(),
+        )
+        self.stats["fills"] += 1
+
+    def _find(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        symbol = p.get("symbol")
+        if symbol not in self._specs:
+            raise _ApiError(400, -1121, "Invalid symbol.")
+        order_id: Optional[int] = None
+        if p.get("orderId"):
+            order_id = int(p["orderId"])
+        elif p.get("origClientOrderId"):
+            order_id = self._by_client_id.get((symbol, p["origClientOrderId"]))
+        else:
+            raise _ApiError(400, -1102, "Either orderId or origClientOrderId must be sent.")
+        order = self.orders.get(order_id) if order_id is not None else None
+        if order is None or order["symbol"] != symbol:
+            raise _ApiError(400, -2013, "Order does not exist.")
+        return order
+
+    def _query_order(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(self._find(p))
+
+    def _cancel_order(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            order = self._find(p)
+        except _ApiError as e:
+            if e.code == -2013:
+                raise _ApiError(400, -2011, "Unknown order sent.")
+            raise
+        if order["status"] != "NEW":
+            raise _ApiError(400, -2011, "Unknown order sent.")
+        del self._resting[order["symbol"]][order["orderId"]]
+        order.update(status="CANCELED", updateTime=self._now_ms())
+        return dict(order)
+
+    def _batch_new(self, p: Dict[str, Any]) -> List[Dict[str, Any]]:
+        try:
+            orders = json.loads(p["batchOrders"])
+        except (KeyError, ValueError):
+            raise _ApiError(400, -1102, "Mandatory parameter 'batchOrders' was not sent, was empty/null, or malformed.")
+        if not 0 < len(orders) <= 5:
+            raise _ApiError(400, -1130, "Data sent for parameter 'batchOrders' is not valid.")
+        return [self._batch_item(self._new_order, {k: str(v) for k, v in o.items()}) for o in orders]
+
+    def _batch_cancel(self, p: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if p.get("orderIdList"):
+            key, ids = "orderId", json.loads(p["orderIdList"])
+        elif p.get("origClientOrderIdList"):
+            key, ids = "origClientOrderId", json.loads(p["origClientOrderIdList"])
+        else:
+            raise _ApiError(400, -1102, "Either orderIdList or origClientOrderIdList must be sent.")
+        if not 0 < len(ids) <= 10:
+            raise _ApiError(400, -1130, "Data sent for parameter 'orderIdList' is not valid.")
+        return [self._batch_item(self._cancel_order, {"symbol": p.get("symbol"), key: str(i)}) for i in ids]
+
+    @staticmethod
+    def _batch_item(fn, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return fn(params)
+        except _ApiError as e:
+            return {"code": e.code, "msg": e.msg}
+
+    # -- matching ------------------------------------------------------------
+
+    def set_price(self, symbol: str, price: float) -> None:
+        """Move the mark price; fills crossed LIMIT orders and triggers STOP orders."""
+        with self._lock:
+            self._set_price(symbol, Decimal(str(price)))
+
+    def _set_price(self, symbol: str, price: Decimal) -> None:
+        if symbol not in self.marks:
+            raise _ApiError(400, -1121, "Invalid symbol.")
+        self.marks[symbol] = price
+        resting = self._resting[symbol]
+        for order_id, order in list(resting.items()):
+            if order["type"] == "STOP":
+                stop = Decimal(order["stopPrice"])
+                triggered = price >= stop if order["side"] == "BUY" else price <= stop
+                if not triggered:
+                    continue
+                # Triggered: behaves as a resting LIMIT order from now on
+                order["type"] = "LIMIT"
+            if _crosses(order["side"], Decimal(order["price"]), price):
+                self._fill(order, Decimal(order["price"]))
+                del resting[order_id]
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            books = [self._resting[symbol]] if symbol else list(self._resting.values())
+            return [dict(o) for book in books for o in book.values()]
+
+
+def _decimal(p: Dict[str, Any], key: str) -> Decimal:
+    try:
+        value = Decimal(p[key])
+    except (KeyError, InvalidOperation):
+        raise _ApiError(400, -1102, f"Mandatory parameter '{key}' was not sent, was empty/null, or malformed.")
+    if not value.is_finite() or value <= 0:
+        raise _ApiError(400, -1102, f"Mandatory parameter '{key}' was not sent, was empty/null, or malformed.")
+    return value
+
+
+def _crosses(side: str, price: Decimal, mark: Decimal) -> bool:
+    return price >= mark if side == "BUY" else price <= mark
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    # Headers and body go out in separate writes; without TCP_NODELAY the body
+    # waits on the client's delayed ACK (~40 ms per request)
+    disable_nagle_algorithm = True
+
+    def _dispatch(self) -> None:
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode() if length else ""
+        status, payload, headers = self.server.exchange.handle(self.command, parts.path, parts.query, body, self.headers)
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The stock listen backlog of 5 drops bursts of concurrent connects, which
+    # then wait out a 1s SYN retransmit
+    request_queue_size = 128
+
+
+class MockExchangeServer:
+    """Runs a `MockExchange` on a background HTTP server thread; use as a context manager."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **kwargs: Any) -> None:
+        self.exchange = MockExchange(**kwargs)
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.exchange = self.exchange
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_key(self) -> str:
+        return self.exchange.api_key
+
+    @property
+    def api_secret(self) -> str:
+        return self.exchange.api_secret.decode()
+
+    def start(self) -> "MockExchangeServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-exchange", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockExchangeServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local mock of the Binance USDT-M Futures REST API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--api-key", default="mock-key")
+    parser.add_argument("--api-secret", default="mock-secret")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added to every request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter on top of --latency-ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Fraction of requests held for --stall-ms before or after processing")
+    parser.add_argument("--stall-ms", type=float, default=0.0)
+    parser.add_argument("--clock-offset-ms", type=int, default=0, help="Server clock skew versus local time")
+    parser.add_argument("--weight-per-min", type=int, default=2400)
+    parser.add_argument("--orders-per-10s", type=int, default=300)
+    parser.add_argument("--orders-per-min", type=int, default=1200)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = MockExchangeServer(
+        args.host,
+        args.port,
+        api_key=args.api_key,
+        api_secret=args.api_secret,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        stall_rate=args.stall_rate,
+        stall_ms=args.stall_ms,
+        clock_offset_ms=args.clock_offset_ms,
+        weight_per_min=args.weight_per_min,
+        orders_per_10s=args.orders_per_10s,
+        orders_per_min=args.orders_per_min,
+        seed=args.seed,
+    )
+    print(f"mock exchange on {server.url} (key={args.api_key})")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,25 @@
 import os
 import json
-from flask import Flask, request, redirect, url_for, render_template_string
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
-from src.binance_client import BinanceFuturesClient
-from src.market_orders import place_market_order
-from src.limit_orders import place_limit_order
-from src.advanced.oco import place_oco_order
+from flask import Flask, Response, request, redirect, url_for, render_template_string, jsonify
+
+from src.common.broadcast import Broadcaster
+from src.common.journal import OrderJournal
+from src.common.metrics import REGISTRY
+
+# The client (requests) and strategy modules are imported on first use so the
+# server starts without them
+
+MAX_JOBS = 500
+BASE_URL = os.environ.get("BINANCE_BASE_URL", "https://testnet.binancefuture.com")
+# Seconds between SSE comment lines that keep idle connections open
+SSE_KEEPALIVE_SEC = 15.0
 
 
 def load_env_from_file():
@@ -31,13 +45,160 @@ def load_env_from_file():
             break
 
 
+_client = None
+_client_lock = threading.Lock()
+
+
 def get_client():
-    api_key = os.environ.get("BINANCE_API_KEY")
-    api_secret = os.environ.get("BINANCE_API_SECRET")
-    if not api_key or not api_secret:
-        raise RuntimeError("BINANCE_API_KEY and BINANCE_API_SECRET are required")
-    base_url = "https://testnet.binancefuture.com"
-    return BinanceFuturesClient(api_key, api_secret, base_url=base_url, log_file_path="bot.log")
+    """App-wide client: one connection pool and exchangeInfo cache for every request."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from src.binance_client import BinanceFuturesClient
+
+                load_env_from_file()
+                api_key = os.environ.get("BINANCE_API_KEY")
+                api_secret = os.environ.get("BINANCE_API_SECRET")
+                if not api_key or not api_secret:
+                    raise RuntimeError("BINANCE_API_KEY and BINANCE_API_SECRET are required")
+                _client = BinanceFuturesClient(
+                    api_key,
+                    api_secret,
+                    base_url=BASE_URL,
+                    log_file_path="bot.log",
+                    exchange_info_refresh=True,
+                )
+    return _client
+
+
+# Orders run on a worker pool; job records (newest last) and the latest
+# finished result are kept in memory
+_executor = ThreadPoolExecutor(max_workers=int(os.environ.get("WEB_UI_WORKERS", "8")), thread_name_prefix="order")
+_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_jobs_lock = threading.Lock()
+_latest: Optional[Dict[str, Any]] = None
+journal = OrderJournal(os.environ.get("PRIMETRADE_JOURNAL", "orders.db"))
+# Live events for /events: order updates from the user data stream and job completions
+events = Broadcaster(maxsize=256)
+
+
+def _run_job(job: Dict[str, Any], command: str, args: Dict[str, Any]) -> None:
+    global _latest
+    from src.commands import run_command
+
+    job["status"] = "running"
+    try:
+        title, response = run_command(get_client(), command, args)
+        job.update(title=title, response=response, status="done")
+    except Exception as e:
+        job.update(error=f"{type(e).__name__}: {e}", status="error")
+    else:
+        try:
+            journal.record(title, response, command)
+        except Exception as e:
+            # The order went through; only the local history misses it
+            get_client().logger.warning("journal write failed", extra={"event": "journal_error", "error": str(e), "data": {"job": job["id"]}})
+    job["finished"] = time.time()
+    _latest = job
+    events.publish({"type": "job", "id": job["id"], "command": command, "status": job["status"]})
+
+
+def submit_job(command: str, args: Dict[str, Any]) -> str:
+    job_id = uuid.uuid4().hex
+    job: Dict[str, Any] = {"id": job_id, "command": command, "args": args, "status": "pending", "submitted": time.time()}
+    with _jobs_lock:
+        _jobs[job_id] = job
+        while len(_jobs) > MAX_JOBS:
+            _jobs.popitem(last=False)
+    _executor.submit(_run_job, job, command, args)
+    return job_id
+
+
+def publish_order_event(event: Dict[str, Any]) -> None:
+    """UserDataStream handler: forward ORDER_TRADE_UPDATE as a compact order-state event."""
+    if event.get("e") != "ORDER_TRADE_UPDATE":
+        return
+    o = event.get("o") or {}
+    events.publish(
+        {
+            "type": "order",
+            "time": event.get("E"),
+            "symbol": o.get("s"),
+            "clientOrderId": o.get("c"),
+            "orderId": o.get("i"),
+            "side": o.get("S"),
+            "orderType": o.get("o"),
+            "execution": o.get("x"),
+            "status": o.get("X"),
+            "filledQty": o.get("z"),
+            "avgPrice": o.get("ap"),
+        }
+    )
+
+
+_feed_thread: Optional[threading.Thread] = None
+_feed_lock = threading.Lock()
+_FEED_BACKOFF_MAX = 60.0
+
+
+async def _consume_user_stream(api_key: str, api_secret: str, stream_url: Optional[str]) -> None:
+    from src.async_client import AsyncBinanceFuturesClient
+    from src.streams import UserDataStream
+
+    async with AsyncBinanceFuturesClient(api_key, api_secret, base_url=BASE_URL, log_file_path="bot.log") as client:
+        stream = UserDataStream(client, stream_url=stream_url)
+        stream.add_handler(publish_order_event)
+        await stream.run()
+
+
+def _run_event_feed(api_key: str, api_secret: str, stream_url: Optional[str]) -> None:
+    # UserDataStream reconnects on its own; this covers whatever kills the consumer around it
+    import asyncio
+    import logging
+
+    delay = 1.0
+    while True:
+        started = time.monotonic()
+        try:
+            asyncio.run(_consume_user_stream(api_key, api_secret, stream_url))
+        except Exception as e:
+            logging.getLogger("bot").error("user data feed stopped", extra={"event": "stream_error", "error": f"{type(e).__name__}: {e}"})
+        # Back off only while it keeps failing straight away
+        if time.monotonic() - started > _FEED_BACKOFF_MAX:
+            delay = 1.0
+        time.sleep(delay)
+        delay = min(delay * 2, _FEED_BACKOFF_MAX)
+
+
+def start_event_feed() -> None:
+    """Start the single user data stream consumer (on its own event loop thread), or restart it if it died."""
+    global _feed_thread
+    if _feed_thread is not None and _feed_thread.is_alive():
+        return
+    with _feed_lock:
+        if _feed_thread is not None and _feed_thread.is_alive():
+            return
+        load_env_from_file()
+        api_key = os.environ.get("BINANCE_API_KEY")
+        api_secret = os.environ.get("BINANCE_API_SECRET")
+        if not api_key or not api_secret:
+            return
+        stream_url = os.environ.get("BINANCE_STREAM_URL")
+        _feed_thread = threading.Thread(
+            target=_run_event_feed,
+            args=(api_key, api_secret, stream_url),
+            name="user-data-stream",
+            daemon=True,
+        )
+        _feed_thread.start()
+
+
+def _accepted(job_id: str):
+    # JSON clients get the job id right away; browsers go back to the page, which polls it
+    if request.accept_mimetypes.best == "application/json":
+        return jsonify({"job_id": job_id, "status_url": url_for("job_status", job_id=job_id)}), 202
+    return redirect(url_for("index", job=job_id))
 
 
 app = Flask(__name__)
@@ -63,7 +224,7 @@ INDEX_HTML = """
 </head>
 <body>
   <h1>PrimeTrade Web UI</h1>
-  <p>Submit orders below. Results persist to <code>last_response.json</code>.</p>
+  <p>Submit orders below. Orders run in the background; the page updates when they finish.</p>
 
   <div class="grid">
     <!-- Market Order -->
@@ -130,6 +291,41 @@ INDEX_HTML = """
     <h3>Last Response</h3>
     <pre>{{ last_response }}</pre>
   </div>
+
+  <div class="section">
+    <h3>Live Order Updates</h3>
+    <pre id="live"></pre>
+  </div>
+
+  <div class="section">
+    <h3>Recent Jobs</h3>
+    <pre>{% for job in jobs %}{{ job.id[:8] }}  {{ job.command }}  {{ job.status }}
+{% endfor %}</pre>
+  </div>
+  <script>
+    // Order-state changes pushed from the shared user data stream
+    (function () {
+      const live = document.getElementById("live");
+      const source = new EventSource("{{ url_for('event_stream') }}");
+      source.addEventListener("order", (e) => {
+        const o = JSON.parse(e.data);
+        const line = [new Date(o.time).toLocaleTimeString(), o.symbol, o.side, o.orderType, o.status,
+                      "filled=" + o.filledQty, "avg=" + o.avgPrice, o.clientOrderId].join("  ");
+        live.textContent = (line + "\n" + live.textContent).split("\n").slice(0, 50).join("\n");
+      });
+    })();
+  </script>
+  {% if pending %}
+  <script>
+    // Reload once the submitted job has finished
+    (function poll() {
+      fetch("{{ url_for('job_status', job_id=pending) }}").then(r => r.json()).then(job => {
+        if (job.status === "pending" || job.status === "running") setTimeout(poll, 500);
+        else location.replace("{{ url_for('index') }}");
+      });
+    })();
+  </script>
+  {% endif %}
 </body>
 </html>
 """
@@ -137,65 +333,117 @@ INDEX_HTML = """
 
 @app.route("/")
 def index():
-    # Load last response for display
-    try:
-        with open("last_response.json", "r") as f:
-            lr = json.load(f)
-        last_response = json.dumps(lr, indent=2)
-    except Exception:
-        last_response = "{}"
-    return render_template_string(INDEX_HTML, last_response=last_response)
+    latest = _latest
+    if latest is None:
+        entry = journal.last_entry()
+        last_response = json.dumps({"title": entry["title"], "response": entry["response"]}, indent=2) if entry else "{}"
+    elif latest["status"] == "done":
+        last_response = json.dumps({"title": latest["title"], "response": latest["response"]}, indent=2, default=str)
+    else:
+        last_response = json.dumps({"command": latest["command"], "error": latest["error"]}, indent=2)
+    with _jobs_lock:
+        jobs = list(reversed(_jobs.values()))[:20]
+    pending = request.args.get("job")
+    return render_template_string(INDEX_HTML, last_response=last_response, jobs=jobs, pending=pending)
 
 
-def persist_response(title: str, response: dict):
-    try:
-        with open("last_response.json", "w") as f:
-            json.dump({"title": title, "response": response}, f, indent=2)
-    except Exception:
-        pass
+@app.route("/jobs/<job_id>")
+def job_status(job_id: str):
+    job = _jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "unknown job"}), 404
+    return jsonify(job)
+
+
+@app.route("/events")
+def event_stream():
+    """Server-sent events: `order` (user data stream) and `job` updates, plus `dropped` if this client fell behind."""
+    start_event_feed()
+    sub = events.subscribe()
+
+    def generate():
+        dropped = 0
+        try:
+            yield "retry: 2000\n\n"
+            while True:
+                # Whatever is buffered goes out in one write
+                batch = sub.get_batch(timeout=SSE_KEEPALIVE_SEC)
+                chunk = "".join(f"event: {e['type']}\ndata: {json.dumps(e)}\n\n" for e in batch)
+                if sub.dropped != dropped:
+                    chunk = f"event: dropped\ndata: {sub.dropped - dropped}\n\n" + chunk
+                    dropped = sub.dropped
+                yield chunk or ": keepalive\n\n"
+        finally:
+            events.unsubscribe(sub)
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/metrics")
+def metrics():
+    """Prometheus text exposition of the per-stage latency histograms."""
+    return Response(REGISTRY.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/history")
+def history():
+    """Journaled orders, newest first; filter by symbol/clientOrderId/orderId, page with `before`."""
+    def int_arg(name: str) -> Optional[int]:
+        value = request.args.get(name)
+        return int(value) if value else None
+
+    rows, cursor = journal.orders(
+        symbol=request.args.get("symbol") or None,
+        client_order_id=request.args.get("clientOrderId") or None,
+        order_id=int_arg("orderId"),
+        since_ms=int_arg("since"),
+        until_ms=int_arg("until"),
+        before_id=int_arg("before"),
+        limit=min(int_arg("limit") or 50, 500),
+    )
+    return jsonify({"orders": rows, "next_before": cursor})
 
 
 @app.route("/market", methods=["POST"])
 def market():
-    load_env_from_file()
-    client = get_client()
-    symbol = request.form.get("symbol", "BTCUSDT")
-    side = request.form.get("side", "BUY")
-    quantity = float(request.form.get("quantity", "0.001"))
-    res = place_market_order(client, symbol, side, quantity)
-    persist_response("Market Order Response", res)
-    return redirect(url_for("index"))
+    args = {
+        "symbol": request.form.get("symbol", "BTCUSDT"),
+        "side": request.form.get("side", "BUY"),
+        "quantity": float(request.form.get("quantity", "0.001")),
+    }
+    return _accepted(submit_job("market", args))
 
 
 @app.route("/limit", methods=["POST"])
 def limit():
-    load_env_from_file()
-    client = get_client()
-    symbol = request.form.get("symbol", "BTCUSDT")
-    side = request.form.get("side", "SELL")
-    quantity = float(request.form.get("quantity", "0.001"))
-    price = float(request.form.get("price", "110000"))
-    tif = request.form.get("tif", "GTC")
-    res = place_limit_order(client, symbol, side, quantity, price, time_in_force=tif)
-    persist_response("Limit Order Response", res)
-    return redirect(url_for("index"))
+    args = {
+        "symbol": request.form.get("symbol", "BTCUSDT"),
+        "side": request.form.get("side", "SELL"),
+        "quantity": float(request.form.get("quantity", "0.001")),
+        "price": float(request.form.get("price", "110000")),
+        "tif": request.form.get("tif", "GTC"),
+    }
+    return _accepted(submit_job("limit", args))
 
 
 @app.route("/oco", methods=["POST"])
 def oco():
-    load_env_from_file()
-    client = get_client()
-    symbol = request.form.get("symbol", "BTCUSDT")
-    side = request.form.get("side", "SELL")
-    quantity = float(request.form.get("quantity", "0.001"))
-    price = float(request.form.get("price", "110000"))
     stop_price = float(request.form.get("stop_price", "100000"))
-    stop_limit_price = float(request.form.get("stop_limit_price", stop_price))
-    res = place_oco_order(client, symbol, side, quantity, price, stop_price, stop_limit_price)
-    persist_response("OCO Order Response", res)
-    return redirect(url_for("index"))
+    args = {
+        "symbol": request.form.get("symbol", "BTCUSDT"),
+        "side": request.form.get("side", "SELL"),
+        "quantity": float(request.form.get("quantity", "0.001")),
+        "price": float(request.form.get("price", "110000")),
+        "stop_price": stop_price,
+        "stop_limit_price": float(request.form.get("stop_limit_price", stop_price)),
+    }
+    return _accepted(submit_job("oco", args))
 
 
 if __name__ == "__main__":
     load_env_from_file()
-    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", "5000")))
\ No newline at end of file
+    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", "5000")), threaded=True)
\ No newline at end of file
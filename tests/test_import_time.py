@@ -0,0 +1,14 @@
+import os
+
+from src.tools.check_import_time import BUDGET_MS, FORBIDDEN, measure_import
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_cli_import_stays_within_budget(monkeypatch):
+    # Fresh interpreters, started where `src` is importable; best of 5 like the script
+    monkeypatch.chdir(ROOT)
+    import_ms, packages = measure_import("src.cli", runs=5)
+    assert import_ms <= BUDGET_MS, f"import src.cli took {import_ms:.1f} ms (budget {BUDGET_MS:.0f} ms)"
+    leaked = sorted(p for p in FORBIDDEN if p in packages)
+    assert not leaked, f"import src.cli loads {', '.join(leaked)} at startup"
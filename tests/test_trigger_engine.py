@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+from src.advanced.trigger_engine import ABOVE, BELOW, TriggerEngine, read_ticks
+from src.common.validation import SymbolRules
+
+TICKS = os.path.join(os.path.dirname(__file__), "data", "mark_ticks.jsonl")
+
+
+def _rules(symbol, tick_size, min_notional):
+    return SymbolRules(
+        {
+            "symbol": symbol,
+            "filters": [
+                {"filterType": "PRICE_FILTER", "tickSize": tick_size, "minPrice": tick_size, "maxPrice": "1000000"},
+                {"filterType": "LOT_SIZE", "stepSize": "0.001", "minQty": "0.001", "maxQty": "1000"},
+                {"filterType": "MIN_NOTIONAL", "notional": min_notional},
+            ],
+        }
+    )
+
+
+BTC = _rules("BTCUSDT", "0.10", "100")
+ETH = _rules("ETHUSDT", "0.01", "20")
+
+
+@pytest.fixture
+def engine():
+    engine = TriggerEngine(None)
+    yield engine
+    engine.shutdown()
+
+
+def test_read_ticks_keeps_mark_prices_only():
+    ticks = list(read_ticks(TICKS))
+    assert ticks[:3] == [("BTCUSDT", "100000.00"), ("ETHUSDT", "3500.00"), ("BTCUSDT", "100500.00")]
+    # The aggTrade event and the blank line are skipped, the plain {"symbol", "price"} line is uppercased
+    assert len(ticks) == 11
+    assert ("ETHUSDT", "3390.00") in ticks
+
+
+def test_replay_fires_stops_in_order(engine):
+    names = {}
+
+    def stop(name, rules, symbol, side, stop_price, price=None):
+        trigger = engine.add_stop(rules, symbol, side, 0.01, stop_price, price)
+        names[trigger.trigger_id] = name
+        return trigger
+
+    stop("buy_101500", BTC, "btcusdt", "BUY", 101500)
+    stop("buy_100400", BTC, "BTCUSDT", "BUY", 100400, price=100450)
+    stop("buy_101200", BTC, "BTCUSDT", "BUY", 101200)
+    stop("buy_101000", BTC, "BTCUSDT", "BUY", 101000)
+    stop("buy_105000", BTC, "BTCUSDT", "BUY", 105000)
+    stop("sell_99600", BTC, "BTCUSDT", "SELL", 99600)
+    stop("sell_99800", BTC, "BTCUSDT", "SELL", 99800, price=99750)
+    stop("sell_99000", BTC, "BTCUSDT", "SELL", 99000)
+    stop("eth_sell_3400", ETH, "ETHUSDT", "SELL", 3400)
+    stop("eth_buy_3600", ETH, "ETHUSDT", "BUY", 3600)
+    cancelled = [stop("buy_100700", BTC, "BTCUSDT", "BUY", 100700), stop("sell_99700", BTC, "BTCUSDT", "SELL", 99700)]
+    for trigger in cancelled:
+        assert engine.cancel(trigger.trigger_id)
+
+    fired = engine.replay(read_ticks(TICKS))
+
+    # Per tick, the nearest trigger price goes first on each side
+    assert [names[t.trigger_id] for t in fired] == [
+        "buy_100400",
+        "buy_101000",
+        "buy_101200",
+        "buy_101500",
+        "eth_sell_3400",
+        "sell_99800",
+        "sell_99600",
+        "sell_99000",
+    ]
+    assert all(t.state == "fired" for t in fired)
+    assert [str(t.fired_price) for t in fired] == ["100500.00", "101000.00", "101600.00", "101600.00", "3390.00", "99500.00", "99500.00", "98900.00"]
+    assert {t.condition for t in fired if t.params["side"] == "BUY"} == {ABOVE}
+    assert {t.condition for t in fired if t.params["side"] == "SELL"} == {BELOW}
+    assert fired[0].params == {"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "timeInForce": "GTC", "quantity": "0.010", "price": "100450.00"}
+    assert fired[1].params["type"] == "MARKET"
+
+    assert all(t.state == "cancelled" for t in cancelled)
+    assert sorted(names[t.trigger_id] for t in engine.pending()) == ["buy_105000", "eth_buy_3600"]
+
+
+def test_stop_on_the_wrong_side_of_the_last_tick_is_rejected(engine):
+    engine.replay(read_ticks(TICKS))
+    with pytest.raises(ValueError):
+        engine.add_stop(BTC, "BTCUSDT", "BUY", 0.01, 100000)
+    with pytest.raises(ValueError):
+        engine.add_stop(BTC, "BTCUSDT", "SELL", 0.01, 100500)